@@ -3,6 +3,7 @@
 Acceso al Sistema
 =================
 """
+from datetime import datetime, timedelta
 from modulos import (
     Cliente,
     ClienteRegular,
@@ -23,7 +24,8 @@ from modulos.excepciones import (
     ArchivoNoEncontradoError,
     FormatoArchivoError
 )
-from modulos.archivos import leer_log
+from modulos.archivos import leer_log, nucleos_disponibles
+from modulos.ingesta import IngestorDirectorio
 
 """
 MENÚ
@@ -65,7 +67,11 @@ def mostrar_menu_archivos():
     print("  2. Importar clientes desde CSV")
     print("  3. Generar reporte TXT")
     print("  4. Ver log de actividad")
-    print("  5. Volver al menú principal")
+    print("  5. Simular importación (solo validar CSV)")
+    print("  6. Vigilar directorio de entrada (Ctrl+C para detener)")
+    print("  7. Ver estado del reporte en segundo plano")
+    print("  8. Extraer datos de facturación corporativa")
+    print("  9. Volver al menú principal")
     return input("  Opción: ").strip()
 
 
@@ -91,10 +97,26 @@ def mostrar_menu_listar():
     print("  2. Listar solo clientes Regular")
     print("  3. Listar solo clientes Premium")
     print("  4. Listar solo clientes Corporativo")
-    print("  5. Volver al menú principal")
+    print("  5. Listar clientes por ciudad")
+    print("  6. Volver al menú principal")
     return input("  Opción: ").strip()
 
 
+"""
+PROGRESO DE OPERACIONES DE ARCHIVOS
+"""
+def mostrar_progreso(avance):
+    """
+    Muestra en una sola linea el avance de una exportacion, importacion o reporte
+    (callback de progreso, ver MedidorProgreso).
+    """
+    print(f"\r  {avance['operacion'].capitalize()}: {avance['filas']:,} filas | "
+        f"{avance['bytes'] / (1024 * 1024):.1f} MB | {avance['segundos']:.1f} s | "
+        f"{avance['filas_por_segundo']:,.0f} filas/s", end="", flush=True)
+    if avance['terminado']:
+        print()
+
+
 """
 FUNCIONES DE SOLICITUD DE DATOS
 """
@@ -230,6 +252,16 @@ def listar_clientes(gestor):
     elif opcion == '4':
         gestor.listar_por_tipo("Corporativo")
     elif opcion == '5':
+        conteo = gestor.conteo_por_ciudad()
+        if conteo:
+            print("\n  Ciudades: " + ", ".join(f"{ciudad or '(sin ciudad)'} ({cantidad})"
+                                             for ciudad, cantidad in conteo.items()))
+        ciudad = input("  Ingrese la ciudad: ").strip()
+        if ciudad:
+            gestor.listar_por_ciudad(ciudad)
+        else:
+            print("\n[X] Debe ingresar una ciudad.")
+    elif opcion == '6':
         return
     else:
         print("\n[X] Opción no válida.")
@@ -412,12 +444,24 @@ def cargar_datos_prueba(gestor):
 
 def ver_estadisticas(gestor):
     """
-    Muestra las estadísticas de clientes por tipo.
+    Muestra las estadísticas de clientes por tipo y su evolución en los últimos 30 días.
     
     Args:
         gestor (GestorClientes): Instancia del gestor de clientes
     """
     gestor.mostrar_estadisticas()
+    
+    try:
+        registros = gestor.tendencia(desde=datetime.now() - timedelta(days=30))
+    except ArchivoError as e:
+        print(f"\n[X] {e}")
+        return
+    if registros:
+        primero, ultimo = registros[0], registros[-1]
+        print(f"\n  Últimos 30 días ({len(registros)} registros en el historial):")
+        for campo in (campo for campo in ultimo if campo != 'fecha'):
+            print(f"  {campo.capitalize():12} {primero[campo]:>8} -> {ultimo[campo]:>8} "
+                f"({ultimo[campo] - primero[campo]:+})")
 
 
 def ver_beneficios_cliente(gestor):
@@ -452,6 +496,24 @@ def ver_beneficios_cliente(gestor):
         print(f"\n[X] Error del sistema: {e}")
 
 
+def mostrar_estado_reporte(gestor):
+    """
+    Muestra si el ultimo reporte pedido en segundo plano sigue en curso, termino o fallo.
+
+    Args:
+        gestor (GestorClientes): Instancia del gestor de clientes
+    """
+    futuro = gestor.reporte_en_curso
+    if futuro is None:
+        print("\n[!] No se ha pedido ningun reporte en segundo plano.")
+    elif not futuro.done():
+        print("\n[...] El reporte se esta generando.")
+    elif futuro.exception() is not None:
+        print(f"\n[X] Error al generar reporte: {futuro.exception()}")
+    else:
+        print("\n[OK] Reporte generado exitosamente.")
+
+
 def gestionar_archivos(gestor):
     """
     Permite exportar, importar, generar reportes y ver logs.
@@ -464,7 +526,7 @@ def gestionar_archivos(gestor):
     if opcion == '1':
         # Exporta a CSV
         try:
-            gestor.exportar_csv()
+            gestor.exportar_csv(progreso=mostrar_progreso)
         except ArchivoError as e:
             print(f"\n[X] {e}")
         except Exception as e:
@@ -477,11 +539,11 @@ def gestionar_archivos(gestor):
         
         try:
             if usar_default == 's':
-                gestor.importar_csv()
+                gestor.importar_csv(progreso=mostrar_progreso)
             else:
                 archivo = input("  Ingrese la ruta del archivo CSV: ").strip()
                 if archivo:
-                    gestor.importar_csv(archivo)
+                    gestor.importar_csv(archivo, progreso=mostrar_progreso)
                 else:
                     print("\n[X] Debe ingresar una ruta de archivo.")
         except ArchivoNoEncontradoError as e:
@@ -495,8 +557,29 @@ def gestionar_archivos(gestor):
     
     elif opcion == '3':
         # Genera reporte TXT
+        print("\n--- Generar reporte ---")
+        print("  1. Completo (resumen y lista de clientes)")
+        print("  2. Solo resumen estadistico")
+        print("  3. Paginado (un archivo por pagina de clientes)")
+        print("  4. Analitico (puntos, empresas, dominios y ciudades)")
+        print("  5. Ranking Premium (top 100 por puntos)")
+        tipo_reporte = input("  Seleccione el tipo de reporte (1-5): ").strip()
+        if tipo_reporte == '4':
+            gestor.generar_reporte_analitico()
+            return
+        if tipo_reporte == '5':
+            gestor.generar_ranking_premium()
+            return
+        modos = {'1': "completo", '2': "resumen", '3': "paginado"}
+        modo = modos.get(tipo_reporte, "completo")
+        segundo_plano = input("  Generar en segundo plano? (s/n): ").strip().lower() == 's'
+        
         try:
-            gestor.generar_reporte_txt()
+            if segundo_plano:
+                gestor.generar_reporte_txt(modo=modo, en_segundo_plano=True)
+                print("\n[OK] Reporte en curso. Consulte su estado con la opcion 7 del menu de archivos.")
+            else:
+                gestor.generar_reporte_txt(progreso=mostrar_progreso, modo=modo, procesos=nucleos_disponibles())
         except ArchivoError as e:
             print(f"\n[X] {e}")
         except Exception as e:
@@ -511,6 +594,28 @@ def gestionar_archivos(gestor):
         print("=" * 60)
     
     elif opcion == '5':
+        # Valida un CSV sin importarlo
+        archivo = input("  Ingrese la ruta del archivo CSV (vacio = archivo por defecto): ").strip()
+        gestor.simular_importacion(archivo or None)
+    
+    elif opcion == '6':
+        # Importa automaticamente los CSV que lleguen a datos/entrada/ y los agrega a datos/clientes.csv
+        print("\n--- Vigilando datos/entrada/ (Ctrl+C para volver al menú) ---")
+        IngestorDirectorio(gestor).ejecutar()
+    
+    elif opcion == '7':
+        # Estado del ultimo reporte pedido en segundo plano
+        mostrar_estado_reporte(gestor)
+    
+    elif opcion == '8':
+        # Extrae los datos de facturacion agrupados por RUT
+        formato = input("  Formato (csv/jsonl) [csv]: ").strip().lower() or "csv"
+        if formato in ("csv", "jsonl"):
+            gestor.extraer_facturas(formato=formato)
+        else:
+            print("\n[X] Formato no valido.")
+    
+    elif opcion == '9':
         return
     
     else:
@@ -526,6 +631,8 @@ def main():
     Implementa menú interactivo y coordina las operaciones del sistema
     """
     gestor = GestorClientes()
+    # Guarda las estadisticas en datos/estadisticas.bin al exportar y como maximo una vez por hora
+    gestor.configurar_historial(intervalo=3600)
     
     mostrar_encabezado()
     
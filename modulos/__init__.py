@@ -7,9 +7,15 @@ from modulos.cliente_regular import ClienteRegular
 from modulos.cliente_premium import ClientePremium
 from modulos.cliente_corporativo import ClienteCorporativo
 from modulos.gestor_clientes import GestorClientes
+from modulos.ingesta import IngestorDirectorio
+from modulos.indice_csv import LectorIndexado
 from modulos.archivos import (
     exportar_clientes_csv,
     importar_clientes_csv,
+    anexar_clientes_csv,
+    exportar_clientes_jsonl,
+    importar_clientes_jsonl,
+    iterar_clientes_jsonl,
     generar_reporte,
     registrar_log,
     registrar_alta_cliente,
@@ -25,8 +31,14 @@ __all__ = [
     'ClientePremium',
     'ClienteCorporativo',
     'GestorClientes',
+    'IngestorDirectorio',
+    'LectorIndexado',
     'exportar_clientes_csv',
     'importar_clientes_csv',
+    'anexar_clientes_csv',
+    'exportar_clientes_jsonl',
+    'importar_clientes_jsonl',
+    'iterar_clientes_jsonl',
     'generar_reporte',
     'registrar_log',
     'registrar_alta_cliente',
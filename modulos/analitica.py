@@ -0,0 +1,441 @@
+"""
+================
+Módulo analitica
+================
+Reporte analitico de clientes calculado en una sola pasada:
+    - Histograma y percentiles de los puntos de los clientes Premium
+    - Empresas con mas contactos corporativos
+    - Distribucion de dominios de email
+    - Distribucion de ciudades (Cliente.ciudad, tomada de la direccion)
+
+Tambien genera el ranking de clientes por puntos acumulados (ver ranking_puntos).
+
+Los percentiles se estiman con SketchCuantiles, que usa memoria acotada sin importar
+la cantidad de clientes, por lo que el reporte no necesita guardar ni ordenar los puntos.
+"""
+import os
+import math
+import heapq
+from collections import Counter
+from operator import attrgetter
+from modulos.archivos import (
+    REPORTES_DIR,
+    TAMANO_BUFFER,
+    abrir_archivo,
+    crear_directorios,
+    obtener_timestamp,
+    registrar_log
+)
+from modulos.registro_tipos import tipo_de
+from modulos.excepciones import ArchivoError, PermisoArchivoError
+
+
+ARCHIVO_ANALITICA = os.path.join(REPORTES_DIR, "analitica.txt")
+ARCHIVO_RANKING = os.path.join(REPORTES_DIR, "ranking_premium.txt")
+
+# Clientes incluidos en el ranking de puntos
+TOP_RANKING = 100
+
+# Filas de cada ranking (empresas, dominios, ciudades)
+TOP_ANALITICA = 10
+
+# Percentiles de puntos incluidos en el reporte
+PERCENTILES = (25, 50, 75, 90, 95, 99)
+
+# Error relativo de los percentiles estimados (1%)
+ERROR_RELATIVO = 0.01
+
+# Cubetas maximas de un sketch; al superarlas se combinan las de valores mas bajos
+MAX_CUBETAS = 2048
+
+SIN_CIUDAD = "(sin ciudad)"
+
+
+"""
+SKETCH DE CUANTILES
+"""
+class SketchCuantiles:
+    """
+    Estima cuantiles con error relativo acotado y memoria fija.
+
+    Cada valor positivo se cuenta en la cubeta ceil(log(valor) / log(gamma)), con
+    gamma = (1 + error) / (1 - error); todos los valores de una cubeta estan a menos de
+    'error_relativo' de su punto medio, que es lo que retorna cuantil(). Los negativos se
+    cuentan igual segun su valor absoluto, en un rango de cubetas aparte. La cantidad de
+    cubetas crece con el logaritmo del rango de valores (unas 2.100 para todo int64 con
+    error del 1%) y nunca supera max_cubetas.
+
+        sketch = SketchCuantiles()
+        for puntos in valores:
+            sketch.agregar(puntos)
+        mediana = sketch.cuantil(0.5)
+    """
+
+    def __init__(self, error_relativo: float = ERROR_RELATIVO, max_cubetas: int = MAX_CUBETAS):
+        """
+        Args:
+            error_relativo (float): Error relativo maximo de los cuantiles (entre 0 y 1)
+            max_cubetas (int): Cantidad maxima de cubetas en memoria
+        Raises:
+            ValueError: Si el error relativo no esta entre 0 y 1
+        """
+        if not 0 < error_relativo < 1:
+            raise ValueError("El error relativo debe estar entre 0 y 1")
+        self.__gamma = (1 + error_relativo) / (1 - error_relativo)
+        self.__log_gamma = math.log(self.__gamma)
+        self.__max_cubetas = max_cubetas
+        self.__cubetas = {}
+        self.__negativas = {}  # Cubetas de los valores negativos, por valor absoluto
+        self.__ceros = 0
+        self.__total = 0
+        self.__suma = 0
+        self.__minimo = None
+        self.__maximo = None
+
+
+    """
+    PROPIEDADES
+    """
+    @property
+    def total(self) -> int:
+        return self.__total
+
+    @property
+    def suma(self) -> float:
+        return self.__suma
+
+    @property
+    def minimo(self):
+        return self.__minimo
+
+    @property
+    def maximo(self):
+        return self.__maximo
+
+    @property
+    def negativos(self) -> int:
+        return sum(self.__negativas.values())
+
+    @property
+    def cantidad_cubetas(self) -> int:
+        return len(self.__cubetas) + len(self.__negativas) + (1 if self.__ceros else 0)
+
+
+    """
+    MÉTODOS
+    """
+    def agregar(self, valor):
+        """
+        Agrega un valor al sketch.
+
+        Args:
+            valor (int | float): Valor a agregar
+        """
+        self.__total += 1
+        self.__suma += valor
+        if self.__minimo is None or valor < self.__minimo:
+            self.__minimo = valor
+        if self.__maximo is None or valor > self.__maximo:
+            self.__maximo = valor
+
+        if valor == 0:
+            self.__ceros += 1
+            return
+        cubetas = self.__cubetas if valor > 0 else self.__negativas
+        indice = math.ceil(math.log(abs(valor)) / self.__log_gamma)
+        cubetas[indice] = cubetas.get(indice, 0) + 1
+        if len(self.__cubetas) + len(self.__negativas) > self.__max_cubetas:
+            self.__combinar_cubetas_bajas()
+
+
+    def __combinar_cubetas_bajas(self):
+        # Pierde precision solo en los valores de menor magnitud, que pesan menos en los
+        # percentiles extremos; se combina en el rango (positivo o negativo) con mas cubetas
+        cubetas = self.__cubetas if len(self.__cubetas) >= len(self.__negativas) else self.__negativas
+        primera, segunda = sorted(cubetas)[:2]
+        cubetas[segunda] += cubetas.pop(primera)
+
+
+    def cuantil(self, q: float) -> float | None:
+        """
+        Estima el cuantil q (0.5 = mediana, 0.99 = percentil 99).
+
+        Args:
+            q (float): Cuantil entre 0 y 1
+        Returns:
+            float | None: Valor estimado (dentro de [minimo, maximo]) o None si no hay valores
+        Raises:
+            ValueError: Si q no esta entre 0 y 1
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1")
+        if self.__total == 0:
+            return None
+
+        rango = q * (self.__total - 1)
+        acumulado = 0
+        # Negativos de mayor a menor valor absoluto, ceros y positivos de menor a mayor
+        for indice in sorted(self.__negativas, reverse=True):
+            acumulado += self.__negativas[indice]
+            if acumulado > rango:
+                return self.__acotar(-self.__punto_medio(indice))
+        acumulado += self.__ceros
+        if acumulado > rango:
+            return 0
+        for indice in sorted(self.__cubetas):
+            acumulado += self.__cubetas[indice]
+            if acumulado > rango:
+                return self.__acotar(self.__punto_medio(indice))
+        return self.__maximo
+
+
+    def __punto_medio(self, indice) -> float:
+        return 2 * self.__gamma ** indice / (self.__gamma + 1)
+
+
+    def __acotar(self, estimado) -> float:
+        return min(max(estimado, self.__minimo), self.__maximo)
+
+
+"""
+CALCULO
+"""
+def _rango_histograma(puntos: int) -> int:
+    # Cantidad de digitos: 0 -> 0, 1-9 -> 1, 10-99 -> 2, ...; negativos -> -1
+    if puntos < 0:
+        return -1
+    return len(str(puntos)) if puntos > 0 else 0
+
+
+def _etiqueta_rango(digitos: int) -> str:
+    if digitos < 0:
+        return "negativos"
+    if digitos == 0:
+        return "0"
+    return f"{10 ** (digitos - 1) if digitos > 1 else 1}-{10 ** digitos - 1}"
+
+
+def calcular_analitica(clientes, top: int = TOP_ANALITICA, error_relativo: float = ERROR_RELATIVO) -> dict:
+    """
+    Recorre los clientes una sola vez y calcula las estadisticas del reporte analitico.
+    'clientes' puede ser un iterador: no se guarda ningun cliente.
+
+    Los puntos se toman de los clientes con 'puntos_acumulados' (Premium) y las empresas
+    de los que tienen 'nombre_empresa' (Corporativo), por lo que un tipo nuevo con esos
+    atributos entra en las mismas estadisticas.
+
+    Args:
+        clientes (iterable): Objetos Cliente
+        top (int): Filas de cada ranking
+        error_relativo (float): Error relativo de los percentiles de puntos
+    Returns:
+        dict: total, por_tipo, puntos (clientes, negativos, total, minimo, maximo, promedio,
+            percentiles, histograma) y empresas/dominios/ciudades (total, distintos, ranking)
+    """
+    por_tipo = Counter()
+    sketch = SketchCuantiles(error_relativo)
+    histograma = Counter()
+    empresas = Counter()
+    dominios = Counter()
+    ciudades = Counter()
+    total = 0
+
+    for cliente in clientes:
+        total += 1
+        por_tipo[tipo_de(cliente).nombre] += 1
+        email = cliente.email
+        dominios[email[email.rfind('@') + 1:]] += 1
+        ciudades[cliente.ciudad or SIN_CIUDAD] += 1
+
+        puntos = getattr(cliente, 'puntos_acumulados', None)
+        if puntos is not None:
+            sketch.agregar(puntos)
+            histograma[_rango_histograma(puntos)] += 1
+        empresa = getattr(cliente, 'nombre_empresa', None)
+        if empresa is not None:
+            empresas[empresa or "(sin empresa)"] += 1
+
+    return {
+        "total": total,
+        "por_tipo": dict(por_tipo),
+        "puntos": {
+            "clientes": sketch.total,
+            "negativos": sketch.negativos,
+            "total": sketch.suma,
+            "minimo": sketch.minimo,
+            "maximo": sketch.maximo,
+            "promedio": sketch.suma / sketch.total if sketch.total else None,
+            "percentiles": {p: sketch.cuantil(p / 100) for p in PERCENTILES},
+            "histograma": [(_etiqueta_rango(d), histograma[d]) for d in sorted(histograma)]
+        },
+        "empresas": _ranking(empresas, top),
+        "dominios": _ranking(dominios, top),
+        "ciudades": _ranking(ciudades, top)
+    }
+
+
+def _ranking(conteo: Counter, top: int) -> dict:
+    return {"total": sum(conteo.values()), "distintos": len(conteo), "ranking": conteo.most_common(top)}
+
+
+"""
+REPORTE
+"""
+def _renderizar_ranking(titulo, datos) -> list:
+    lineas = [titulo, "-" * 30, f"Distintos: {datos['distintos']}"]
+    if not datos["ranking"]:
+        lineas.append("  (sin datos)")
+    for valor, cantidad in datos["ranking"]:
+        lineas.append(f"  {valor:<30} {cantidad:>8} {cantidad / datos['total']:7.1%}")
+    return lineas + [""]
+
+
+def _renderizar_analitica(analitica) -> str:
+    puntos = analitica["puntos"]
+    lineas = [
+        "=" * 60,
+        " " * 10 + "REPORTE ANALITICO - SISTEMA GIC",
+        " " * 15 + "SolutionTech S.A.",
+        "=" * 60,
+        "",
+        f"Fecha de generacion: {obtener_timestamp()}",
+        f"Total de clientes: {analitica['total']}",
+        "-" * 60,
+        "",
+        "PUNTOS DE CLIENTES PREMIUM",
+        "-" * 30,
+        f"Clientes con puntos: {puntos['clientes']}"
+    ]
+    if puntos["clientes"]:
+        lineas += [
+            f"Total: {puntos['total']}",
+            f"Minimo: {puntos['minimo']}  Maximo: {puntos['maximo']}  Promedio: {puntos['promedio']:.1f}",
+        ]
+        if puntos["negativos"]:
+            lineas.append(f"Clientes con puntos negativos: {puntos['negativos']}")
+        lineas += [
+            f"Percentiles (estimados, error < {ERROR_RELATIVO:.0%}):"
+        ]
+        lineas += [f"  P{p:<3} {valor:>12.0f}" for p, valor in puntos["percentiles"].items()]
+        lineas.append("Histograma:")
+        mayor = max(cantidad for _, cantidad in puntos["histograma"])
+        for rango, cantidad in puntos["histograma"]:
+            barra = "#" * max(1, round(cantidad / mayor * 30))
+            lineas.append(f"  {rango:>21} | {cantidad:>8} | {barra}")
+    lineas.append("")
+
+    lineas += _renderizar_ranking("EMPRESAS CON MAS CONTACTOS", analitica["empresas"])
+    lineas += _renderizar_ranking("DOMINIOS DE EMAIL", analitica["dominios"])
+    lineas += _renderizar_ranking("CIUDADES", analitica["ciudades"])
+    lineas += ["-" * 60, "Fin del reporte", "=" * 60]
+    return "\n".join(lineas) + "\n"
+
+
+def generar_reporte_analitico(clientes, archivo=None, nivel_compresion=None, top: int = TOP_ANALITICA,
+                            tamano_buffer=TAMANO_BUFFER) -> dict:
+    """
+    Calcula la analitica de los clientes en una sola pasada (ver calcular_analitica) y
+    la escribe como reporte TXT (comprimido si la ruta termina en .gz, .bz2 o .xz).
+
+    Args:
+        clientes (iterable): Objetos Cliente (puede ser un iterador)
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_ANALITICA
+        nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
+        top (int): Filas de cada ranking
+        tamano_buffer (int): Tamano del buffer de escritura en bytes
+    Returns:
+        dict: Estadisticas calculadas
+    Raises:
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_ANALITICA
+
+    try:
+        crear_directorios()
+        analitica = calcular_analitica(clientes, top)
+        with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer) as file:
+            file.write(_renderizar_analitica(analitica))
+
+        registrar_log(f"REPORTE: Reporte analitico de {analitica['total']} clientes generado en {archivo}")
+        return analitica
+
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al generar reporte analitico: {str(e)}")
+
+
+"""
+RANKING DE PUNTOS
+"""
+_PUNTOS = attrgetter('puntos_acumulados')
+
+
+def ranking_puntos(clientes, cantidad: int = TOP_RANKING) -> list:
+    """
+    Retorna los 'cantidad' clientes con mas puntos acumulados, de mayor a menor (a igual
+    puntaje, en el orden en que aparecen). Usa heapq.nlargest, que mantiene un monticulo
+    de 'cantidad' elementos: O(n log k) en lugar de ordenar todos los clientes.
+
+    Args:
+        clientes (iterable): Clientes con 'puntos_acumulados' (puede ser un iterador)
+        cantidad (int): Largo del ranking
+    Returns:
+        list: Clientes del ranking
+    """
+    return heapq.nlargest(cantidad, clientes, key=_PUNTOS)
+
+
+def generar_ranking_puntos(clientes, archivo=None, cantidad: int = TOP_RANKING,
+                        nivel_compresion=None) -> list:
+    """
+    Escribe el ranking de clientes por puntos acumulados (ver ranking_puntos) como
+    reporte TXT.
+
+    Args:
+        clientes (iterable): Clientes con 'puntos_acumulados' (puede ser un iterador)
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_RANKING
+        cantidad (int): Largo del ranking
+        nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
+    Returns:
+        list: Clientes del ranking
+    Raises:
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_RANKING
+
+    try:
+        crear_directorios()
+        ranking = ranking_puntos(clientes, cantidad)
+        lineas = [
+            "=" * 60,
+            " " * 10 + f"RANKING PREMIUM - TOP {cantidad} POR PUNTOS",
+            " " * 15 + "SolutionTech S.A.",
+            "=" * 60,
+            "",
+            f"Fecha de generacion: {obtener_timestamp()}",
+            "-" * 60,
+            f"{'#':>4}  {'Nombre':<24} {'Email':<20} {'Puntos':>8}",
+            "-" * 60
+        ]
+        lineas += [f"{posicion:>4}  {cliente.nombre:<24} {cliente.email:<20} {cliente.puntos_acumulados:>8}"
+                for posicion, cliente in enumerate(ranking, 1)]
+        if not ranking:
+            lineas.append("No hay clientes Premium registrados.")
+        lineas += ["-" * 60, "Fin del reporte", "=" * 60]
+        with abrir_archivo(archivo, 'w', nivel_compresion) as file:
+            file.write("\n".join(lineas) + "\n")
+
+        registrar_log(f"REPORTE: Ranking de {len(ranking)} clientes por puntos generado en {archivo}")
+        return ranking
+
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al generar ranking de puntos: {str(e)}")
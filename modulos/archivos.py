@@ -4,12 +4,43 @@ Módulo archivos
 ===============
 """
 import os
+import io
+import sys
 import csv
+import time
+import json
+import zlib
+import hashlib
+import heapq
+import tempfile
+import sqlite3
+import multiprocessing
+from threading import Lock, current_thread, main_thread
+from itertools import islice, count
+from operator import itemgetter
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import bz2
+import lzma
 from datetime import datetime
+# Importar los tipos de cliente los registra en modulos.registro_tipos
 from modulos.cliente_regular import ClienteRegular
 from modulos.cliente_premium import ClientePremium
 from modulos.cliente_corporativo import ClienteCorporativo
+from modulos.registro_tipos import columnas_csv, tipos_registrados, tipo_de, obtener_tipo_por_nombre
+from modulos.lector_mmap import LectorCSVMmap
+from modulos.perfiles_importacion import obtener_perfil, COLUMNAS_REQUERIDAS, COLUMNAS_OPCIONALES
+from modulos.validaciones import (
+    validar_nombre,
+    validar_email,
+    validar_telefono,
+    validar_direccion,
+    validar_rut,
+    validar_puntos
+)
 from modulos.excepciones import (
+    ValidacionError,
     ArchivoError,
     ArchivoNoEncontradoError,
     PermisoArchivoError,
@@ -33,6 +64,85 @@ ARCHIVO_CLIENTES = os.path.join(DATOS_DIR, "clientes.csv")
 ARCHIVO_ENTRADA = os.path.join(DATOS_DIR, "clientes_entrada.csv")
 ARCHIVO_REPORTE = os.path.join(REPORTES_DIR, "resumen.txt")
 ARCHIVO_LOG = os.path.join(LOGS_DIR, "app.log")
+ARCHIVO_CLIENTES_JSONL = os.path.join(DATOS_DIR, "clientes.jsonl")
+ARCHIVO_CAMBIOS = os.path.join(DATOS_DIR, "cambios.csv")
+ARCHIVO_SQLITE = os.path.join(DATOS_DIR, "clientes.db")
+
+
+# Columnas del CSV de clientes (las de los tipos incluidos en el sistema; los tipos
+# registrados despues agregan las suyas a columnas_csv())
+COLUMNAS_CSV = columnas_csv()
+
+
+"""
+CONFIGURACION DE COMPRESION
+"""
+# Extensiones reconocidas y modulo de la libreria estandar que las maneja
+COMPRESORES = {
+    ".gz": gzip,
+    ".bz2": bz2,
+    ".xz": lzma
+}
+
+# Nivel de compresion por defecto (1 = rapido, 9 = maxima compresion)
+NIVEL_COMPRESION = 6
+
+# Tamano del buffer de lectura/escritura en bytes
+TAMANO_BUFFER = 1024 * 1024
+
+
+"""
+PROGRESO DE OPERACIONES LARGAS
+"""
+# Filas entre dos llamadas al callback de progreso
+INTERVALO_PROGRESO = 10000
+
+
+class MedidorProgreso:
+    """
+    Mide el avance de una exportacion, importacion o reporte y lo informa a un callback.
+    
+    El callback recibe un diccionario con las claves:
+        operacion (str): "exportacion", "importacion" o "reporte"
+        filas (int): Filas (clientes) procesadas hasta el momento
+        bytes (int): Bytes escritos o leidos (sin comprimir; aproximado en la lectura)
+        segundos (float): Tiempo transcurrido
+        filas_por_segundo (float): Ritmo promedio desde el inicio
+        terminado (bool): True en la ultima llamada
+    """
+    
+    def __init__(self, callback, operacion: str, intervalo: int = INTERVALO_PROGRESO):
+        self.callback = callback
+        self.operacion = operacion
+        self.intervalo = max(1, intervalo)
+        self.__inicio = time.perf_counter()
+    
+    
+    def informar(self, filas: int, bytes_procesados: int, terminado: bool = False):
+        segundos = time.perf_counter() - self.__inicio
+        self.callback({
+            'operacion': self.operacion,
+            'filas': filas,
+            'bytes': bytes_procesados,
+            'segundos': segundos,
+            'filas_por_segundo': filas / segundos if segundos > 0 else 0.0,
+            'terminado': terminado
+        })
+
+
+def _posicion_lectura(file) -> int:
+    # Bytes consumidos del archivo; con buffer, la posicion avanza de a un buffer completo
+    if isinstance(file, LectorCSVMmap):
+        return file.posicion
+    buffer = getattr(file, 'buffer', None)
+    return buffer.tell() if buffer is not None else file.tell()
+
+
+def _posicion_escritura(file) -> int:
+    # Bytes escritos (sin comprimir). El texto sobre BZ2File o LZMAFile no admite tell();
+    # el buffer binario si, y su posicion cuenta lo que aun no se entrego al compresor
+    file.flush()
+    return file.buffer.tell()
 
 
 """
@@ -57,17 +167,123 @@ def obtener_timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def es_archivo_comprimido(ruta) -> bool:
+    """
+    Indica si la ruta tiene una extension de compresion reconocida (.gz, .bz2, .xz).
+    
+    Args:
+        ruta (str): Ruta del archivo
+    Returns:
+        bool: True si el archivo se lee/escribe a traves de un compresor
+    """
+    return os.path.splitext(ruta)[1].lower() in COMPRESORES
+
+
+def abrir_archivo(ruta, modo='r', nivel_compresion=None, tamano_buffer=TAMANO_BUFFER, newline=None):
+    """
+    Abre un archivo de texto UTF-8 detectando la compresion por su extension.
+    Los archivos .gz, .bz2 y .xz se leen y escriben en streaming a traves del
+    compresor correspondiente, sin descomprimir a un archivo temporal.
+    
+    Args:
+        ruta (str): Ruta del archivo
+        modo (str): 'r' para lectura o 'w' para escritura
+        nivel_compresion (int, optional): Nivel de compresion 1-9. Por defecto usa NIVEL_COMPRESION
+        tamano_buffer (int): Tamano del buffer de E/S en bytes
+        newline (str, optional): Igual que en open(); usar '' para archivos CSV
+    Returns:
+        io.TextIOWrapper: Archivo de texto abierto
+    """
+    compresor = COMPRESORES.get(os.path.splitext(ruta)[1].lower())
+    
+    if compresor is None:
+        return open(ruta, modo, buffering=tamano_buffer, encoding='utf-8', newline=newline)
+    
+    if modo == 'w':
+        nivel = NIVEL_COMPRESION if nivel_compresion is None else nivel_compresion
+        # lzma usa 'preset' en lugar de 'compresslevel'
+        if compresor is lzma:
+            comprimido = lzma.open(ruta, 'wb', preset=nivel)
+        else:
+            comprimido = compresor.open(ruta, 'wb', compresslevel=nivel)
+        binario = io.BufferedWriter(comprimido, buffer_size=tamano_buffer)
+    else:
+        comprimido = compresor.open(ruta, 'rb')
+        binario = io.BufferedReader(comprimido, buffer_size=tamano_buffer)
+    
+    return io.TextIOWrapper(binario, encoding='utf-8', newline=newline)
+
+
+
+class MapeoFilas:
+    """
+    Envuelve un lector de filas aplicando a cada una la funcion de un perfil de mapeo.
+    Expone 'fieldnames' con las columnas estandar, como csv.DictReader.
+    """
+    def __init__(self, reader, transformar):
+        self.__reader = reader
+        self.__transformar = transformar
+        self.fieldnames = list(COLUMNAS_REQUERIDAS + COLUMNAS_OPCIONALES)
+    
+    def __iter__(self):
+        return map(self.__transformar, self.__reader)
+
+
+def abrir_rango_bytes(ruta, desde_byte=0, hasta_byte=None, tamano_buffer=TAMANO_BUFFER) -> io.StringIO:
+    """
+    Lee un rango de bytes de un archivo de texto UTF-8 sin comprimir.
+    
+    Args:
+        ruta (str): Ruta del archivo
+        desde_byte (int): Posicion inicial
+        hasta_byte (int, optional): Posicion final (exclusiva). Por defecto, fin del archivo
+        tamano_buffer (int): Tamano del buffer de lectura en bytes
+    Returns:
+        io.StringIO: Texto del rango, listo para csv.reader
+    """
+    with open(ruta, 'rb', buffering=tamano_buffer) as file:
+        file.seek(desde_byte)
+        cantidad = -1 if hasta_byte is None else max(0, hasta_byte - desde_byte)
+        datos = file.read(cantidad)
+    return io.StringIO(datos.decode('utf-8'), newline='')
+
+
 
 """
 EXPORTACION DE CLIENTES A CSV
 """
-def exportar_clientes_csv(clientes, archivo=None) -> bool:
+def exportar_clientes_csv(clientes, archivo=None, nivel_compresion=None, 
+                        tamano_buffer=TAMANO_BUFFER, max_filas=None, max_bytes=None,
+                        ordenar_por=None, memoria_maxima=None, progreso=None,
+                        intervalo_progreso=INTERVALO_PROGRESO) -> bool:
     """
-    Exporta la lista de clientes a un archivo CSV.
+    Exporta la lista de clientes a un archivo CSV. Si la ruta termina en .gz, .bz2
+    o .xz el archivo se escribe comprimido.
+    
+    Con max_filas o max_bytes la exportacion se divide en fragmentos numerados
+    (clientes_0001.csv, clientes_0002.csv, ...), cada uno con su encabezado, y se
+    escribe un indice (clientes_indice.json) con el primer y el ultimo email de cada
+    fragmento para que se puedan procesar en paralelo (ver _exportar_fragmentos).
+    
+    Con ordenar_por las filas se escriben ordenadas por esa columna ('email', 'nombre',
+    ...) mediante un ordenamiento externo que usa a lo sumo memoria_maxima bytes para
+    las filas (ver ordenar_filas_externo).
+    
+    Si se indica progreso, se llama cada intervalo_progreso filas y al terminar con el
+    avance de la exportacion (ver MedidorProgreso).
 
     Args:
         clientes (list): Lista de objetos Cliente a exportar
         archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_CLIENTES
+        nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
+        tamano_buffer (int): Tamano del buffer de escritura en bytes
+        max_filas (int, optional): Maximo de clientes por fragmento
+        max_bytes (int, optional): Maximo de bytes por fragmento (sin comprimir)
+        ordenar_por (str, optional): Columna por la que se ordenan las filas
+        memoria_maxima (int, optional): Bytes de filas en memoria al ordenar.
+            Por defecto usa MEMORIA_ORDENAMIENTO
+        progreso (function, optional): Callback que recibe el avance (dict)
+        intervalo_progreso (int): Filas entre dos llamadas a progreso
     Returns:
         bool: True si la exportacion fue exitosa
     Raises:
@@ -79,33 +295,34 @@ def exportar_clientes_csv(clientes, archivo=None) -> bool:
     
     try:
         crear_directorios()
-        with open(archivo, 'w', newline='', encoding='utf-8') as file:
-            campos = ['tipo', 'nombre', 'email', 'telefono', 'direccion', 
-                    'puntos', 'empresa', 'rut']
-            
-            writer = csv.DictWriter(file, fieldnames=campos)
-            writer.writeheader()
-            
-            for cliente in clientes:
-                fila = {
-                    'tipo': cliente.obtener_tipo(),
-                    'nombre': cliente.nombre,
-                    'email': cliente.email,
-                    'telefono': cliente.telefono,
-                    'direccion': cliente.direccion,
-                    'puntos': '',
-                    'empresa': '',
-                    'rut': ''
-                }
-                
-                # Agrega campos especificos segun el tipo
-                if cliente.obtener_tipo() == "Premium":
-                    fila['puntos'] = cliente.puntos_acumulados
-                elif cliente.obtener_tipo() == "Corporativo":
-                    fila['empresa'] = cliente.nombre_empresa
-                    fila['rut'] = cliente.rut_empresa
-                
-                writer.writerow(fila)
+        filas = map(cliente_a_fila, clientes)
+        if ordenar_por is not None:
+            filas = ordenar_filas_externo(filas, ordenar_por, memoria_maxima)
+        medidor = None if progreso is None else MedidorProgreso(progreso, "exportacion", intervalo_progreso)
+        
+        if max_filas or max_bytes:
+            indice = _exportar_fragmentos(filas, archivo, max_filas, max_bytes,
+                                        nivel_compresion, tamano_buffer, medidor)
+            registrar_log(f"EXPORTACION: {indice['total_filas']} clientes exportados en "
+                        f"{len(indice['fragmentos'])} fragmentos ({ruta_indice_fragmentos(archivo)})")
+            return True
+        
+        with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer, newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(columnas_csv())
+            if medidor is None:
+                writer.writerows(filas)
+            else:
+                # Se escribe por lotes para informar el avance entre uno y otro
+                total = 0
+                while True:
+                    lote = list(islice(filas, medidor.intervalo))
+                    if not lote:
+                        break
+                    writer.writerows(lote)
+                    total += len(lote)
+                    medidor.informar(total, _posicion_escritura(file))
+                medidor.informar(total, _posicion_escritura(file), terminado=True)
         
         # Registra en el log
         registrar_log(f"EXPORTACION: {len(clientes)} clientes exportados a {archivo}")
@@ -119,17 +336,572 @@ def exportar_clientes_csv(clientes, archivo=None) -> bool:
 
 
 
+def anexar_clientes_csv(clientes, archivo=None) -> int:
+    """
+    Agrega clientes al final de un CSV sin comprimir (con el encabezado si el archivo
+    no existe o esta vacio) y fuerza la escritura a disco antes de retornar.
+    
+    Args:
+        clientes (list): Lista de objetos Cliente
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_CLIENTES
+    Returns:
+        int: Cantidad de clientes agregados
+    Raises:
+        FormatoArchivoError: Si el archivo existe con otras columnas
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_CLIENTES
+    
+    try:
+        crear_directorios()
+        with open(archivo, 'a+', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            if file.tell() == 0:
+                writer.writerow(columnas_csv())
+            else:
+                file.seek(0)
+                if next(csv.reader([file.readline()]), []) != columnas_csv():
+                    raise FormatoArchivoError(archivo, "Las columnas no coinciden con las de los clientes")
+            writer.writerows(map(cliente_a_fila, clientes))
+            file.flush()
+            os.fsync(file.fileno())
+        return len(clientes)
+    
+    # Manejo de excepciones
+    except FormatoArchivoError:
+        raise
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al agregar clientes: {str(e)}")
+
+
+def cliente_a_fila(cliente) -> list:
+    """
+    Convierte un cliente en la fila del CSV, en el orden de columnas_csv(), con el
+    codificador precompilado de su tipo (ver modulos.registro_tipos).
+    
+    Args:
+        cliente (Cliente): Objeto Cliente
+    Returns:
+        list: Valores de la fila
+    Raises:
+        FormatoArchivoError: Si el tipo del cliente no esta registrado
+    """
+    return tipo_de(cliente).codificar_fila(cliente)
+
+
+"""
+ORDENAMIENTO EXTERNO
+"""
+# Bytes de filas que se ordenan en memoria antes de volcarlas a un tramo temporal
+MEMORIA_ORDENAMIENTO = 64 * 1024 * 1024
+
+
+def _tamano_fila(fila) -> int:
+    return sys.getsizeof(fila) + sum(map(sys.getsizeof, fila))
+
+
+def _volcar_tramo(lote, clave, directorio, numero) -> str:
+    lote.sort(key=clave)
+    ruta = os.path.join(directorio, f"tramo_{numero:05d}.csv")
+    with open(ruta, 'w', buffering=TAMANO_BUFFER, encoding='utf-8', newline='') as file:
+        csv.writer(file).writerows(lote)
+    return ruta
+
+
+def ordenar_filas_externo(filas, columna, memoria_maxima=None, directorio_temporal=None):
+    """
+    Ordena filas del CSV (en el orden de columnas_csv()) por una columna sin tenerlas
+    todas en memoria: las filas se ordenan en tramos de hasta memoria_maxima bytes que
+    se vuelcan a archivos temporales y se combinan con heapq.merge. Si todas las filas
+    caben en un tramo, se ordenan en memoria sin usar archivos.
+    
+    El orden es estable y compara los valores como texto. Las filas leidas de los
+    tramos tienen todos sus valores como texto, lo que no cambia el CSV resultante.
+    
+    Args:
+        filas (iterable): Filas a ordenar
+        columna (str): Columna de columnas_csv() por la que se ordena
+        memoria_maxima (int, optional): Bytes de filas por tramo. Por defecto MEMORIA_ORDENAMIENTO
+        directorio_temporal (str, optional): Directorio de los tramos. Por defecto, el del sistema
+    Yields:
+        list: Filas ordenadas
+    Raises:
+        ValueError: Si la columna no existe
+    """
+    columnas = columnas_csv()
+    if columna not in columnas:
+        raise ValueError(f"Columna de ordenamiento desconocida: {columna}")
+    if memoria_maxima is None:
+        memoria_maxima = MEMORIA_ORDENAMIENTO
+    
+    indice = columnas.index(columna)
+    clave = lambda fila: str(fila[indice])
+    
+    with tempfile.TemporaryDirectory(prefix="gic_orden_", dir=directorio_temporal) as temporal:
+        tramos = []
+        lote = []
+        memoria = 0
+        for fila in filas:
+            lote.append(fila)
+            memoria += _tamano_fila(fila)
+            if memoria >= memoria_maxima:
+                tramos.append(_volcar_tramo(lote, clave, temporal, len(tramos)))
+                lote = []
+                memoria = 0
+        
+        if not tramos:
+            lote.sort(key=clave)
+            yield from lote
+            return
+        if lote:
+            tramos.append(_volcar_tramo(lote, clave, temporal, len(tramos)))
+        del lote
+        
+        archivos = [open(ruta, 'r', buffering=TAMANO_BUFFER, encoding='utf-8', newline='')
+                    for ruta in tramos]
+        try:
+            yield from heapq.merge(*map(csv.reader, archivos), key=itemgetter(indice))
+        finally:
+            for file in archivos:
+                file.close()
+
+
+"""
+EXPORTACION EN FRAGMENTOS
+"""
+def _separar_extension(archivo) -> tuple[str, str]:
+    # "clientes.csv.gz" -> ("clientes", ".csv.gz")
+    base, extension = os.path.splitext(archivo)
+    if extension.lower() in COMPRESORES:
+        base, interna = os.path.splitext(base)
+        extension = interna + extension
+    return base, extension
+
+
+def ruta_fragmento(archivo, numero) -> str:
+    """
+    Retorna la ruta del fragmento 'numero' (desde 1) de una exportacion en fragmentos:
+    datos/clientes.csv.gz -> datos/clientes_0001.csv.gz
+    """
+    base, extension = _separar_extension(archivo)
+    return f"{base}_{numero:04d}{extension}"
+
+
+def ruta_indice_fragmentos(archivo) -> str:
+    """
+    Retorna la ruta del indice de una exportacion en fragmentos: datos/clientes_indice.json
+    """
+    return f"{_separar_extension(archivo)[0]}_indice.json"
+
+
+def _eliminar_fragmentos_sobrantes(archivo, desde):
+    # Fragmentos de una exportacion anterior con mas archivos que la actual
+    numero = desde
+    while os.path.exists(ruta_fragmento(archivo, numero)):
+        os.remove(ruta_fragmento(archivo, numero))
+        numero += 1
+
+
+def _exportar_fragmentos(filas, archivo, max_filas, max_bytes, nivel_compresion,
+                        tamano_buffer, medidor=None) -> dict:
+    """
+    Escribe las filas en fragmentos de hasta max_filas filas y max_bytes bytes
+    (encabezado incluido). Cada fila se convierte a texto antes de escribirla para
+    saber si cabe en el fragmento actual; una fila que por si sola supera max_bytes
+    ocupa un fragmento propio.
+    
+    Returns:
+        dict: Indice con las claves generado, columnas, total_filas y fragmentos
+            (archivo, filas, bytes, primer_email, ultimo_email de cada uno)
+    """
+    linea = io.StringIO()
+    writer = csv.writer(linea)
+    
+    def a_texto(fila) -> str:
+        writer.writerow(fila)
+        texto = linea.getvalue()
+        linea.seek(0)
+        linea.truncate()
+        return texto
+    
+    columnas = columnas_csv()
+    posicion_email = columnas.index('email')
+    encabezado = a_texto(columnas)
+    bytes_encabezado = len(encabezado.encode('utf-8'))
+    
+    fragmentos = []
+    actual = None
+    file = None
+    total_filas = 0
+    total_bytes = 0
+    try:
+        for fila in filas:
+            texto = a_texto(fila)
+            tamano = len(texto.encode('utf-8'))
+            
+            if file is not None and ((max_filas and actual["filas"] >= max_filas)
+                                    or (max_bytes and actual["bytes"] + tamano > max_bytes)):
+                file.close()
+                file = None
+            
+            if file is None:
+                ruta = ruta_fragmento(archivo, len(fragmentos) + 1)
+                actual = {"archivo": os.path.basename(ruta), "filas": 0, "bytes": bytes_encabezado,
+                        "primer_email": fila[posicion_email], "ultimo_email": ""}
+                fragmentos.append(actual)
+                file = abrir_archivo(ruta, 'w', nivel_compresion, tamano_buffer, newline='')
+                file.write(encabezado)
+            
+            file.write(texto)
+            actual["filas"] += 1
+            actual["bytes"] += tamano
+            actual["ultimo_email"] = fila[posicion_email]
+            
+            total_filas += 1
+            total_bytes += tamano
+            if medidor is not None and total_filas % medidor.intervalo == 0:
+                medidor.informar(total_filas, total_bytes)
+    finally:
+        if file is not None:
+            file.close()
+    
+    _eliminar_fragmentos_sobrantes(archivo, len(fragmentos) + 1)
+    
+    if medidor is not None:
+        medidor.informar(total_filas, total_bytes, terminado=True)
+    
+    indice = {
+        "generado": obtener_timestamp(),
+        "columnas": columnas,
+        "total_filas": sum(f["filas"] for f in fragmentos),
+        "fragmentos": fragmentos
+    }
+    with open(ruta_indice_fragmentos(archivo), 'w', encoding='utf-8') as file:
+        json.dump(indice, file, indent=2, ensure_ascii=False)
+    return indice
+
+
+"""
+EXPORTACION PARTICIONADA EN PARALELO
+"""
+# Directorio por defecto de las particiones y nombre del manifiesto
+PARTICIONES_DIR = os.path.join(DATOS_DIR, "particiones")
+ARCHIVO_MANIFIESTO = "manifiesto.json"
+
+# Filas que se convierten a texto antes de cada escritura
+FILAS_POR_ESCRITURA = 5000
+
+
+def exportar_clientes_particionado(clientes, directorio=None, criterio="tipo", num_particiones=8,
+                                max_hilos=None, tamano_buffer=TAMANO_BUFFER) -> dict:
+    """
+    Exporta los clientes repartidos en varios CSV que se escriben en paralelo desde un
+    pool de hilos, cada uno con su propio archivo y buffer. Ademas escribe un manifiesto
+    (manifiesto.json) con la cantidad de filas, bytes y SHA-256 de cada particion.
+    
+    Criterios:
+        - "tipo": un archivo por tipo de cliente (clientes_regular.csv, ...)
+        - "dominio": 'num_particiones' archivos segun el hash CRC32 del dominio del email
+    
+    Args:
+        clientes (iterable): Objetos Cliente a exportar
+        directorio (str, optional): Directorio de destino. Por defecto usa PARTICIONES_DIR
+        criterio (str): "tipo" o "dominio"
+        num_particiones (int): Cantidad de particiones para el criterio "dominio"
+        max_hilos (int, optional): Hilos de escritura. Por defecto, uno por particion (max. 8)
+        tamano_buffer (int): Tamano del buffer de escritura de cada archivo
+    Returns:
+        dict: Manifiesto de la exportacion
+    Raises:
+        ValueError: Si el criterio es desconocido o num_particiones es menor que 1
+        ArchivoError: Si ocurre un error al escribir los archivos
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if directorio is None:
+        directorio = PARTICIONES_DIR
+    if criterio not in ("tipo", "dominio"):
+        raise ValueError(f"Criterio de particion desconocido: {criterio}")
+    if num_particiones < 1:
+        raise ValueError("La cantidad de particiones debe ser mayor que cero")
+    
+    # Reparte las filas: el nombre de archivo identifica la particion
+    particiones = {}
+    for cliente in clientes:
+        fila = cliente_a_fila(cliente)
+        if criterio == "tipo":
+            nombre = f"clientes_{fila[0].lower()}.csv"
+        else:
+            dominio = fila[2].rpartition("@")[2].encode('utf-8')
+            nombre = f"clientes_dominio_{zlib.crc32(dominio) % num_particiones:03d}.csv"
+        particiones.setdefault(nombre, []).append(fila)
+    
+    try:
+        os.makedirs(directorio, exist_ok=True)
+        hilos = max_hilos or min(8, len(particiones)) or 1
+        with ThreadPoolExecutor(max_workers=hilos) as pool:
+            futuros = [pool.submit(_escribir_particion, os.path.join(directorio, nombre), filas, tamano_buffer)
+                    for nombre, filas in sorted(particiones.items())]
+            resultados = [futuro.result() for futuro in futuros]
+        
+        manifiesto = {
+            "criterio": criterio,
+            "generado": obtener_timestamp(),
+            "columnas": columnas_csv(),
+            "total_filas": sum(r["filas"] for r in resultados),
+            "particiones": resultados
+        }
+        with open(os.path.join(directorio, ARCHIVO_MANIFIESTO), 'w', encoding='utf-8') as file:
+            json.dump(manifiesto, file, indent=2, ensure_ascii=False)
+        
+        registrar_log(f"EXPORTACION: {manifiesto['total_filas']} clientes exportados en "
+                    f"{len(resultados)} particiones ({criterio}) a {directorio}")
+        return manifiesto
+    
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(directorio, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al exportar particiones: {str(e)}")
+
+
+def _escribir_particion(ruta, filas, tamano_buffer) -> dict:
+    """
+    Escribe una particion y calcula su SHA-256 a medida que escribe.
+    
+    Returns:
+        dict: archivo, filas, bytes y sha256 de la particion
+    """
+    resumen = hashlib.sha256()
+    total_bytes = 0
+    texto = io.StringIO()
+    writer = csv.writer(texto)
+    writer.writerow(columnas_csv())  # Se escribe junto con el primer lote de filas
+    
+    with open(ruta, 'wb', buffering=tamano_buffer) as file:
+        for inicio in range(0, len(filas), FILAS_POR_ESCRITURA):
+            writer.writerows(filas[inicio:inicio + FILAS_POR_ESCRITURA])
+            datos = texto.getvalue().encode('utf-8')
+            texto.seek(0)
+            texto.truncate()
+            
+            resumen.update(datos)
+            file.write(datos)
+            total_bytes += len(datos)
+    
+    return {
+        "archivo": os.path.basename(ruta),
+        "filas": len(filas),
+        "bytes": total_bytes,
+        "sha256": resumen.hexdigest()
+    }
+
+
+"""
+EXPORTACION A SQLITE
+"""
+# Filas que se insertan en cada transaccion
+FILAS_POR_TRANSACCION = 50000
+
+# Tipo de columna SQLite segun la conversion declarada en CAMPOS_CSV
+TIPOS_SQLITE = {int: "INTEGER", float: "REAL"}
+
+# Indices que se crean despues de la carga: nombre -> (columna, unico)
+INDICES_SQLITE = {
+    'idx_clientes_email': ('email', True),
+    'idx_clientes_tipo': ('tipo', False)
+}
+
+
+def exportar_clientes_sqlite(clientes, archivo=None) -> bool:
+    """
+    Exporta los clientes a una base de datos SQLite con la tabla 'clientes': las
+    columnas comunes mas las propias de cada tipo registrado (puntos INTEGER,
+    empresa y rut TEXT), en NULL cuando no corresponden al tipo del cliente.
+    
+    La carga se hace con executemany en transacciones de FILAS_POR_TRANSACCION filas,
+    sin journal ni sincronizacion a disco, y los indices se crean al final. La base
+    se arma en un archivo temporal que reemplaza al destino solo si la carga termina.
+    
+    Args:
+        clientes (iterable): Objetos Cliente a exportar
+        archivo (str, optional): Ruta de la base de datos. Por defecto usa ARCHIVO_SQLITE
+    Returns:
+        bool: True si la exportacion fue exitosa
+    Raises:
+        ArchivoError: Si ocurre un error al escribir la base de datos
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_SQLITE
+    
+    temporal = archivo + ".tmp"
+    try:
+        crear_directorios()
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        
+        columnas = columnas_csv()
+        conversiones = {columna: convertir for tipo in tipos_registrados()
+                        for columna, (_, _, convertir) in tipo.campos_csv.items()}
+        definiciones = ", ".join(
+            f"{columna} {TIPOS_SQLITE.get(conversiones.get(columna), 'TEXT')}"
+            + (" NOT NULL" if columna in COLUMNAS_REQUERIDAS else "")
+            for columna in columnas)
+        insertar = (f"INSERT INTO clientes ({', '.join(columnas)}) "
+                    f"VALUES ({', '.join('?' * len(columnas))})")
+        
+        # Las columnas que no corresponden al tipo del cliente quedan en NULL
+        filas = (tuple(None if valor == '' else valor for valor in cliente_a_fila(cliente))
+                for cliente in clientes)
+        
+        total = 0
+        conexion = sqlite3.connect(temporal)
+        try:
+            conexion.execute("PRAGMA journal_mode = OFF")
+            conexion.execute("PRAGMA synchronous = OFF")
+            conexion.execute(f"CREATE TABLE clientes (id INTEGER PRIMARY KEY, {definiciones})")
+            
+            while True:
+                lote = list(islice(filas, FILAS_POR_TRANSACCION))
+                if not lote:
+                    break
+                with conexion:  # Una transaccion por lote
+                    conexion.executemany(insertar, lote)
+                total += len(lote)
+            
+            with conexion:
+                for nombre, (columna, unico) in INDICES_SQLITE.items():
+                    conexion.execute(f"CREATE {'UNIQUE ' if unico else ''}INDEX {nombre} ON clientes ({columna})")
+        finally:
+            conexion.close()
+        
+        os.replace(temporal, archivo)
+        registrar_log(f"EXPORTACION: {total} clientes exportados a la base SQLite {archivo}")
+        return True
+    
+    # Manejo de excepciones (la base temporal se elimina en todos los casos)
+    except PermissionError:
+        _eliminar_temporal(temporal)
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        _eliminar_temporal(temporal)
+        raise ArchivoError(f"Error al exportar clientes a SQLite: {str(e)}")
+
+
+def _eliminar_temporal(ruta):
+    # Limpieza tras un error: si no se puede borrar, se conserva el error original
+    try:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+    except OSError:
+        pass
+
+
+"""
+EXPORTACION DE CAMBIOS (DELTA)
+"""
+# Columnas que preceden a las de columnas_csv() en el CSV de cambios
+COLUMNAS_CAMBIOS = ['secuencia', 'operacion', 'fecha']
+
+
+def exportar_cambios_csv(cambios, archivo=None, nivel_compresion=None,
+                        tamano_buffer=TAMANO_BUFFER) -> int:
+    """
+    Exporta solo los clientes que cambiaron (ver GestorClientes.cambios_desde): una fila
+    por cliente con la secuencia, la operacion y la fecha de su ultimo cambio, seguidas
+    de las columnas de columnas_csv().
+    
+    Las filas 'alta' y 'modificacion' traen el registro completo y se aplican como
+    upsert; las filas 'baja' son lapidas que solo traen el email.
+    
+    Args:
+        cambios (iterable): Tuplas (secuencia, fecha, operacion, email, cliente | None)
+            en orden de secuencia
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_CAMBIOS
+        nivel_compresion (int, optional): Nivel de compresion 1-9 si la ruta es .gz, .bz2 o .xz
+        tamano_buffer (int): Tamano del buffer de escritura en bytes
+    Returns:
+        int: Cantidad de cambios exportados
+    Raises:
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_CAMBIOS
+    
+    try:
+        crear_directorios()
+        columnas = columnas_csv()
+        posicion_email = columnas.index('email')
+        total = 0
+        with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer, newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(COLUMNAS_CAMBIOS + columnas)
+            for secuencia, fecha, operacion, email, cliente in cambios:
+                if cliente is None:
+                    fila = [''] * len(columnas)
+                    fila[posicion_email] = email
+                else:
+                    fila = cliente_a_fila(cliente)
+                writer.writerow([secuencia, operacion, fecha.isoformat(timespec='microseconds'), *fila])
+                total += 1
+        
+        registrar_log(f"EXPORTACION: {total} cambios exportados a {archivo}")
+        return total
+    
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al exportar cambios: {str(e)}")
+
+
 """
 IMPORTACION DE CLIENTES DESDE CSV
 """
-def importar_clientes_csv(archivo=None) -> list:
+def importar_clientes_csv(archivo=None, tamano_buffer=TAMANO_BUFFER, simular=False,
+                        desde_byte=0, hasta_byte=None, encabezado=None, motor="csv",
+                        perfil=None, progreso=None, intervalo_progreso=INTERVALO_PROGRESO) -> list | dict:
     """
     Lee el archivo CSV y crea objetos Cliente segun el tipo especificado.
+    Los archivos .gz, .bz2 y .xz se descomprimen al vuelo mientras se leen.
+    
+    En modo simulacion se ejecutan el parseo y crear_cliente_desde_fila(), como en
+    la importacion, pero no se retorna ningun cliente ni se escribe en el log:
+    se retorna un informe con el rendimiento y los rechazos (ver _simular_importacion).
+    
+    Para importaciones incrementales se puede leer solo un rango de bytes del archivo.
+    El rango debe comenzar y terminar en un limite de registro; como no incluye la
+    primera linea, las columnas se indican con 'encabezado'.
+    
+    Con motor="mmap" el archivo se recorre mapeado en memoria (ver LectorCSVMmap),
+    decodificando solo las columnas de columnas_csv(); es la opcion mas rapida para
+    archivos grandes sin comprimir.
+    
+    Los CSV con otro formato de columnas se importan indicando un perfil de mapeo
+    (ver modulos.perfiles_importacion), que se aplica a cada fila en ambos motores.
+    
+    Si se indica progreso, se llama cada intervalo_progreso filas y al terminar con el
+    avance de la importacion (ver MedidorProgreso).
     
     Args:
         archivo (str, optional): Ruta del archivo CSV. Por defecto usa ARCHIVO_ENTRADA
+        tamano_buffer (int): Tamano del buffer de lectura en bytes
+        simular (bool): Si es True, valida el archivo sin importar (dry-run)
+        desde_byte (int): Posicion del primer byte a leer
+        hasta_byte (int, optional): Posicion donde termina la lectura. Por defecto, fin del archivo
+        encabezado (list, optional): Nombres de las columnas si el rango no incluye el encabezado
+        motor (str): "csv" (modulo csv) o "mmap" (lector sobre archivo mapeado en memoria)
+        perfil (str | PerfilMapeo, optional): Perfil de mapeo de columnas o su nombre registrado
+        progreso (function, optional): Callback que recibe el avance (dict)
+        intervalo_progreso (int): Filas entre dos llamadas a progreso
     Returns:
         list: Lista de objetos Cliente creados
+        dict: Informe de la simulacion si simular es True
     Raises:
         ArchivoNoEncontradoError: Si el archivo no existe
         PermisoArchivoError: Si no hay permisos de lectura
@@ -142,12 +914,36 @@ def importar_clientes_csv(archivo=None) -> list:
     if not os.path.exists(archivo):
         raise ArchivoNoEncontradoError(archivo)
     
+    if motor not in ("csv", "mmap"):
+        raise ValueError(f"Motor de importacion desconocido: {motor}")
+    
+    por_rango = desde_byte > 0 or hasta_byte is not None
+    if (por_rango or motor == "mmap") and es_archivo_comprimido(archivo):
+        raise FormatoArchivoError(archivo, "La lectura por rango de bytes o con mmap no admite archivos comprimidos")
+    
     clientes_importados = []
     errores = []
     
     try:
-        with open(archivo, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+        if motor == "mmap":
+            archivo_abierto = LectorCSVMmap(archivo, columnas_csv(), desde_byte, hasta_byte, encabezado)
+        elif por_rango:
+            archivo_abierto = abrir_rango_bytes(archivo, desde_byte, hasta_byte, tamano_buffer)
+        else:
+            archivo_abierto = abrir_archivo(archivo, 'r', tamano_buffer=tamano_buffer, newline='')
+        
+        with archivo_abierto as file:
+            if motor == "mmap":
+                reader = file
+            else:
+                reader = csv.DictReader(file, fieldnames=encabezado)
+            
+            if perfil is not None:
+                # El perfil se compila una vez para el encabezado de este archivo
+                transformar = obtener_perfil(perfil).compilar(reader.fieldnames)
+                if motor == "mmap":
+                    reader.columnas = transformar.columnas_origen
+                reader = MapeoFilas(reader, transformar)
             
             columnas_requeridas = {'tipo', 'nombre', 'email', 'telefono', 'direccion'}
             if not columnas_requeridas.issubset(set(reader.fieldnames or [])):
@@ -156,6 +952,11 @@ def importar_clientes_csv(archivo=None) -> list:
                     f"Faltan columnas requeridas: {columnas_requeridas}"
                 )
             
+            if simular:
+                return _simular_importacion(reader)
+            
+            medidor = None if progreso is None else MedidorProgreso(progreso, "importacion", intervalo_progreso)
+            filas_leidas = 0
             for num_fila, fila in enumerate(reader, start=2):
                 try:
                     cliente = crear_cliente_desde_fila(fila)
@@ -163,6 +964,13 @@ def importar_clientes_csv(archivo=None) -> list:
                         clientes_importados.append(cliente)
                 except Exception as e:
                     errores.append(f"Fila {num_fila}: {str(e)}")
+                
+                filas_leidas = num_fila - 1
+                if medidor is not None and filas_leidas % medidor.intervalo == 0:
+                    medidor.informar(filas_leidas, _posicion_lectura(file))
+            
+            if medidor is not None:
+                medidor.informar(filas_leidas, _posicion_lectura(file), terminado=True)
         
         # Registra en el log
         registrar_log(f"IMPORTACION: {len(clientes_importados)} clientes importados desde {archivo}")
@@ -182,9 +990,168 @@ def importar_clientes_csv(archivo=None) -> list:
         raise ArchivoError(f"Error al importar clientes: {str(e)}")
 
 
+"""
+SIMULACION DE IMPORTACION (DRY-RUN)
+"""
+# Validadores que se ejecutan sobre cada fila, por columna
+VALIDADORES_FILA = {
+    'nombre': validar_nombre,
+    'email': validar_email,
+    'telefono': validar_telefono,
+    'direccion': validar_direccion
+}
+
+# Controles de las columnas propias de cada tipo que la importacion no exige: una fila
+# que no los cumple se importa igual, por lo que solo se informan como advertencias
+VALIDADORES_ADVERTENCIA = {
+    'rut': validar_rut,
+    'puntos': lambda valor: validar_puntos(valor, "saldo")
+}
+
+# Cantidad de clientes validos sobre los que se mide la memoria por cliente
+MUESTRA_MEMORIA = 1000
+
+
+def _simular_importacion(reader) -> dict:
+    """
+    Recorre las filas del CSV creando los clientes sin almacenarlos.
+    
+    Cada fila pasa por crear_cliente_desde_fila(), igual que en la importacion real, y
+    el tiempo informado mide solo ese recorrido. Si el constructor la rechaza, se
+    ejecutan todos los validadores para contar el rechazo por columna; si la acepta, se
+    revisan los controles de VALIDADORES_ADVERTENCIA, que no cuentan como rechazo.
+    
+    Args:
+        reader (csv.DictReader): Lector posicionado despues del encabezado
+    Returns:
+        dict: Informe con las claves filas, validas, rechazadas, rechazos_por_validador,
+            advertencias, segundos, filas_por_segundo, bytes_por_cliente y memoria_estimada
+    """
+    filas = 0
+    validas = 0
+    rechazadas = 0
+    rechazos = {}
+    advertencias = {}
+    bytes_muestra = 0
+    muestra = 0
+    # Tiempo de los diagnosticos, que la importacion real no ejecuta
+    excluido = 0.0
+    
+    inicio = time.perf_counter()
+    for fila in reader:
+        filas += 1
+        try:
+            cliente = crear_cliente_desde_fila(fila)
+        except Exception:
+            diagnostico = time.perf_counter()
+            rechazadas += 1
+            for columna in _validadores_fallidos(fila) or ['fila']:
+                rechazos[columna] = rechazos.get(columna, 0) + 1
+            excluido += time.perf_counter() - diagnostico
+            continue
+        
+        validas += 1
+        diagnostico = time.perf_counter()
+        for columna in _advertencias_fila(fila):
+            advertencias[columna] = advertencias.get(columna, 0) + 1
+        if muestra < MUESTRA_MEMORIA:
+            bytes_muestra += estimar_memoria_cliente(cliente)
+            muestra += 1
+        excluido += time.perf_counter() - diagnostico
+    segundos = time.perf_counter() - inicio - excluido
+    
+    bytes_por_cliente = bytes_muestra // muestra if muestra else 0
+    return {
+        'filas': filas,
+        'validas': validas,
+        'rechazadas': rechazadas,
+        'rechazos_por_validador': rechazos,
+        'advertencias': advertencias,
+        'segundos': segundos,
+        'filas_por_segundo': filas / segundos if segundos > 0 else 0.0,
+        'bytes_por_cliente': bytes_por_cliente,
+        # Cada cliente ocupa ademas una referencia en la lista del gestor
+        'memoria_estimada': validas * (bytes_por_cliente + 8)
+    }
+
+
+def _validadores_fallidos(fila) -> list:
+    """
+    Ejecuta todos los validadores sobre una fila, no solo hasta el primero que falla.
+    
+    Args:
+        fila (dict): Fila del CSV
+    Returns:
+        list: Columnas cuyos validadores fallaron ('tipo' si el tipo es desconocido);
+            vacia si ninguno falla
+    """
+    fallidos = []
+    for campo, validador in VALIDADORES_FILA.items():
+        try:
+            validador((fila.get(campo) or '').strip())
+        except ValidacionError:
+            fallidos.append(campo)
+    
+    try:
+        tipo = obtener_tipo_por_nombre((fila.get('tipo') or '').strip())
+    except FormatoArchivoError:
+        fallidos.append('tipo')
+        return fallidos
+    
+    # Las columnas propias del tipo se validan con la misma conversion que la importacion
+    for columna, (_, _, convertir) in tipo.campos_csv.items():
+        valor = (fila.get(columna) or '').strip()
+        if not valor:
+            continue
+        try:
+            convertir(valor)
+        except (ValidacionError, ValueError, TypeError):
+            fallidos.append(columna)
+    
+    return fallidos
+
+
+def _advertencias_fila(fila) -> list:
+    """
+    Revisa en una fila importable los controles de VALIDADORES_ADVERTENCIA.
+    
+    Args:
+        fila (dict): Fila del CSV, de un tipo conocido
+    Returns:
+        list: Columnas propias del tipo que no cumplen su control
+    """
+    tipo = obtener_tipo_por_nombre((fila.get('tipo') or '').strip())
+    advertencias = []
+    for columna in tipo.campos_csv:
+        validador = VALIDADORES_ADVERTENCIA.get(columna)
+        valor = (fila.get(columna) or '').strip()
+        if validador is None or not valor:
+            continue
+        try:
+            validador(valor)
+        except (ValidacionError, ValueError, TypeError):
+            advertencias.append(columna)
+    return advertencias
+
+
+def estimar_memoria_cliente(cliente) -> int:
+    """
+    Estima los bytes que ocupa un cliente en memoria (objeto, atributos y valores).
+    
+    Args:
+        cliente (Cliente): Objeto Cliente
+    Returns:
+        int: Tamano aproximado en bytes
+    """
+    atributos = vars(cliente)
+    return (sys.getsizeof(cliente) + sys.getsizeof(atributos)
+            + sum(sys.getsizeof(valor) for valor in atributos.values()))
+
+
 def crear_cliente_desde_fila(fila) -> object:
     """
-    Crea un objeto Cliente a partir de una fila del CSV.
+    Crea un objeto Cliente a partir de una fila del CSV, con el decodificador
+    precompilado del tipo indicado en la columna 'tipo'.
     
     Args:
         fila (dict): Diccionario con los datos de la fila
@@ -193,33 +1160,162 @@ def crear_cliente_desde_fila(fila) -> object:
     Raises:
         FormatoArchivoError: Si el tipo de cliente es desconocido
     """
-    tipo = fila.get('tipo', '').strip()
-    nombre = fila.get('nombre', '').strip()
-    email = fila.get('email', '').strip()
-    telefono = fila.get('telefono', '').strip()
-    direccion = fila.get('direccion', '').strip()
+    tipo = (fila.get('tipo') or '').strip()
+    return obtener_tipo_por_nombre(tipo).decodificar_fila(fila)
+
+
+"""
+EXPORTACION E IMPORTACION JSON LINES
+"""
+# Codificador y decodificador reutilizados en todas las lineas
+CODIFICADOR_JSON = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+DECODIFICADOR_JSON = json.JSONDecoder()
+
+
+def exportar_clientes_jsonl(clientes, archivo=None, nivel_compresion=None,
+                            tamano_buffer=TAMANO_BUFFER) -> bool:
+    """
+    Exporta los clientes en formato JSON Lines: un objeto por linea con los datos de
+    obtener_datos(), incluidos los campos propios de cada tipo (puntos_acumulados,
+    nombre_empresa, rut_empresa). Se escribe en streaming, sin armar el archivo en memoria.
+    
+    Args:
+        clientes (iterable): Objetos Cliente a exportar
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_CLIENTES_JSONL
+        nivel_compresion (int, optional): Nivel de compresion 1-9 si la ruta es .gz, .bz2 o .xz
+        tamano_buffer (int): Tamano del buffer de escritura en bytes
+    Returns:
+        bool: True si la exportacion fue exitosa
+    Raises:
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_CLIENTES_JSONL
+    
+    try:
+        crear_directorios()
+        codificar = CODIFICADOR_JSON.encode
+        total = 0
+        with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer, newline='') as file:
+            for cliente in clientes:
+                file.write(codificar(cliente.obtener_datos()) + "\n")
+                total += 1
+        
+        registrar_log(f"EXPORTACION: {total} clientes exportados a {archivo}")
+        return True
     
-    if tipo == "Regular":
-        return ClienteRegular(nombre, email, telefono, direccion)
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al exportar clientes: {str(e)}")
+
+
+def iterar_clientes_jsonl(archivo=None, errores=None, tamano_buffer=TAMANO_BUFFER):
+    """
+    Lee un archivo JSON Lines linea a linea y entrega un Cliente por cada objeto valido.
+    Usa memoria constante, por lo que sirve para archivos de varios GB.
     
-    elif tipo == "Premium":
-        puntos_str = fila.get('puntos', '0').strip()
-        puntos = int(puntos_str) if puntos_str else 0
-        return ClientePremium(nombre, email, telefono, direccion, puntos)
+    Args:
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_CLIENTES_JSONL
+        errores (list, optional): Si se indica, recibe un mensaje por cada linea invalida
+        tamano_buffer (int): Tamano del buffer de lectura en bytes
+    Yields:
+        Cliente: Objeto del tipo correspondiente
+    Raises:
+        ArchivoNoEncontradoError: Si el archivo no existe
+    """
+    if archivo is None:
+        archivo = ARCHIVO_CLIENTES_JSONL
     
-    elif tipo == "Corporativo":
-        empresa = fila.get('empresa', '').strip()
-        rut = fila.get('rut', '').strip()
-        return ClienteCorporativo(nombre, email, telefono, direccion, empresa, rut)
+    if not os.path.exists(archivo):
+        raise ArchivoNoEncontradoError(archivo)
     
-    else:
-        raise FormatoArchivoError("", f"Tipo de cliente desconocido: {tipo}")
+    decodificar = DECODIFICADOR_JSON.decode
+    with abrir_archivo(archivo, 'r', tamano_buffer=tamano_buffer) as file:
+        for num_linea, linea in enumerate(file, start=1):
+            if not linea.strip():
+                continue
+            try:
+                yield crear_cliente_desde_datos(decodificar(linea))
+            except Exception as e:
+                if errores is not None:
+                    errores.append(f"Linea {num_linea}: {str(e)}")
+
+
+def importar_clientes_jsonl(archivo=None, tamano_buffer=TAMANO_BUFFER) -> list:
+    """
+    Importa los clientes de un archivo JSON Lines (ver exportar_clientes_jsonl).
+    
+    Args:
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_CLIENTES_JSONL
+        tamano_buffer (int): Tamano del buffer de lectura en bytes
+    Returns:
+        list: Lista de objetos Cliente creados
+    Raises:
+        ArchivoNoEncontradoError: Si el archivo no existe
+        PermisoArchivoError: Si no hay permisos de lectura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_CLIENTES_JSONL
+    
+    errores = []
+    try:
+        clientes_importados = list(iterar_clientes_jsonl(archivo, errores, tamano_buffer))
+        
+        registrar_log(f"IMPORTACION: {len(clientes_importados)} clientes importados desde {archivo}")
+        if errores:
+            registrar_log(f"IMPORTACION: {len(errores)} errores durante la importacion")
+        return clientes_importados
+    
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "lectura")
+    except ArchivoNoEncontradoError:
+        raise
+    except Exception as e:
+        raise ArchivoError(f"Error al importar clientes: {str(e)}")
+
+
+def crear_cliente_desde_datos(datos) -> object:
+    """
+    Crea un objeto Cliente a partir del diccionario de obtener_datos().
+    
+    Args:
+        datos (dict): Datos del cliente (tipo, nombre, email, telefono, direccion y extras)
+    Returns:
+        Cliente: Objeto del tipo correspondiente (Regular, Premium, Corporativo)
+    Raises:
+        FormatoArchivoError: Si el tipo de cliente es desconocido
+    """
+    return obtener_tipo_por_nombre(datos.get('tipo', '')).desde_datos(datos)
 
 
 """
 GENERACION DE REPORTES
 """
-def generar_reporte(clientes, archivo=None) -> bool:
+# Clientes cuya ficha se arma en memoria antes de cada escritura del reporte
+CLIENTES_POR_BLOQUE = 5000
+
+# Clientes por archivo en el modo paginado
+CLIENTES_POR_PAGINA = 1000
+
+# Modos de generar_reporte
+MODOS_REPORTE = ("completo", "resumen", "paginado")
+
+# Clientes minimos para repartir el reporte entre procesos (con menos, crear el pool cuesta mas)
+MIN_CLIENTES_PARALELO = 50000
+
+_PIE_REPORTE = "\n" + "-" * 60 + "\n" + "Fin del reporte\n" + "=" * 60 + "\n"
+_TITULO_LISTA = "LISTA DE CLIENTES\n" + "-" * 60 + "\n"
+
+
+def generar_reporte(clientes, archivo=None, nivel_compresion=None, 
+                    tamano_buffer=TAMANO_BUFFER, progreso=None,
+                    intervalo_progreso=INTERVALO_PROGRESO, modo="completo",
+                    conteo=None, clientes_por_pagina=CLIENTES_POR_PAGINA, procesos=1,
+                    fichas=None) -> bool:
     """
     Genera un reporte de resumen en formato TXT. El reporte incluye:
     - Fecha y hora de generacion
@@ -227,9 +1323,36 @@ def generar_reporte(clientes, archivo=None) -> bool:
     - Cantidad por tipo de cliente
     - Lista resumida de clientes
     
+    Las fichas se arman por bloques de CLIENTES_POR_BLOQUE clientes en un solo texto
+    que se escribe de una vez (ver _renderizar_bloque). Con 'fichas' (ver capturar_fichas)
+    el reporte se arma con los valores capturados en lugar de leerlos de 'clientes',
+    que se ignora; asi un reporte en otro hilo no ve los cambios posteriores a la captura.
+    Con procesos > 1, en el modo
+    "completo", los bloques se arman en paralelo y se escriben en orden, con el mismo
+    resultado byte a byte (ver _renderizar_en_paralelo). Los procesos se limitan a los
+    nucleos disponibles y solo se crean desde el hilo principal: con un solo nucleo, o
+    si se llama desde otro hilo, el reporte se arma de forma secuencial.
+    
+    Modos:
+        - "completo": resumen y lista de todos los clientes en un solo archivo
+        - "resumen": solo el resumen estadistico. Con 'conteo' no recorre los clientes,
+          por lo que demora lo mismo sin importar cuantos haya
+        - "paginado": la lista se escribe en paginas de 'clientes_por_pagina' clientes
+          (resumen_0001.txt, resumen_0002.txt, ...) a medida que se recorre 'clientes',
+          que puede ser un iterador; 'archivo' queda con el resumen y la cantidad de paginas
+    
     Args:
-        clientes (list): Lista de objetos Cliente
+        clientes (list | iterable): Objetos Cliente (lista en el modo "completo")
         archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_REPORTE
+        nivel_compresion (int, optional): Nivel de compresion 1-9 si la ruta es .gz, .bz2 o .xz
+        tamano_buffer (int): Tamano del buffer de escritura en bytes
+        progreso (function, optional): Callback que recibe el avance (dict, ver MedidorProgreso)
+        intervalo_progreso (int): Clientes entre dos llamadas a progreso
+        modo (str): "completo", "resumen" o "paginado"
+        conteo (dict, optional): Cantidad de clientes por tipo ya calculada (modo "resumen")
+        clientes_por_pagina (int): Clientes por archivo en el modo "paginado"
+        procesos (int): Procesos que arman las fichas en el modo "completo" (1 = secuencial)
+        fichas (tuple, optional): Tipos y fichas capturados con capturar_fichas()
     Returns:
         bool: True si el reporte fue generado exitosamente
     Raises:
@@ -238,64 +1361,65 @@ def generar_reporte(clientes, archivo=None) -> bool:
     """
     if archivo is None:
         archivo = ARCHIVO_REPORTE
+    if modo not in MODOS_REPORTE:
+        raise ValueError(f"Modo de reporte desconocido: {modo}")
     
     try:
         crear_directorios()
+        medidor = None if progreso is None else MedidorProgreso(progreso, "reporte", intervalo_progreso)
         
-        # Cuenta clientes por tipo
-        conteo = {"Regular": 0, "Premium": 0, "Corporativo": 0}
-        for cliente in clientes:
-            tipo = cliente.obtener_tipo()
-            if tipo in conteo:
-                conteo[tipo] += 1
+        if modo == "paginado":
+            pares = map(_par_ficha, clientes) if fichas is None else zip(*fichas)
+            paginas = _generar_paginas(pares, archivo, nivel_compresion, tamano_buffer,
+                                    clientes_por_pagina, medidor)
+            registrar_log(f"REPORTE: Reporte paginado generado en {archivo} ({paginas} paginas)")
+            return True
         
-        # Escribe el reporte
-        with open(archivo, 'w', encoding='utf-8') as file:
-            # Encabezado
-            file.write("=" * 60 + "\n")
-            file.write(" " * 10 + "REPORTE DE CLIENTES - SISTEMA GIC\n")
-            file.write(" " * 15 + "SolutionTech S.A.\n")
-            file.write("=" * 60 + "\n\n")
-            
-            # Fecha de generacion
-            file.write(f"Fecha de generacion: {obtener_timestamp()}\n")
-            file.write("-" * 60 + "\n\n")
-            
-            # Resumen estadistico
-            file.write("RESUMEN ESTADISTICO\n")
-            file.write("-" * 30 + "\n")
-            file.write(f"Total de clientes: {len(clientes)}\n\n")
-            file.write("Distribucion por tipo:\n")
-            file.write(f"  - Clientes Regular:     {conteo['Regular']}\n")
-            file.write(f"  - Clientes Premium:     {conteo['Premium']}\n")
-            file.write(f"  - Clientes Corporativo: {conteo['Corporativo']}\n")
-            file.write("-" * 30 + "\n\n")
-            
-            # Lista de clientes
-            file.write("LISTA DE CLIENTES\n")
-            file.write("-" * 60 + "\n")
+        if modo == "resumen":
+            if conteo is None:
+                conteo = _contar_por_tipo(map(tipo_de, clientes) if fichas is None else fichas[0])
+            with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer) as file:
+                file.write(_renderizar_encabezado(sum(conteo.values()), conteo) + _PIE_REPORTE)
+                if medidor is not None:
+                    medidor.informar(0, _posicion_escritura(file), terminado=True)
+            registrar_log(f"REPORTE: Resumen generado en {archivo}")
+            return True
+        
+        # Resuelve el tipo de cada cliente una sola vez y cuenta por tipo
+        if fichas is None:
+            tipos = list(map(tipo_de, clientes))
+            leer = _lector_fichas(clientes, tipos)
+        else:
+            tipos, capturadas = fichas
+            leer = lambda inicio, fin: capturadas[inicio:fin]
+        total = len(tipos)
+        conteo = _contar_por_tipo(tipos)
+        por_bloque = CLIENTES_POR_BLOQUE if medidor is None else medidor.intervalo
+        
+        with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer) as file:
+            file.write(_renderizar_encabezado(total, conteo) + _TITULO_LISTA)
             
-            if clientes:
-                for i, cliente in enumerate(clientes, 1):
-                    file.write(f"\n{i}. {cliente.nombre}\n")
-                    file.write(f"   Tipo: {cliente.obtener_tipo()}\n")
-                    file.write(f"   Email: {cliente.email}\n")
-                    file.write(f"   Telefono: {cliente.telefono}\n")
-                    file.write(f"   Direccion: {cliente.direccion}\n")
-                    
-                    # Datos adicionales segun tipo
-                    if cliente.obtener_tipo() == "Premium":
-                        file.write(f"   Puntos: {cliente.puntos_acumulados}\n")
-                    elif cliente.obtener_tipo() == "Corporativo":
-                        file.write(f"   Empresa: {cliente.nombre_empresa}\n")
-                        file.write(f"   RUT: {cliente.rut_empresa}\n")
+            if total:
+                inicios = range(0, total, por_bloque)
+                procesos = min(procesos, nucleos_disponibles())
+                if procesos > 1 and total >= MIN_CLIENTES_PARALELO and _puede_bifurcar():
+                    secciones = _renderizar_en_paralelo(leer, tipos, inicios, por_bloque, procesos)
+                else:
+                    secciones = (_renderizar_bloque(leer(inicio, inicio + por_bloque),
+                                                    tipos[inicio:inicio + por_bloque], inicio + 1)
+                                for inicio in inicios)
+                for inicio, texto in zip(inicios, secciones):
+                    file.write(texto)
+                    if medidor is not None:
+                        medidor.informar(min(inicio + por_bloque, total), _posicion_escritura(file))
             else:
                 file.write("No hay clientes registrados.\n")
             
             # Pie del reporte
-            file.write("\n" + "-" * 60 + "\n")
-            file.write("Fin del reporte\n")
-            file.write("=" * 60 + "\n")
+            file.write(_PIE_REPORTE)
+            
+            if medidor is not None:
+                medidor.informar(total, _posicion_escritura(file), terminado=True)
         
         # Registra en el log
         registrar_log(f"REPORTE: Reporte generado en {archivo}")
@@ -308,6 +1432,230 @@ def generar_reporte(clientes, archivo=None) -> bool:
         raise ArchivoError(f"Error al generar reporte: {str(e)}")
 
 
+def capturar_fichas(clientes) -> tuple[list, list]:
+    """
+    Captura los valores que el reporte muestra de cada cliente, para armar el reporte
+    despues (por ejemplo, en otro hilo) tal como estaban los clientes al capturarlos.
+    
+    Args:
+        clientes (iterable): Objetos Cliente
+    Returns:
+        tuple: (tipos, fichas): el TipoCliente de cada cliente y la tupla de valores de su
+            ficha (ver TipoCliente.leer_ficha), en el mismo orden; para generar_reporte(fichas=...)
+    """
+    tipos = list(map(tipo_de, clientes))
+    return tipos, [tipo.leer_ficha(cliente) for tipo, cliente in zip(tipos, clientes)]
+
+
+def _lector_fichas(clientes, tipos):
+    # Lee las fichas de un rango de clientes a medida que se arma cada bloque
+    def leer(inicio, fin):
+        return [tipo.leer_ficha(cliente) for tipo, cliente in zip(tipos[inicio:fin], clientes[inicio:fin])]
+    return leer
+
+
+def _par_ficha(cliente) -> tuple:
+    tipo = tipo_de(cliente)
+    return tipo, tipo.leer_ficha(cliente)
+
+
+# Los procesos del reporte heredan las fichas al crearse (fork) en lugar de recibirlas
+# serializadas: los objetos Cliente no se copian y cada tarea es solo un rango
+_PUEDE_BIFURCAR = "fork" in multiprocessing.get_all_start_methods()
+
+# Lector de fichas y tipos que hereda el pool al crearse (solo durante el fork); el
+# bloqueo evita que dos reportes en paralelo se pisen el valor
+_SECCIONES = None
+_BLOQUEO_SECCIONES = Lock()
+
+
+def nucleos_disponibles() -> int:
+    """
+    Retorna los nucleos que este proceso puede usar (respeta la afinidad de CPU y los
+    limites del contenedor donde el sistema los expone).
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _puede_bifurcar() -> bool:
+    # Hacer fork desde un hilo secundario puede dejar al hijo bloqueado en un lock que
+    # otro hilo tenia tomado, por lo que el pool solo se crea desde el hilo principal
+    return _PUEDE_BIFURCAR and current_thread() is main_thread()
+
+
+def _renderizar_seccion(rango) -> str:
+    # Se ejecuta en un proceso del pool, sobre el lector de fichas heredado en _SECCIONES
+    leer, tipos = _SECCIONES
+    inicio, fin = rango
+    return _renderizar_bloque(leer(inicio, fin), tipos[inicio:fin], inicio + 1)
+
+
+def _renderizar_en_paralelo(leer, tipos, inicios, por_bloque, procesos):
+    """
+    Arma las fichas de cada bloque en un pool de procesos y las entrega en orden, a
+    medida que estan listas. Solo se usa donde los procesos se crean con fork.
+    
+    Yields:
+        str: Texto de cada bloque (el mismo que _renderizar_bloque)
+    """
+    global _SECCIONES
+    with _BLOQUEO_SECCIONES:
+        _SECCIONES = (leer, tipos)
+        try:
+            pool = multiprocessing.get_context("fork").Pool(procesos)
+        finally:
+            _SECCIONES = None
+    
+    with pool:
+        yield from pool.imap(_renderizar_seccion, ((inicio, inicio + por_bloque) for inicio in inicios))
+
+
+def _contar_por_tipo(tipos) -> dict:
+    # Cantidad por nombre de tipo, con todos los tipos registrados (aunque tengan 0)
+    conteo = {tipo.nombre: 0 for tipo in tipos_registrados()}
+    for tipo, cantidad in Counter(tipos).items():
+        conteo[tipo.nombre] += cantidad
+    return conteo
+
+
+def _generar_paginas(pares, archivo, nivel_compresion, tamano_buffer, clientes_por_pagina,
+                    medidor) -> int:
+    """
+    Escribe las paginas del modo paginado recorriendo los pares (tipo, ficha) una sola
+    vez y, al final, el archivo de resumen con el conteo acumulado y la cantidad de paginas.
+    
+    Returns:
+        int: Cantidad de paginas escritas
+    """
+    iterador = iter(pares)
+    conteo = Counter()
+    paginas = 0
+    total = 0
+    total_bytes = 0
+    
+    while True:
+        lote = list(islice(iterador, clientes_por_pagina))
+        if not lote:
+            break
+        tipos, fichas = zip(*lote)
+        conteo.update(tipos)
+        paginas += 1
+        
+        with abrir_archivo(ruta_fragmento(archivo, paginas), 'w', nivel_compresion, tamano_buffer) as file:
+            file.write(f"LISTA DE CLIENTES (pagina {paginas})\n" + "-" * 60 + "\n")
+            for inicio in range(0, len(lote), CLIENTES_POR_BLOQUE):
+                fin = inicio + CLIENTES_POR_BLOQUE
+                file.write(_renderizar_bloque(fichas[inicio:fin], tipos[inicio:fin], total + inicio + 1))
+            file.write("\n" + "-" * 60 + "\n")
+            total_bytes += _posicion_escritura(file)
+        
+        total += len(lote)
+        if medidor is not None:
+            medidor.informar(total, total_bytes)
+    
+    _eliminar_fragmentos_sobrantes(archivo, paginas + 1)
+    
+    with abrir_archivo(archivo, 'w', nivel_compresion, tamano_buffer) as file:
+        file.write(_renderizar_encabezado(total, _contar_por_tipo(conteo.elements())))
+        file.write(f"Paginas: {paginas} ({clientes_por_pagina} clientes por pagina)\n")
+        file.write(_PIE_REPORTE)
+        total_bytes += _posicion_escritura(file)
+    
+    if medidor is not None:
+        medidor.informar(total, total_bytes, terminado=True)
+    return paginas
+
+
+def _renderizar_encabezado(total, conteo) -> str:
+    """
+    Arma el encabezado, la fecha y el resumen por tipo.
+    """
+    lineas = [
+        "=" * 60,
+        " " * 10 + "REPORTE DE CLIENTES - SISTEMA GIC",
+        " " * 15 + "SolutionTech S.A.",
+        "=" * 60,
+        "",
+        f"Fecha de generacion: {obtener_timestamp()}",
+        "-" * 60,
+        "",
+        "RESUMEN ESTADISTICO",
+        "-" * 30,
+        f"Total de clientes: {total}",
+        "",
+        "Distribucion por tipo:"
+    ]
+    lineas += [f"  - Clientes {nombre_tipo + ':':<13}{cantidad}" for nombre_tipo, cantidad in conteo.items()]
+    lineas += ["-" * 30, "", ""]
+    return "\n".join(lineas)
+
+
+def _renderizar_bloque(fichas, tipos, numero_inicial) -> str:
+    """
+    Arma en un solo texto las fichas de un bloque de clientes, cada una con el formato
+    precompilado de su tipo (ver TipoCliente.formatear_ficha).
+    
+    Args:
+        fichas (list): Valores de la ficha de cada cliente (ver TipoCliente.leer_ficha)
+        tipos (list): TipoCliente de cada cliente, en el mismo orden
+        numero_inicial (int): Numero de la primera ficha del bloque
+    Returns:
+        str: Texto de las fichas
+    """
+    return "".join([tipo.formatear_ficha(numero, *ficha)
+                    for numero, ficha, tipo in zip(count(numero_inicial), fichas, tipos)])
+
+
+# Extension del sello que acompana a un reporte (resumen.txt.sello)
+EXTENSION_SELLO = ".sello"
+
+
+def ruta_sello(archivo) -> str:
+    return archivo + EXTENSION_SELLO
+
+
+def reporte_vigente(archivo, sello: dict) -> bool:
+    """
+    Indica si el reporte ya fue generado con el sello indicado (version del gestor y
+    opciones). Cuesta un stat del reporte y la lectura de un sello de pocos bytes; el
+    sello guarda tamano y fecha de modificacion del reporte, por lo que un reporte
+    reescrito por otro medio no se considera vigente.
+    
+    Args:
+        archivo (str): Ruta del reporte
+        sello (dict): Datos que identifican el contenido esperado (serializables a JSON)
+    Returns:
+        bool: True si el reporte existe y corresponde al sello
+    """
+    try:
+        estado = os.stat(archivo)
+        with open(ruta_sello(archivo), 'r', encoding='utf-8') as file:
+            guardado = json.load(file)
+    except (OSError, ValueError):
+        return False
+    return guardado == {**sello, "tamano": estado.st_size, "modificado": estado.st_mtime_ns}
+
+
+def sellar_reporte(archivo, sello: dict):
+    """
+    Escribe el sello de un reporte recien generado (ver reporte_vigente).
+    
+    Args:
+        archivo (str): Ruta del reporte
+        sello (dict): Datos que identifican el contenido (serializables a JSON)
+    Raises:
+        ArchivoError: Si ocurre un error al escribir el sello
+    """
+    try:
+        estado = os.stat(archivo)
+        with open(ruta_sello(archivo), 'w', encoding='utf-8') as file:
+            json.dump({**sello, "tamano": estado.st_size, "modificado": estado.st_mtime_ns}, file)
+    except OSError as e:
+        raise ArchivoError(f"Error al escribir el sello del reporte: {str(e)}")
+
+
 """
 SISTEMA DE LOGGING
 """
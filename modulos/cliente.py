@@ -8,7 +8,8 @@ from modulos.validaciones import (
     validar_nombre,
     validar_email,
     validar_telefono,
-    validar_direccion
+    validar_direccion,
+    extraer_ciudad
 )
 
 class Cliente:
@@ -20,6 +21,9 @@ class Cliente:
         __email (str): Correo electrónico del cliente
         __telefono (str): Número de teléfono del cliente
         __direccion (str): Dirección física del cliente
+        __ciudad (str): Ciudad tomada de la direccion (ver extraer_ciudad), calculada una vez
+            al crear el cliente y en cada cambio de direccion
+        __observador (function): Funcion que se notifica tras cada cambio (ver vincular_observador)
     """
     
     def __init__(self, nombre: str, email: str, telefono: str, direccion: str):
@@ -32,6 +36,8 @@ class Cliente:
         self.__email = email.strip().lower()
         self.__telefono = telefono.strip()
         self.__direccion = direccion.strip()
+        self.__ciudad = extraer_ciudad(self.__direccion)
+        self.__observador = None
     
 
     def __str__(self) -> str:
@@ -48,7 +54,9 @@ class Cliente:
     
     @nombre.setter
     def nombre(self, valor: str):
+        anterior = self.__nombre
         self.__nombre = valor
+        self._notificar_cambio('nombre', anterior)
     
 
     # Email
@@ -58,7 +66,9 @@ class Cliente:
     
     @email.setter
     def email(self, valor: str):
+        anterior = self.__email
         self.__email = valor
+        self._notificar_cambio('email', anterior)
     
 
     # Teléfono
@@ -68,7 +78,9 @@ class Cliente:
     
     @telefono.setter
     def telefono(self, valor: str):
+        anterior = self.__telefono
         self.__telefono = valor
+        self._notificar_cambio('telefono', anterior)
     
 
     # Dirección
@@ -78,7 +90,16 @@ class Cliente:
     
     @direccion.setter
     def direccion(self, valor: str):
+        anterior = self.__direccion
         self.__direccion = valor
+        self.__ciudad = extraer_ciudad(valor)
+        self._notificar_cambio('direccion', anterior)
+
+
+    # Ciudad (solo lectura, se obtiene de la direccion)
+    @property
+    def ciudad(self) -> str:
+        return self.__ciudad
 
 
     """
@@ -95,6 +116,22 @@ class Cliente:
         print("=" * 50)
 
 
+    def vincular_observador(self, observador):
+        """
+        Registra la funcion observador(cliente, campo, valor_anterior), que se llama despues
+        de cada modificacion del cliente. GestorClientes la usa para seguir los cambios.
+        
+        Args:
+            observador (function | None): Funcion a notificar, o None para desvincular
+        """
+        self.__observador = observador
+
+
+    def _notificar_cambio(self, campo: str, anterior):
+        if self.__observador is not None:
+            self.__observador(self, campo, anterior)
+
+
     def obtener_tipo(self) -> str:
         """
         Este método está diseñado para ser sobrescrito por las subclases (default "Cliente").
@@ -5,8 +5,10 @@ Módulo Cliente Corporativo
 """
 from typing import Any
 from modulos.cliente import Cliente
+from modulos.registro_tipos import registrar_tipo_cliente
 
 
+@registrar_tipo_cliente
 class ClienteCorporativo(Cliente):
     """
     Hereda de la clase Cliente y agrega funcionalidades para empresas como datos de facturación y descuentos corporativos.
@@ -25,6 +27,12 @@ class ClienteCorporativo(Cliente):
     """
     TIPO_CLIENTE = "Corporativo"
     DESCUENTO = 0.25 # 25% de descuento
+    # Serializacion: columna CSV -> (atributo, parametro del constructor, conversion)
+    CAMPOS_CSV = {
+        'empresa': ('nombre_empresa', 'nombre_empresa', str),
+        'rut': ('rut_empresa', 'rut_empresa', str)
+    }
+    CAMPOS_REPORTE = {'Empresa': 'nombre_empresa', 'RUT': 'rut_empresa'}
     
 
     def __init__(self, nombre: str, email: str, telefono: str, 
@@ -52,7 +60,9 @@ class ClienteCorporativo(Cliente):
 
     @nombre_empresa.setter
     def nombre_empresa(self, valor: str):
+        anterior = self.__nombre_empresa
         self.__nombre_empresa = valor
+        self._notificar_cambio('nombre_empresa', anterior)
 
 
     # RUT Empresa
@@ -62,7 +72,9 @@ class ClienteCorporativo(Cliente):
     
     @rut_empresa.setter
     def rut_empresa(self, valor: str):
+        anterior = self.__rut_empresa
         self.__rut_empresa = valor
+        self._notificar_cambio('rut_empresa', anterior)
     
 
     """
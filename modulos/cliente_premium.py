@@ -5,8 +5,10 @@ Módulo Cliente Premium
 """
 from typing import Any
 from modulos.cliente import Cliente
+from modulos.registro_tipos import registrar_tipo_cliente
 
 
+@registrar_tipo_cliente
 class ClientePremium(Cliente):
     """
     Hereda de la clase base Cliente y agrega funcionalidades premium como programa de puntos y descuentos especiales.
@@ -25,6 +27,9 @@ class ClientePremium(Cliente):
     """
     TIPO_CLIENTE = "Premium"
     DESCUENTO = 0.15  # 15% de descuento
+    # Serializacion: columna CSV -> (atributo, parametro del constructor, conversion)
+    CAMPOS_CSV = {'puntos': ('puntos_acumulados', 'puntos_iniciales', int)}
+    CAMPOS_REPORTE = {'Puntos': 'puntos_acumulados'}
     
 
     def __init__(self, nombre: str, email: str, telefono: str, 
@@ -112,7 +117,9 @@ class ClientePremium(Cliente):
             puntos (int): Cantidad de puntos a agregar
         """
         if puntos > 0:
+            anterior = self.__puntos_acumulados
             self.__puntos_acumulados += puntos
+            self._notificar_cambio('puntos_acumulados', anterior)
             print(f"[OK] Se agregaron {puntos} puntos. Total: {self.__puntos_acumulados} pts")
     
 
@@ -126,7 +133,9 @@ class ClientePremium(Cliente):
             bool: True si se pudieron canjear, False si no hay suficientes
         """
         if puntos <= self.__puntos_acumulados:
+            anterior = self.__puntos_acumulados
             self.__puntos_acumulados -= puntos
+            self._notificar_cambio('puntos_acumulados', anterior)
             print(f"[OK] Se canjearon {puntos} puntos. Restantes: {self.__puntos_acumulados} pts")
             return True
         else:
@@ -5,8 +5,10 @@ Módulo Cliente Regular
 """
 from typing import Any
 from modulos.cliente import Cliente
+from modulos.registro_tipos import registrar_tipo_cliente
 
 
+@registrar_tipo_cliente
 class ClienteRegular(Cliente):
     """
     Hereda de la clase base Cliente sin agregar atributos adicionales.
@@ -21,6 +23,7 @@ class ClienteRegular(Cliente):
     """
     TIPO_CLIENTE = "Regular"
     DESCUENTO = 0.0
+    CAMPOS_CSV = {}
     
 
     def __init__(self, nombre: str, email: str, telefono: str, direccion: str):
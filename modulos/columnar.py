@@ -0,0 +1,281 @@
+"""
+===============
+Módulo columnar
+===============
+Exportacion de clientes a un formato binario columnar para analitica.
+
+Cada campo se guarda como una columna contigua, de modo que un proceso que solo
+necesita 'tipo' y 'puntos_acumulados' lee esas columnas sin tocar el resto:
+
+    [MAGIA][columna 1][columna 2]...[pie JSON][largo del pie: uint64][MAGIA]
+
+Codificaciones:
+    - "entero": array de int64
+    - "texto": desplazamientos uint64 (n + 1) seguidos de los bytes UTF-8
+    - "diccionario": codigos uint32 por fila + los valores distintos como "texto"
+
+El pie JSON indica, para cada columna, su codificacion y la posicion de cada segmento.
+NumPy es opcional: si esta instalado, leer_columna() retorna arrays de NumPy.
+"""
+import os
+import sys
+import json
+import struct
+from array import array
+from modulos.archivos import (
+    DATOS_DIR,
+    crear_directorios,
+    registrar_log
+)
+from modulos.registro_tipos import tipo_de
+from modulos.excepciones import (
+    ArchivoError,
+    ArchivoNoEncontradoError,
+    PermisoArchivoError,
+    FormatoArchivoError
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+ARCHIVO_COLUMNAR = os.path.join(DATOS_DIR, "clientes.gicc")
+
+MAGIA = b"GICCOL01"
+LARGO_PIE = struct.Struct("<Q")
+
+# Columnas exportadas y su codificacion
+COLUMNAS = {
+    'tipo': "diccionario",
+    'nombre': "texto",
+    'email_usuario': "texto",
+    'email_dominio': "diccionario",
+    'telefono': "texto",
+    'direccion': "texto",
+    'puntos_acumulados': "entero",
+    'empresa': "diccionario",
+    'rut': "diccionario"
+}
+
+
+"""
+CODIFICADORES DE COLUMNA
+"""
+class _ColumnaTexto:
+    def __init__(self):
+        self.desplazamientos = array('Q', [0])
+        self.datos = bytearray()
+
+    def agregar(self, valor: str):
+        self.datos += valor.encode('utf-8')
+        self.desplazamientos.append(len(self.datos))
+
+    def segmentos(self) -> list:
+        return [("desplazamientos", self.desplazamientos.tobytes()), ("datos", bytes(self.datos))]
+
+
+class _ColumnaDiccionario:
+    def __init__(self):
+        self.codigos = array('I')
+        self.indice = {}
+        self.valores = _ColumnaTexto()
+
+    def agregar(self, valor: str):
+        codigo = self.indice.get(valor)
+        if codigo is None:
+            codigo = self.indice[valor] = len(self.indice)
+            self.valores.agregar(valor)
+        self.codigos.append(codigo)
+
+    def segmentos(self) -> list:
+        return [("codigos", self.codigos.tobytes())] + self.valores.segmentos()
+
+
+class _ColumnaEntero:
+    def __init__(self):
+        self.valores = array('q')
+
+    def agregar(self, valor: int):
+        self.valores.append(valor)
+
+    def segmentos(self) -> list:
+        return [("valores", self.valores.tobytes())]
+
+
+CODIFICADORES = {
+    "texto": _ColumnaTexto,
+    "diccionario": _ColumnaDiccionario,
+    "entero": _ColumnaEntero
+}
+
+
+"""
+EXPORTACION
+"""
+def exportar_clientes_columnar(clientes, archivo=None) -> bool:
+    """
+    Exporta los clientes al formato binario columnar.
+
+    Args:
+        clientes (iterable): Objetos Cliente a exportar
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_COLUMNAR
+    Returns:
+        bool: True si la exportacion fue exitosa
+    Raises:
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_COLUMNAR
+
+    try:
+        columnas = {nombre: CODIFICADORES[codificacion]() for nombre, codificacion in COLUMNAS.items()}
+        agregar = {nombre: columna.agregar for nombre, columna in columnas.items()}
+
+        filas = 0
+        for cliente in clientes:
+            usuario, _, dominio = cliente.email.partition("@")
+            agregar['tipo'](tipo_de(cliente).nombre)
+            agregar['nombre'](cliente.nombre)
+            agregar['email_usuario'](usuario)
+            agregar['email_dominio'](dominio)
+            agregar['telefono'](cliente.telefono)
+            agregar['direccion'](cliente.direccion)
+            agregar['puntos_acumulados'](getattr(cliente, 'puntos_acumulados', 0))
+            agregar['empresa'](getattr(cliente, 'nombre_empresa', ''))
+            agregar['rut'](getattr(cliente, 'rut_empresa', ''))
+            filas += 1
+
+        crear_directorios()
+        pie = {"filas": filas, "orden_bytes": sys.byteorder, "columnas": {}}
+        with open(archivo, 'wb') as file:
+            file.write(MAGIA)
+            for nombre, columna in columnas.items():
+                ubicacion = {"codificacion": COLUMNAS[nombre]}
+                for segmento, datos in columna.segmentos():
+                    ubicacion[segmento] = [file.tell(), len(datos)]
+                    file.write(datos)
+                pie["columnas"][nombre] = ubicacion
+
+            datos_pie = json.dumps(pie).encode('utf-8')
+            file.write(datos_pie)
+            file.write(LARGO_PIE.pack(len(datos_pie)))
+            file.write(MAGIA)
+
+        registrar_log(f"EXPORTACION: {filas} clientes exportados en formato columnar a {archivo}")
+        return True
+
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al exportar clientes: {str(e)}")
+
+
+"""
+LECTURA
+"""
+def leer_pie(archivo=None) -> dict:
+    """
+    Lee el pie del archivo columnar (cantidad de filas y ubicacion de cada columna).
+
+    Raises:
+        ArchivoNoEncontradoError: Si el archivo no existe
+        FormatoArchivoError: Si el archivo no tiene formato columnar
+    """
+    if archivo is None:
+        archivo = ARCHIVO_COLUMNAR
+    if not os.path.exists(archivo):
+        raise ArchivoNoEncontradoError(archivo)
+
+    with open(archivo, 'rb') as file:
+        return _leer_pie(file, archivo)
+
+
+def _leer_pie(file, archivo) -> dict:
+    cola = len(MAGIA) + LARGO_PIE.size
+    file.seek(0, os.SEEK_END)
+    if file.tell() < len(MAGIA) + cola:
+        raise FormatoArchivoError(archivo, "Archivo columnar incompleto")
+
+    file.seek(-cola, os.SEEK_END)
+    final = file.read(cola)
+    if final[LARGO_PIE.size:] != MAGIA:
+        raise FormatoArchivoError(archivo, "No es un archivo columnar del sistema GIC")
+
+    (largo,) = LARGO_PIE.unpack(final[:LARGO_PIE.size])
+    file.seek(-(cola + largo), os.SEEK_END)
+    return json.loads(file.read(largo).decode('utf-8'))
+
+
+def _leer_segmento(file, ubicacion, codigo_tipo, orden_bytes) -> array:
+    inicio, largo = ubicacion
+    file.seek(inicio)
+    valores = array(codigo_tipo)
+    valores.frombytes(file.read(largo))
+    if orden_bytes != sys.byteorder:
+        valores.byteswap()
+    return valores
+
+
+def _leer_textos(file, ubicacion, orden_bytes) -> list:
+    desplazamientos = _leer_segmento(file, ubicacion["desplazamientos"], 'Q', orden_bytes)
+    inicio, largo = ubicacion["datos"]
+    file.seek(inicio)
+    datos = file.read(largo)
+    return [datos[desplazamientos[i]:desplazamientos[i + 1]].decode('utf-8')
+            for i in range(len(desplazamientos) - 1)]
+
+
+def leer_columna(nombre: str, archivo=None, como_codigos: bool = False):
+    """
+    Carga una sola columna del archivo columnar, leyendo unicamente sus bytes.
+
+    Args:
+        nombre (str): Nombre de la columna (ver COLUMNAS)
+        archivo (str, optional): Ruta del archivo. Por defecto usa ARCHIVO_COLUMNAR
+        como_codigos (bool): Para columnas de diccionario, retorna (codigos, valores)
+            en lugar de decodificar cada fila
+    Returns:
+        Con NumPy: numpy.ndarray (int64 para enteros, object para textos).
+        Sin NumPy: array('q') para enteros y list para textos.
+        Con como_codigos=True: tupla (codigos, valores distintos).
+    Raises:
+        ArchivoNoEncontradoError: Si el archivo no existe
+        FormatoArchivoError: Si la columna no existe o el archivo no es valido
+    """
+    if archivo is None:
+        archivo = ARCHIVO_COLUMNAR
+    if not os.path.exists(archivo):
+        raise ArchivoNoEncontradoError(archivo)
+
+    with open(archivo, 'rb') as file:
+        pie = _leer_pie(file, archivo)
+        ubicacion = pie["columnas"].get(nombre)
+        if ubicacion is None:
+            raise FormatoArchivoError(archivo, f"Columna inexistente: {nombre}")
+        orden = pie["orden_bytes"]
+        codificacion = ubicacion["codificacion"]
+
+        if codificacion == "entero":
+            valores = _leer_segmento(file, ubicacion["valores"], 'q', orden)
+            return np.frombuffer(valores, dtype=np.int64) if np is not None else valores
+
+        if codificacion == "texto":
+            textos = _leer_textos(file, ubicacion, orden)
+            return np.array(textos, dtype=object) if np is not None else textos
+
+        codigos = _leer_segmento(file, ubicacion["codigos"], 'I', orden)
+        diccionario = _leer_textos(file, ubicacion, orden)
+
+    if np is not None:
+        codigos = np.frombuffer(codigos, dtype=np.uint32)
+        if como_codigos:
+            return codigos, np.array(diccionario, dtype=object)
+        return np.array(diccionario, dtype=object)[codigos]
+
+    if como_codigos:
+        return codigos, diccionario
+    return [diccionario[codigo] for codigo in codigos]
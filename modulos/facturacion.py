@@ -0,0 +1,183 @@
+"""
+==================
+Módulo facturacion
+==================
+Extraccion masiva de los datos de facturacion de los clientes corporativos.
+
+Los clientes se agrupan por RUT de empresa y cada empresa produce un registro de
+factura (el primer contacto registrado es el de facturacion). Los registros se reparten
+en 'num_particiones' archivos segun el hash CRC32 del RUT y cada archivo se escribe
+armando los registros por lotes a medida que escribe, sin tenerlos todos en memoria.
+Un manifiesto (manifiesto.json) indica los registros, bytes y SHA-256 de cada archivo.
+
+Los archivos se escriben uno tras otro: armar los registros CSV o JSON ocupa el GIL,
+y con 300.000 corporativos cuatro hilos tardaban lo mismo (CSV) o mas (JSONL) que uno.
+"""
+import io
+import os
+import csv
+import json
+import zlib
+import hashlib
+from itertools import islice
+from operator import attrgetter
+from modulos.archivos import (
+    DATOS_DIR,
+    TAMANO_BUFFER,
+    FILAS_POR_ESCRITURA,
+    ARCHIVO_MANIFIESTO,
+    CODIFICADOR_JSON,
+    obtener_timestamp,
+    registrar_log
+)
+from modulos.excepciones import ArchivoError, PermisoArchivoError
+
+
+FACTURAS_DIR = os.path.join(DATOS_DIR, "facturas")
+
+FORMATOS_FACTURA = ("csv", "jsonl")
+
+# Cantidad de archivos de facturas por defecto (particiones por CRC32 del RUT)
+NUM_PARTICIONES_FACTURAS = 4
+
+COLUMNAS_FACTURA = ['rut_empresa', 'nombre_empresa', 'direccion', 'contacto', 'email',
+                    'contactos', 'emails']
+
+# Separador de los emails de todos los contactos de una empresa
+SEPARADOR_EMAILS = ";"
+
+_CAMPOS_FACTURA = attrgetter('nombre_empresa', 'direccion', 'nombre', 'email')
+
+
+def agrupar_por_rut(clientes) -> dict:
+    """
+    Agrupa clientes corporativos por RUT de empresa (normalizado en mayusculas).
+
+    Args:
+        clientes (iterable): Clientes con 'rut_empresa'
+    Returns:
+        dict: RUT -> lista de clientes, en el orden en que aparecen
+    """
+    grupos = {}
+    for cliente in clientes:
+        grupos.setdefault(cliente.rut_empresa.strip().upper(), []).append(cliente)
+    return grupos
+
+
+def _registros_factura(grupos):
+    # Un registro (lista en el orden de COLUMNAS_FACTURA) por empresa
+    for rut, contactos in grupos:
+        nombre_empresa, direccion, contacto, email = _CAMPOS_FACTURA(contactos[0])
+        emails = SEPARADOR_EMAILS.join(cliente.email for cliente in contactos)
+        yield [rut, nombre_empresa, direccion, contacto, email, len(contactos), emails]
+
+
+def _escribir_facturas(ruta, grupos, formato, tamano_buffer) -> dict:
+    """
+    Escribe los registros de factura de un grupo de empresas por lotes de
+    FILAS_POR_ESCRITURA y calcula su SHA-256 a medida que escribe.
+
+    Returns:
+        dict: archivo, registros, bytes y sha256 del archivo
+    """
+    resumen = hashlib.sha256()
+    total_bytes = 0
+    texto = io.StringIO()
+    writer = csv.writer(texto)
+    if formato == "csv":
+        writer.writerow(COLUMNAS_FACTURA)  # Se escribe junto con el primer lote
+    codificar = CODIFICADOR_JSON.encode
+
+    registros = _registros_factura(grupos)
+    with open(ruta, 'wb', buffering=tamano_buffer) as file:
+        while True:
+            lote = list(islice(registros, FILAS_POR_ESCRITURA))
+            if formato == "csv":
+                writer.writerows(lote)
+            else:
+                texto.write("".join(codificar(dict(zip(COLUMNAS_FACTURA, registro))) + "\n"
+                                    for registro in lote))
+            datos = texto.getvalue().encode('utf-8')
+            texto.seek(0)
+            texto.truncate()
+
+            resumen.update(datos)
+            file.write(datos)
+            total_bytes += len(datos)
+            if len(lote) < FILAS_POR_ESCRITURA:
+                break
+
+    return {
+        "archivo": os.path.basename(ruta),
+        "registros": len(grupos),
+        "bytes": total_bytes,
+        "sha256": resumen.hexdigest()
+    }
+
+
+def extraer_facturas(clientes, directorio=None, formato="csv", num_particiones=NUM_PARTICIONES_FACTURAS,
+                    tamano_buffer=TAMANO_BUFFER) -> dict:
+    """
+    Extrae los datos de facturacion de los clientes corporativos, agrupados por RUT, en
+    'num_particiones' archivos (facturas_000.csv, ...) mas un manifiesto. Cada empresa
+    queda en un solo archivo. Se eliminan los archivos de extracciones anteriores que
+    el manifiesto nuevo no describe (de mas particiones o del otro formato).
+
+    Args:
+        clientes (iterable): Clientes corporativos (con 'rut_empresa' y 'nombre_empresa')
+        directorio (str, optional): Directorio de destino. Por defecto usa FACTURAS_DIR
+        formato (str): "csv" o "jsonl"
+        num_particiones (int): Cantidad de archivos
+        tamano_buffer (int): Tamano del buffer de escritura de cada archivo
+    Returns:
+        dict: Manifiesto de la extraccion
+    Raises:
+        ArchivoError: Si ocurre un error al escribir los archivos
+        PermisoArchivoError: Si no hay permisos de escritura
+        ValueError: Si el formato es desconocido o 'num_particiones' es menor que 1
+    """
+    if directorio is None:
+        directorio = FACTURAS_DIR
+    if formato not in FORMATOS_FACTURA:
+        raise ValueError(f"Formato de facturas desconocido: {formato}")
+    if num_particiones < 1:
+        raise ValueError("La cantidad de particiones debe ser mayor que cero")
+
+    # Reparte las empresas: todos los contactos de un RUT van al mismo archivo
+    particiones = [[] for _ in range(num_particiones)]
+    for rut, contactos in agrupar_por_rut(clientes).items():
+        particiones[zlib.crc32(rut.encode('utf-8')) % num_particiones].append((rut, contactos))
+
+    try:
+        os.makedirs(directorio, exist_ok=True)
+        resultados = [_escribir_facturas(os.path.join(directorio, f"facturas_{numero:03d}.{formato}"),
+                                        grupos, formato, tamano_buffer)
+                    for numero, grupos in enumerate(particiones)]
+
+        # Archivos sobrantes de una extraccion anterior con mas particiones o en otro formato
+        for otro in FORMATOS_FACTURA:
+            numero = num_particiones if otro == formato else 0
+            while os.path.exists(os.path.join(directorio, f"facturas_{numero:03d}.{otro}")):
+                os.remove(os.path.join(directorio, f"facturas_{numero:03d}.{otro}"))
+                numero += 1
+
+        manifiesto = {
+            "formato": formato,
+            "generado": obtener_timestamp(),
+            "columnas": COLUMNAS_FACTURA,
+            "total_registros": sum(r["registros"] for r in resultados),
+            "total_contactos": sum(len(contactos) for grupos in particiones for _, contactos in grupos),
+            "particiones": resultados
+        }
+        with open(os.path.join(directorio, ARCHIVO_MANIFIESTO), 'w', encoding='utf-8') as file:
+            json.dump(manifiesto, file, indent=2, ensure_ascii=False)
+
+        registrar_log(f"FACTURACION: {manifiesto['total_registros']} empresas extraidas en "
+                    f"{len(resultados)} archivos {formato} a {directorio}")
+        return manifiesto
+
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(directorio, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al extraer facturas: {str(e)}")
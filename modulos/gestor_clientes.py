@@ -3,16 +3,47 @@
 Módulo Gestión de Clientes
 ==========================
 """
+import time
+import uuid
+from contextlib import contextmanager
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from modulos.cliente import Cliente
+from modulos.cliente_premium import ClientePremium
+from modulos.cliente_corporativo import ClienteCorporativo
+from modulos.registro_tipos import tipos_registrados
+from modulos.validaciones import extraer_ciudad, normalizar_ciudad
 from modulos.archivos import (
     exportar_clientes_csv,
+    exportar_clientes_particionado,
+    exportar_cambios_csv,
+    exportar_clientes_sqlite,
     importar_clientes_csv,
+    exportar_clientes_jsonl,
+    importar_clientes_jsonl,
     generar_reporte,
+    capturar_fichas,
+    CLIENTES_POR_PAGINA,
+    ARCHIVO_REPORTE,
+    reporte_vigente,
+    sellar_reporte,
     registrar_alta_cliente,
     registrar_baja_cliente,
     registrar_modificacion_cliente,
     registrar_error
 )
+from modulos.columnar import exportar_clientes_columnar
+from modulos.indice_csv import exportar_csv_indexado
+from modulos.facturacion import extraer_facturas, NUM_PARTICIONES_FACTURAS
+from modulos.historial import agregar_instantanea, consultar_historial, ARCHIVO_HISTORIAL
+from modulos.analitica import (
+    generar_reporte_analitico,
+    generar_ranking_puntos,
+    ranking_puntos,
+    TOP_ANALITICA,
+    TOP_RANKING
+)
 
 
 class GestorClientes:
@@ -21,10 +52,39 @@ class GestorClientes:
     
     Atributos privados:
         __clientes (list): Lista que almacena objetos Cliente
+        __secuencia (int): Numero del ultimo cambio (crece con cada alta, modificacion o baja)
+        __cambios (OrderedDict): Email -> (secuencia, fecha, operacion, cliente | None) del
+            ultimo cambio de cada cliente, ordenado por secuencia. Las bajas quedan como lapidas
+        __por_tipo (defaultdict): Tipo -> clientes de ese tipo (dict usado como conjunto
+            ordenado por alta), actualizado en cada alta y baja
+        __por_ciudad (defaultdict): Ciudad (Cliente.ciudad, "" si no tiene) -> clientes de esa
+            ciudad, actualizado en cada alta, baja y cambio de direccion
+        __identificador (str): Identifica a esta instancia en los sellos de los reportes, para
+            que la version de otra sesion no se confunda con la actual
+        __ejecutor (ThreadPoolExecutor | None): Hilo que genera los reportes en segundo plano
+        __reporte_en_curso (Future | None): Ultimo reporte pedido en segundo plano
+        __total_puntos (int): Suma de los puntos acumulados, actualizada con cada cambio
+        __historial (str | None): Archivo del historial de estadisticas (None = desactivado)
+        __intervalo_historial (float | None): Segundos minimos entre dos registros automaticos
+        __ultimo_historial (float): Momento (time.monotonic) del ultimo registro del historial
+        __operaciones_masivas (int): Importaciones u operaciones sobre todos los clientes en
+            curso; mientras haya alguna no se registra el historial por intervalo
     """
     
     def __init__(self):
         self.__clientes = []
+        self.__secuencia = 0
+        self.__cambios = OrderedDict()
+        self.__por_tipo = defaultdict(dict)
+        self.__por_ciudad = defaultdict(dict)
+        self.__identificador = uuid.uuid4().hex
+        self.__ejecutor = None
+        self.__reporte_en_curso = None
+        self.__total_puntos = 0
+        self.__historial = None
+        self.__intervalo_historial = None
+        self.__ultimo_historial = 0.0
+        self.__operaciones_masivas = 0
 
 
     """
@@ -37,6 +97,125 @@ class GestorClientes:
     @property
     def total_clientes(self) -> int:
         return len(self.__clientes)
+    
+    @property
+    def secuencia_cambios(self) -> int:  # Secuencia del ultimo cambio registrado
+        return self.__secuencia
+    
+    @property
+    def version(self) -> int:  # Crece con cada alta, modificacion o baja
+        return self.__secuencia
+    
+    @property
+    def reporte_en_curso(self) -> Future | None:  # Ultimo reporte pedido en segundo plano
+        return self.__reporte_en_curso
+
+
+    """
+    SEGUIMIENTO DE CAMBIOS
+    """
+    def __registrar_cambio(self, email: str, operacion: str, cliente: Cliente | None):
+        self.__secuencia += 1
+        email = email.lower()
+        self.__cambios[email] = (self.__secuencia, datetime.now(), operacion, cliente)
+        self.__cambios.move_to_end(email)
+        if not self.__operaciones_masivas:
+            self.__verificar_intervalo_historial()
+
+
+    @contextmanager
+    def __operacion_masiva(self):
+        # El historial por intervalo se revisa una sola vez al terminar, para no registrar
+        # una carga o una operacion sobre todos los clientes a medio hacer
+        self.__operaciones_masivas += 1
+        try:
+            yield
+        finally:
+            self.__operaciones_masivas -= 1
+        if not self.__operaciones_masivas:
+            self.__verificar_intervalo_historial()
+
+
+    def __observar_cambio(self, cliente: Cliente, campo: str, anterior):
+        # Notificado por el cliente tras cada modificacion (ver Cliente.vincular_observador)
+        if campo == 'email':
+            self.__registrar_cambio(anterior, 'baja', None)
+            self.__registrar_cambio(cliente.email, 'alta', cliente)
+        else:
+            if campo == 'puntos_acumulados':
+                self.__total_puntos += cliente.puntos_acumulados - anterior
+            elif campo == 'direccion':
+                ciudad_anterior = extraer_ciudad(anterior)
+                if ciudad_anterior != cliente.ciudad:
+                    self.__quitar_de_ciudad(cliente, ciudad_anterior)
+                    self.__por_ciudad[cliente.ciudad][cliente] = None
+            self.__registrar_cambio(cliente.email, 'modificacion', cliente)
+
+
+    def __incorporar(self, cliente: Cliente):
+        self.__clientes.append(cliente)
+        self.__por_tipo[cliente.obtener_tipo()][cliente] = None
+        self.__por_ciudad[cliente.ciudad][cliente] = None
+        self.__total_puntos += getattr(cliente, 'puntos_acumulados', 0)
+        cliente.vincular_observador(self.__observar_cambio)
+        self.__registrar_cambio(cliente.email, 'alta', cliente)
+
+
+    def __retirar(self, cliente: Cliente):
+        self.__por_tipo[cliente.obtener_tipo()].pop(cliente, None)
+        self.__quitar_de_ciudad(cliente, cliente.ciudad)
+        self.__total_puntos -= getattr(cliente, 'puntos_acumulados', 0)
+        cliente.vincular_observador(None)
+        self.__registrar_cambio(cliente.email, 'baja', None)
+
+
+    def __quitar_de_ciudad(self, cliente: Cliente, ciudad: str):
+        clientes = self.__por_ciudad.get(ciudad)
+        if clientes is not None:
+            clientes.pop(cliente, None)
+            if not clientes:  # Las ciudades sin clientes no quedan en el indice
+                del self.__por_ciudad[ciudad]
+
+
+    def __verificar_intervalo_historial(self):
+        if (self.__intervalo_historial is not None
+                and time.monotonic() - self.__ultimo_historial >= self.__intervalo_historial):
+            self.__registrar_historial()
+
+
+    def __registrar_historial(self):
+        # Registro automatico (por intervalo o al exportar): un error no interrumpe la operacion
+        try:
+            self.registrar_estadisticas()
+        except Exception as e:
+            registrar_error(e, "registrar_estadisticas")
+
+
+    def cambios_desde(self, desde_secuencia: int = 0, desde_fecha=None) -> list:
+        """
+        Retorna el ultimo cambio de cada cliente modificado despues de la secuencia (o
+        la fecha) indicada. Los cambios se recorren desde el mas reciente, por lo que el
+        costo es proporcional a la cantidad de cambios retornados.
+        
+        Args:
+            desde_secuencia (int): Se incluyen los cambios con secuencia mayor
+            desde_fecha (datetime | str, optional): Se incluyen los cambios posteriores (ISO 8601)
+        Returns:
+            list: Tuplas (secuencia, fecha, operacion, email, cliente | None) en orden de
+                secuencia; operacion es 'alta', 'modificacion' o 'baja' (cliente None)
+        """
+        if isinstance(desde_fecha, str):
+            desde_fecha = datetime.fromisoformat(desde_fecha)
+        
+        cambios = []
+        for email in reversed(self.__cambios):
+            secuencia, fecha, operacion, cliente = self.__cambios[email]
+            if secuencia <= desde_secuencia or (desde_fecha is not None and fecha <= desde_fecha):
+                break
+            cambios.append((secuencia, fecha, operacion, email, cliente))
+        
+        cambios.reverse()
+        return cambios
 
 
     """
@@ -58,7 +237,7 @@ class GestorClientes:
                 print(f"\n[X] Error: Ya existe un cliente con el email '{cliente.email}'.")
             return False
         
-        self.__clientes.append(cliente)
+        self.__incorporar(cliente)
         if not silencioso:
             print(f"\n[OK] Cliente '{cliente.nombre}' agregado exitosamente.")
 
@@ -186,6 +365,7 @@ class GestorClientes:
         nombre_cliente = cliente.nombre
         registrar_baja_cliente(cliente) # Registra en log antes de eliminar
         self.__clientes.remove(cliente)
+        self.__retirar(cliente)
         print(f"\n[OK] Cliente '{nombre_cliente}' eliminado exitosamente.")
         return True
 
@@ -199,7 +379,10 @@ class GestorClientes:
 
     def limpiar_lista(self):
         cantidad = self.total_clientes
-        self.__clientes.clear()
+        with self.__operacion_masiva():
+            for cliente in self.__clientes:
+                self.__retirar(cliente)
+            self.__clientes.clear()
         print(f"\n[OK] Se eliminaron {cantidad} cliente(s) del sistema.")
 
 
@@ -209,8 +392,9 @@ class GestorClientes:
     def obtener_clientes_por_tipo(self, tipo: str) -> list:
         """
         Cada cliente tiene su propio metodo obtener_tipo() que retorna su tipo especifico.
+        Los clientes de cada tipo se mantienen agrupados, por lo que no se recorre la lista.
         """
-        return [c for c in self.__clientes if c.obtener_tipo() == tipo]
+        return list(self.__por_tipo.get(tipo, ()))
     
 
     def listar_por_tipo(self, tipo: str):
@@ -235,15 +419,64 @@ class GestorClientes:
         print("=" * 60)
     
 
+    def obtener_clientes_por_ciudad(self, ciudad: str) -> list:
+        """
+        Retorna los clientes de una ciudad desde el indice por ciudad, sin recorrer la
+        lista ni volver a leer las direcciones. El nombre se normaliza igual que las
+        ciudades de los clientes ("iquique" encuentra a "Iquique").
+        
+        Args:
+            ciudad (str): Nombre de la ciudad ("" para los clientes sin ciudad)
+        Returns:
+            list: Clientes de la ciudad, en orden de alta
+        """
+        return list(self.__por_ciudad.get(normalizar_ciudad(ciudad), ()))
+    
+
+    def conteo_por_ciudad(self) -> dict[str, int]:
+        """
+        Retorna la cantidad de clientes por ciudad, de mayor a menor, desde el indice por
+        ciudad. Los clientes cuya direccion no incluye ciudad se cuentan en "".
+        """
+        conteo = {ciudad: len(clientes) for ciudad, clientes in self.__por_ciudad.items()}
+        return dict(sorted(conteo.items(), key=lambda item: (-item[1], item[0])))
+    
+
+    def listar_por_ciudad(self, ciudad: str):
+        """
+        Muestra solo los clientes de la ciudad indicada.
+        """
+        clientes_filtrados = self.obtener_clientes_por_ciudad(ciudad)
+        
+        if not clientes_filtrados:
+            print(f"\n[!] No hay clientes registrados en '{ciudad}'.")
+            return
+        
+        print("\n" + "=" * 60)
+        print(f" " * 10 + f"CLIENTES EN: {clientes_filtrados[0].ciudad.upper()}")
+        print("=" * 60)
+
+        for cliente in clientes_filtrados:
+            cliente.mostrar_info()
+
+        print("=" * 60)
+        print(f"Total clientes en {clientes_filtrados[0].ciudad}: {len(clientes_filtrados)}")
+        print("=" * 60)
+    
+
+    def conteo_por_tipo(self) -> dict[str, int]:
+        """
+        Retorna la cantidad de clientes de cada tipo registrado (incluso los que tienen 0).
+        Usa los grupos por tipo que se mantienen en cada alta y baja, sin recorrer los clientes.
+        """
+        return {tipo.nombre: len(self.__por_tipo[tipo.nombre]) for tipo in tipos_registrados()}
+    
+
     def mostrar_estadisticas(self):
         """
         Muestra estadisticas de clientes por tipo.
         """
-        tipos = {}
-        
-        for cliente in self.__clientes:
-            tipo = cliente.obtener_tipo()
-            tipos[tipo] = tipos.get(tipo, 0) + 1
+        tipos = {tipo: len(clientes) for tipo, clientes in self.__por_tipo.items() if clientes}
         
         print("\n" + "=" * 60)
         print(" " * 15 + "ESTADISTICAS DE CLIENTES")
@@ -262,26 +495,106 @@ class GestorClientes:
         print("=" * 60)
     
 
+    def estadisticas_actuales(self) -> dict:
+        """
+        Retorna las estadisticas que se guardan en el historial, leidas de los grupos por
+        tipo y del total de puntos que se mantienen con cada cambio (sin recorrer clientes).
+        
+        Returns:
+            dict: total, la cantidad de cada tipo registrado (con el nombre del tipo en
+                minusculas, ver columnas_tipos) y puntos
+        """
+        estadisticas = {'total': len(self.__clientes)}
+        for tipo in tipos_registrados():
+            estadisticas[tipo.nombre.lower()] = len(self.__por_tipo[tipo.nombre])
+        estadisticas['puntos'] = self.__total_puntos
+        return estadisticas
+    
+    
     def aplicar_a_todos(self, metodo: str, *args, **kwargs):
         """
         Aplica un metodo a todos los clientes.
         """
-        for cliente in self.__clientes:
-            if hasattr(cliente, metodo):
-                func = getattr(cliente, metodo)
-                if callable(func):
-                    func(*args, **kwargs)
+        with self.__operacion_masiva():
+            for cliente in self.__clientes:
+                if hasattr(cliente, metodo):
+                    func = getattr(cliente, metodo)
+                    if callable(func):
+                        func(*args, **kwargs)
+
+
+    """
+    HISTORIAL DE ESTADISTICAS
+    """
+    def configurar_historial(self, archivo: str = None, intervalo: float = None):
+        """
+        Activa el registro automatico de estadisticas en el historial (ver modulos.historial):
+        despues de cada exportacion CSV, JSONL o SQLite y, si se indica un intervalo, con el
+        primer cambio de clientes que ocurra pasados 'intervalo' segundos del ultimo registro.
+        Durante una importacion (incorporar_clientes) o una operacion sobre todos los clientes
+        el intervalo se revisa recien al terminar, con la carga completa.
+        
+        El intervalo es un minimo entre registros, no un temporizador: no hay un hilo que
+        registre por su cuenta, por lo que mientras no haya cambios (sistema inactivo) no se
+        agregan registros, y el primero se escribe con el primer cambio posterior. Como las
+        estadisticas no varian sin cambios, la serie no pierde informacion; solo quedan
+        huecos de fecha entre registros.
+        
+        Args:
+            archivo (str, optional): Ruta del historial. Por defecto usa ARCHIVO_HISTORIAL
+            intervalo (float, optional): Segundos entre registros automaticos (None = solo al exportar)
+        """
+        self.__historial = archivo or ARCHIVO_HISTORIAL
+        self.__intervalo_historial = intervalo
+        self.__ultimo_historial = time.monotonic()
+    
+    
+    def registrar_estadisticas(self, fecha=None) -> dict:
+        """
+        Agrega las estadisticas actuales al historial.
+        
+        Args:
+            fecha (datetime | str, optional): Fecha del registro. Por defecto, ahora
+        Returns:
+            dict: Registro escrito
+        Raises:
+            ArchivoError: Si ocurre un error al escribir el historial
+        """
+        self.__ultimo_historial = time.monotonic()
+        return agregar_instantanea(self.estadisticas_actuales(), self.__historial, fecha)
+    
+    
+    def tendencia(self, desde=None, hasta=None) -> list[dict]:
+        """
+        Retorna los registros del historial entre dos fechas (ver consultar_historial).
+        
+        Args:
+            desde (datetime | str, optional): Fecha inicial (ISO 8601)
+            hasta (datetime | str, optional): Fecha final (ISO 8601)
+        Returns:
+            list: Registros (fecha, total, una clave por tipo, puntos) en orden de fecha
+        """
+        return consultar_historial(desde, hasta, self.__historial)
 
 
     """
     MANEJO DE ARCHIVOS
     """
-    def exportar_csv(self, archivo: str) -> bool:
+    def exportar_csv(self, archivo: str = None, nivel_compresion: int = None,
+                    max_filas: int = None, max_bytes: int = None, ordenar_por: str = None,
+                    progreso=None) -> bool:
         """
-        Exporta los clientes a un archivo CSV.
+        Exporta los clientes a un archivo CSV (comprimido si la ruta termina en .gz, .bz2 o .xz).
+        Con max_filas o max_bytes se divide en fragmentos numerados con un indice.
+        Con ordenar_por ('email', 'nombre', ...) las filas se ordenan con un ordenamiento externo.
 
         Args:
             archivo (str, optional): Ruta del archivo de destino
+            nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
+            max_filas (int, optional): Maximo de clientes por fragmento
+            max_bytes (int, optional): Maximo de bytes por fragmento
+            ordenar_por (str, optional): Columna por la que se ordenan las filas
+            progreso (function, optional): Callback que recibe el avance (ver MedidorProgreso)
         Returns:
             bool: True si la exportacion fue exitosa
         Raises:
@@ -292,9 +605,13 @@ class GestorClientes:
             return False
         
         try:
-            resultado = exportar_clientes_csv(self.__clientes, archivo)
+            resultado = exportar_clientes_csv(self.__clientes, archivo, nivel_compresion,
+                                            max_filas=max_filas, max_bytes=max_bytes,
+                                            ordenar_por=ordenar_por, progreso=progreso)
             if resultado:
                 print(f"\n[OK] Se exportaron {len(self.__clientes)} clientes al archivo CSV.")
+                if self.__historial is not None:
+                    self.__registrar_historial()
             return resultado
         except Exception as e:
             registrar_error(e, "exportar_csv")
@@ -302,12 +619,63 @@ class GestorClientes:
             return False
     
     
-    def importar_csv(self, archivo: str) -> int:
+    def exportar_cambios_csv(self, archivo: str = None, desde_secuencia: int = 0,
+                            desde_fecha=None) -> int | None:
+        """
+        Exporta solo los clientes que cambiaron despues de la secuencia (o fecha) indicada,
+        con lapidas para los eliminados. Para sincronizar, se guarda secuencia_cambios y se
+        usa como desde_secuencia en la exportacion siguiente.
+
+        Args:
+            archivo (str, optional): Ruta del archivo de destino (por defecto datos/cambios.csv)
+            desde_secuencia (int): Secuencia de la ultima sincronizacion
+            desde_fecha (datetime | str, optional): Fecha de la ultima sincronizacion
+        Returns:
+            int | None: Cantidad de cambios exportados, None si ocurrio un error
+        """
+        try:
+            total = exportar_cambios_csv(self.cambios_desde(desde_secuencia, desde_fecha), archivo)
+            print(f"\n[OK] Se exportaron {total} cambios (secuencia actual: {self.__secuencia}).")
+            return total
+        except Exception as e:
+            registrar_error(e, "exportar_cambios_csv")
+            print(f"\n[X] Error al exportar cambios: {str(e)}")
+            return None
+    
+    
+    def incorporar_clientes(self, clientes_nuevos: list) -> tuple[int, int]:
+        """
+        Agrega una lista de clientes ya creados (por ejemplo, importados desde un archivo)
+        ignorando los que tengan un email ya registrado.
+        
+        Args:
+            clientes_nuevos (list): Lista de objetos Cliente
+        Returns:
+            tuple: (importados, duplicados)
+        """
+        importados = 0
+        duplicados = 0
+        
+        with self.__operacion_masiva():
+            for cliente in clientes_nuevos:
+                if not self.buscar_cliente(cliente.email):
+                    self.__incorporar(cliente)
+                    registrar_alta_cliente(cliente)
+                    importados += 1
+                else:
+                    duplicados += 1
+        
+        return importados, duplicados
+    
+    
+    def importar_csv(self, archivo: str = None, perfil: str = None, progreso=None) -> int:
         """
         Importa desde un archivo CSV y crea objetos Cliente según el tipo especificado en cada fila. Los clientes duplicados son ignorados.
         
         Args:
             archivo (str, optional): Ruta del archivo CSV de origen
+            perfil (str, optional): Perfil de mapeo de columnas para CSV con otro formato
+            progreso (function, optional): Callback que recibe el avance (ver MedidorProgreso)
         Returns:
             int: Numero de clientes importados exitosamente
         Raises:
@@ -315,17 +683,8 @@ class GestorClientes:
             FormatoArchivoError: Si el formato es invalido
         """
         try:
-            clientes_nuevos = importar_clientes_csv(archivo)
-            importados = 0
-            duplicados = 0
-            
-            for cliente in clientes_nuevos:
-                if not self.buscar_cliente(cliente.email):
-                    self.__clientes.append(cliente)
-                    registrar_alta_cliente(cliente)
-                    importados += 1
-                else:
-                    duplicados += 1
+            clientes_nuevos = importar_clientes_csv(archivo, perfil=perfil, progreso=progreso)
+            importados, duplicados = self.incorporar_clientes(clientes_nuevos)
             
             print(f"\n[OK] Importacion completada:")
             print(f"     - Clientes importados: {importados}")
@@ -340,27 +699,368 @@ class GestorClientes:
             return 0
     
     
-    def generar_reporte_txt(self, archivo: str) -> bool:
+    def exportar_csv_particionado(self, directorio: str = None, criterio: str = "tipo",
+                                num_particiones: int = 8, max_hilos: int = None) -> dict | None:
         """
-        Genera un reporte de resumen en formato TXT.
+        Exporta los clientes en varios CSV escritos en paralelo, uno por tipo de cliente
+        o por grupo de dominios de email, junto con un manifiesto de filas y checksums.
+
+        Args:
+            directorio (str, optional): Directorio de destino (por defecto datos/particiones)
+            criterio (str): "tipo" o "dominio"
+            num_particiones (int): Cantidad de particiones para el criterio "dominio"
+            max_hilos (int, optional): Cantidad maxima de hilos de escritura
+        Returns:
+            dict | None: Manifiesto de la exportacion, None si no se exporto
+        """
+        if not self.__clientes:
+            print("\n[!] No hay clientes para exportar.")
+            return None
         
+        try:
+            manifiesto = exportar_clientes_particionado(
+                self.__clientes, directorio, criterio, num_particiones, max_hilos)
+            print(f"\n[OK] Se exportaron {manifiesto['total_filas']} clientes en "
+                f"{len(manifiesto['particiones'])} archivos.")
+            return manifiesto
+        except Exception as e:
+            registrar_error(e, "exportar_csv_particionado")
+            print(f"\n[X] Error al exportar: {str(e)}")
+            return None
+    
+    
+    def exportar_jsonl(self, archivo: str = None, nivel_compresion: int = None) -> bool:
+        """
+        Exporta los clientes en formato JSON Lines, con los campos propios de cada tipo.
+
         Args:
             archivo (str, optional): Ruta del archivo de destino
+            nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
         Returns:
-            bool: True si el reporte fue generado exitosamente
+            bool: True si la exportacion fue exitosa
+        """
+        if not self.__clientes:
+            print("\n[!] No hay clientes para exportar.")
+            return False
+        
+        try:
+            resultado = exportar_clientes_jsonl(self.__clientes, archivo, nivel_compresion)
+            if resultado:
+                print(f"\n[OK] Se exportaron {len(self.__clientes)} clientes al archivo JSONL.")
+                if self.__historial is not None:
+                    self.__registrar_historial()
+            return resultado
+        except Exception as e:
+            registrar_error(e, "exportar_jsonl")
+            print(f"\n[X] Error al exportar: {str(e)}")
+            return False
+    
+    
+    def exportar_columnar(self, archivo: str = None) -> bool:
+        """
+        Exporta los clientes al formato binario columnar para analitica (ver modulos.columnar).
+
+        Args:
+            archivo (str, optional): Ruta del archivo de destino
+        Returns:
+            bool: True si la exportacion fue exitosa
+        """
+        if not self.__clientes:
+            print("\n[!] No hay clientes para exportar.")
+            return False
+        
+        try:
+            resultado = exportar_clientes_columnar(self.__clientes, archivo)
+            if resultado:
+                print(f"\n[OK] Se exportaron {len(self.__clientes)} clientes en formato columnar.")
+            return resultado
+        except Exception as e:
+            registrar_error(e, "exportar_columnar")
+            print(f"\n[X] Error al exportar: {str(e)}")
+            return False
+    
+    
+    def exportar_csv_indexado(self, archivo: str = None) -> bool:
+        """
+        Exporta los clientes a un CSV ordenado por email con un indice disperso, para
+        buscarlos por email con LectorIndexado sin cargar el gestor.
+
+        Args:
+            archivo (str, optional): Ruta del CSV (por defecto datos/clientes_ordenados.csv)
+        Returns:
+            bool: True si la exportacion fue exitosa
+        """
+        if not self.__clientes:
+            print("\n[!] No hay clientes para exportar.")
+            return False
+        
+        try:
+            indice = exportar_csv_indexado(self.__clientes, archivo)
+            print(f"\n[OK] Se exportaron {indice['filas']} clientes ordenados por email "
+                f"({len(indice['claves'])} entradas de indice).")
+            return True
+        except Exception as e:
+            registrar_error(e, "exportar_csv_indexado")
+            print(f"\n[X] Error al exportar: {str(e)}")
+            return False
+    
+    
+    def exportar_sqlite(self, archivo: str = None) -> bool:
+        """
+        Exporta los clientes a una base de datos SQLite (tabla 'clientes', por defecto
+        datos/clientes.db) para consultarla con SQL.
+
+        Args:
+            archivo (str, optional): Ruta de la base de datos de destino
+        Returns:
+            bool: True si la exportacion fue exitosa
+        """
+        if not self.__clientes:
+            print("\n[!] No hay clientes para exportar.")
+            return False
+        
+        try:
+            resultado = exportar_clientes_sqlite(self.__clientes, archivo)
+            if resultado:
+                print(f"\n[OK] Se exportaron {len(self.__clientes)} clientes a la base SQLite.")
+                if self.__historial is not None:
+                    self.__registrar_historial()
+            return resultado
+        except Exception as e:
+            registrar_error(e, "exportar_sqlite")
+            print(f"\n[X] Error al exportar: {str(e)}")
+            return False
+    
+    
+    def extraer_facturas(self, directorio: str = None, formato: str = "csv",
+                        num_particiones: int = NUM_PARTICIONES_FACTURAS) -> dict | None:
+        """
+        Extrae los datos de facturacion de los clientes corporativos agrupados por RUT
+        (ver modulos.facturacion). Solo recorre el grupo de clientes Corporativo.
+        
+        Args:
+            directorio (str, optional): Directorio de destino
+            formato (str): "csv" o "jsonl"
+            num_particiones (int): Cantidad de archivos
+        Returns:
+            dict | None: Manifiesto de la extraccion, o None si no hay corporativos o hubo un error
+        """
+        corporativos = self.__por_tipo[ClienteCorporativo.TIPO_CLIENTE]
+        if not corporativos:
+            print("\n[!] No hay clientes corporativos para facturar.")
+            return None
+        
+        try:
+            manifiesto = extraer_facturas(corporativos, directorio, formato, num_particiones)
+            print(f"\n[OK] Se extrajeron {manifiesto['total_registros']} empresas "
+                f"({manifiesto['total_contactos']} contactos) en {num_particiones} archivos.")
+            return manifiesto
+        except Exception as e:
+            registrar_error(e, "extraer_facturas")
+            print(f"\n[X] Error al extraer facturas: {str(e)}")
+            return None
+    
+    
+    def importar_jsonl(self, archivo: str = None) -> int:
+        """
+        Importa clientes desde un archivo JSON Lines. Los clientes duplicados son ignorados.
+
+        Args:
+            archivo (str, optional): Ruta del archivo JSONL de origen
+        Returns:
+            int: Numero de clientes importados exitosamente
+        """
+        try:
+            importados, duplicados = self.incorporar_clientes(importar_clientes_jsonl(archivo))
+            
+            print(f"\n[OK] Importacion completada:")
+            print(f"     - Clientes importados: {importados}")
+            if duplicados > 0:
+                print(f"     - Clientes duplicados (ignorados): {duplicados}")
+            return importados
+        
+        except Exception as e:
+            registrar_error(e, "importar_jsonl")
+            print(f"\n[X] Error al importar: {str(e)}")
+            return 0
+    
+    
+    def simular_importacion(self, archivo: str = None) -> dict | None:
+        """
+        Valida un archivo CSV sin importarlo (dry-run). No modifica la lista de
+        clientes ni escribe en el log.
+        
+        Args:
+            archivo (str, optional): Ruta del archivo CSV a validar
+        Returns:
+            dict | None: Informe de la simulacion, None si no se pudo leer el archivo
+        """
+        try:
+            informe = importar_clientes_csv(archivo, simular=True)
+        except Exception as e:
+            print(f"\n[X] Error al simular la importacion: {str(e)}")
+            return None
+        
+        print(f"\n[OK] Simulacion completada (no se importo ningun cliente):")
+        print(f"     - Filas leidas: {informe['filas']}")
+        print(f"     - Filas validas: {informe['validas']}")
+        print(f"     - Filas rechazadas: {informe['rechazadas']}")
+        for validador, cantidad in sorted(informe['rechazos_por_validador'].items()):
+            print(f"         * {validador}: {cantidad}")
+        if informe['advertencias']:
+            print(f"     - Advertencias (se importan igual):")
+            for columna, cantidad in sorted(informe['advertencias'].items()):
+                print(f"         * {columna}: {cantidad}")
+        print(f"     - Rendimiento: {informe['filas_por_segundo']:.0f} filas/s ({informe['segundos']:.3f} s)")
+        print(f"     - Memoria estimada: {informe['memoria_estimada'] / 1024:.1f} KB")
+        return informe
+    
+    
+    def generar_reporte_txt(self, archivo: str = None, nivel_compresion: int = None,
+                            progreso=None, modo: str = "completo",
+                            clientes_por_pagina: int = CLIENTES_POR_PAGINA,
+                            forzar: bool = False, en_segundo_plano: bool = False,
+                            procesos: int = 1) -> bool | Future:
+        """
+        Genera un reporte de resumen en formato TXT (comprimido si la ruta termina en .gz, .bz2 o .xz).
+        
+        Si el archivo ya fue generado por este gestor con la version actual y las mismas
+        opciones (ver reporte_vigente), no se vuelve a generar.
+        
+        Con en_segundo_plano=True se capturan al llamar los valores que el reporte muestra
+        de cada cliente (ver capturar_fichas) y los contadores, y el reporte se arma en otro
+        hilo con esa captura, por lo que las altas, bajas y modificaciones posteriores no lo
+        afectan y el sello corresponde a lo escrito. En segundo plano las fichas se arman
+        en un solo proceso (no se hace fork desde el hilo del reporte). Retorna de inmediato
+        un Future (tambien disponible en reporte_en_curso) cuyo resultado es True, o la
+        excepcion si fallo; no imprime nada.
+        
+        Args:
+            archivo (str, optional): Ruta del archivo de destino
+            nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
+            progreso (function, optional): Callback que recibe el avance (ver MedidorProgreso)
+            modo (str): "completo", "resumen" (solo estadisticas, desde los contadores) o
+                "paginado" (clientes_por_pagina clientes por archivo)
+            clientes_por_pagina (int): Clientes por archivo en el modo "paginado"
+            forzar (bool): Genera el reporte aunque el archivo existente este vigente
+            en_segundo_plano (bool): Genera el reporte en otro hilo y retorna un Future
+            procesos (int): Procesos que arman las fichas en el modo "completo" (ver generar_reporte);
+                se ignora en segundo plano
+        Returns:
+            bool | Future: True si el reporte fue generado exitosamente (o ya estaba vigente);
+                un Future si en_segundo_plano es True
         Raises:
             ArchivoError: Si ocurre un error al escribir el archivo
         """
+        if archivo is None:
+            archivo = ARCHIVO_REPORTE
+        sello = {
+            "gestor": self.__identificador,
+            "version": self.__secuencia,
+            "modo": modo,
+            "clientes_por_pagina": clientes_por_pagina if modo == "paginado" else None,
+            "nivel_compresion": nivel_compresion
+        }
+        
+        if en_segundo_plano:
+            if not forzar and reporte_vigente(archivo, sello):
+                futuro = Future()
+                futuro.set_result(True)
+            else:
+                if self.__ejecutor is None:
+                    self.__ejecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reporte")
+                fichas = None if modo == "resumen" else capturar_fichas(self.__clientes)
+                futuro = self.__ejecutor.submit(
+                    self.__generar_reporte_instantanea, (), self.conteo_por_tipo(), archivo, sello,
+                    nivel_compresion, progreso, clientes_por_pagina, 1, fichas)
+            self.__reporte_en_curso = futuro
+            return futuro
+        
         try:
-            resultado = generar_reporte(self.__clientes, archivo)
+            if not forzar and reporte_vigente(archivo, sello):
+                print(f"\n[OK] El reporte no cambio desde la ultima generacion: {archivo}")
+                return True
+            
+            resultado = self.__generar_reporte_instantanea(self.__clientes, self.conteo_por_tipo(), archivo,
+                                                        sello, nivel_compresion, progreso, clientes_por_pagina,
+                                                        procesos)
             if resultado:
                 print(f"\n[OK] Reporte generado exitosamente.")
             return resultado
         except Exception as e:
-            registrar_error(e, "generar_reporte")
             print(f"\n[X] Error al generar reporte: {str(e)}")
             return False
 
 
+    @staticmethod
+    def __generar_reporte_instantanea(clientes, conteo, archivo, sello, nivel_compresion, progreso,
+                                    clientes_por_pagina, procesos, fichas=None) -> bool:
+        # Genera el reporte de 'clientes' (o de las fichas capturadas) y 'conteo'
+        try:
+            resultado = generar_reporte(clientes, archivo, nivel_compresion, progreso=progreso,
+                                        modo=sello["modo"], conteo=conteo,
+                                        clientes_por_pagina=clientes_por_pagina, procesos=procesos,
+                                        fichas=fichas)
+            if resultado:
+                sellar_reporte(archivo, sello)
+            return resultado
+        except Exception as e:
+            registrar_error(e, "generar_reporte")
+            raise
 
 
+    def generar_reporte_analitico(self, archivo: str = None, nivel_compresion: int = None,
+                                top: int = TOP_ANALITICA) -> dict | None:
+        """
+        Genera el reporte analitico (puntos Premium, empresas, dominios de email y
+        ciudades) recorriendo los clientes una sola vez (ver modulos.analitica).
+        
+        Args:
+            archivo (str, optional): Ruta del archivo de destino
+            nivel_compresion (int, optional): Nivel de compresion 1-9 para archivos comprimidos
+            top (int): Filas de cada ranking
+        Returns:
+            dict | None: Estadisticas calculadas, o None si hubo un error
+        """
+        try:
+            analitica = generar_reporte_analitico(iter(self.__clientes), archivo, nivel_compresion, top)
+            print(f"\n[OK] Reporte analitico generado ({analitica['total']} clientes).")
+            return analitica
+        except Exception as e:
+            registrar_error(e, "generar_reporte_analitico")
+            print(f"\n[X] Error al generar reporte analitico: {str(e)}")
+            return None
+
+
+    def ranking_premium(self, cantidad: int = TOP_RANKING) -> list[ClientePremium]:
+        """
+        Retorna los clientes Premium con mas puntos, de mayor a menor. Solo recorre el
+        grupo de clientes Premium y selecciona con un monticulo de 'cantidad' elementos
+        (ver ranking_puntos), sin ordenar todos los clientes.
+        
+        Args:
+            cantidad (int): Largo del ranking
+        Returns:
+            list: Clientes Premium del ranking
+        """
+        return ranking_puntos(self.__por_tipo[ClientePremium.TIPO_CLIENTE], cantidad)
+    
+    
+    def generar_ranking_premium(self, archivo: str = None, cantidad: int = TOP_RANKING) -> bool:
+        """
+        Escribe el ranking de clientes Premium por puntos en reportes/ranking_premium.txt.
+        
+        Args:
+            archivo (str, optional): Ruta del archivo de destino
+            cantidad (int): Largo del ranking
+        Returns:
+            bool: True si el ranking fue generado exitosamente
+        """
+        try:
+            ranking = generar_ranking_puntos(self.__por_tipo[ClientePremium.TIPO_CLIENTE], archivo, cantidad)
+            print(f"\n[OK] Ranking de {len(ranking)} clientes Premium generado.")
+            return True
+        except Exception as e:
+            registrar_error(e, "generar_ranking_premium")
+            print(f"\n[X] Error al generar ranking: {str(e)}")
+            return False
@@ -0,0 +1,246 @@
+"""
+================
+Módulo historial
+================
+Serie historica de estadisticas de clientes en un archivo binario de registros fijos:
+
+    [MAGIA][encabezado][registro 1][registro 2]...
+
+El encabezado indica las columnas por tipo de cliente (una por cada tipo registrado al
+crear el archivo, ver modulos.registro_tipos). Cada registro ocupa el mismo tamano (fecha
+como segundos desde epoch, total, cantidad de clientes de cada tipo y total de puntos
+acumulados). Los registros se agregan al final en orden de fecha, por lo que una consulta
+por rango ubica el primer registro con una busqueda binaria (un seek por paso) y lee el
+rango de una sola vez, sin recorrer el archivo completo.
+
+Si al agregar un registro hay un tipo registrado que el archivo no tiene, el historial se
+reescribe una vez con la columna nueva (en 0 para los registros anteriores).
+"""
+import os
+import struct
+from datetime import datetime
+from modulos.archivos import DATOS_DIR, crear_directorios
+from modulos.registro_tipos import tipos_registrados
+from modulos.excepciones import (
+    ArchivoError,
+    PermisoArchivoError,
+    FormatoArchivoError
+)
+
+
+ARCHIVO_HISTORIAL = os.path.join(DATOS_DIR, "estadisticas.bin")
+
+MAGIA = b"GICHST02"
+
+# Historiales anteriores, con columnas fijas Regular, Premium y Corporativo y sin encabezado
+MAGIA_V1 = b"GICHST01"
+COLUMNAS_V1 = ('regular', 'premium', 'corporativo')
+
+# Largo (uint16) de los nombres de columna que siguen a la magia, separados por coma
+LARGO_ENCABEZADO = struct.Struct("<H")
+
+
+def columnas_tipos() -> list:
+    """
+    Retorna las columnas por tipo de cliente: el nombre de cada tipo registrado en minusculas.
+    """
+    return [tipo.nombre.lower() for tipo in tipos_registrados()]
+
+
+def estructura_registro(columnas) -> struct.Struct:
+    """
+    Retorna la estructura de un registro con las columnas por tipo indicadas.
+
+    Args:
+        columnas (list): Columnas por tipo del historial
+    Returns:
+        struct.Struct: fecha (float64), total y cada tipo (uint64), puntos (int64)
+    """
+    return struct.Struct("<dQ" + "Q" * len(columnas) + "q")
+
+
+def _a_segundos(fecha) -> float:
+    if isinstance(fecha, str):
+        fecha = datetime.fromisoformat(fecha)
+    return fecha.timestamp()
+
+
+def _encabezado(columnas) -> bytes:
+    nombres = ",".join(columnas).encode('utf-8')
+    return MAGIA + LARGO_ENCABEZADO.pack(len(nombres)) + nombres
+
+
+def _leer_encabezado(file, archivo) -> tuple:
+    # Retorna (columnas, posicion del primer registro, True si es un historial anterior)
+    magia = file.read(len(MAGIA))
+    if magia == MAGIA_V1:
+        return list(COLUMNAS_V1), len(MAGIA_V1), True
+    if magia != MAGIA:
+        raise FormatoArchivoError(archivo, "No es un historial de estadisticas")
+    datos = file.read(LARGO_ENCABEZADO.size)
+    largo = LARGO_ENCABEZADO.unpack(datos)[0] if len(datos) == LARGO_ENCABEZADO.size else -1
+    nombres = file.read(largo) if largo >= 0 else b""
+    if len(nombres) != largo:
+        raise FormatoArchivoError(archivo, "Encabezado del historial incompleto")
+    columnas = nombres.decode('utf-8').split(",") if nombres else []
+    return columnas, len(MAGIA) + LARGO_ENCABEZADO.size + largo, False
+
+
+def _cantidad_registros(file, inicio, registro) -> int:
+    # Un registro incompleto al final (escritura interrumpida) se ignora
+    return max(0, os.fstat(file.fileno()).st_size - inicio) // registro.size
+
+
+def _fecha_registro(file, inicio, registro, indice) -> float:
+    file.seek(inicio + indice * registro.size)
+    return struct.unpack("<d", file.read(8))[0]
+
+
+def _primer_registro_desde(file, inicio, registro, cantidad, segundos, incluir_igual=True) -> int:
+    # Busqueda binaria del primer registro con fecha >= segundos (> si incluir_igual es False)
+    izquierda, derecha = 0, cantidad
+    while izquierda < derecha:
+        medio = (izquierda + derecha) // 2
+        fecha = _fecha_registro(file, inicio, registro, medio)
+        if fecha < segundos or (not incluir_igual and fecha == segundos):
+            izquierda = medio + 1
+        else:
+            derecha = medio
+    return izquierda
+
+
+def _ampliar_columnas(archivo, columnas):
+    # Reescribe el historial con las columnas indicadas (las que falten quedan en 0)
+    with open(archivo, 'rb') as file:
+        anteriores, inicio, _ = _leer_encabezado(file, archivo)
+        registro = estructura_registro(anteriores)
+        cantidad = _cantidad_registros(file, inicio, registro)
+        file.seek(inicio)
+        datos = file.read(cantidad * registro.size)
+
+    nuevo = estructura_registro(columnas)
+    temporal = archivo + ".tmp"
+    with open(temporal, 'wb') as file:
+        file.write(_encabezado(columnas))
+        for valores in registro.iter_unpack(datos):
+            por_tipo = dict(zip(anteriores, valores[2:-1]))
+            file.write(nuevo.pack(valores[0], valores[1], *(por_tipo.get(c, 0) for c in columnas),
+                                valores[-1]))
+    os.replace(temporal, archivo)
+
+
+"""
+ESCRITURA
+"""
+def agregar_instantanea(estadisticas: dict, archivo=None, fecha=None) -> dict:
+    """
+    Agrega un registro al final del historial (lo crea si no existe). Si la fecha es
+    anterior a la del ultimo registro (por ejemplo, si se atraso el reloj) se usa la del
+    ultimo, para que el archivo siga ordenado.
+
+    Args:
+        estadisticas (dict): total, puntos y la cantidad de cada tipo (ver columnas_tipos);
+            las que falten se guardan como 0
+        archivo (str, optional): Ruta del historial. Por defecto usa ARCHIVO_HISTORIAL
+        fecha (datetime | str, optional): Fecha del registro. Por defecto, ahora
+    Returns:
+        dict: Registro escrito (con 'fecha' como datetime)
+    Raises:
+        FormatoArchivoError: Si el archivo existe y no es un historial
+        ArchivoError: Si ocurre un error al escribir el archivo
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_HISTORIAL
+    segundos = _a_segundos(fecha or datetime.now())
+
+    try:
+        crear_directorios()
+        # Un tipo registrado despues de crear el historial (o un historial anterior)
+        # obliga a reescribirlo con las columnas actuales
+        if os.path.exists(archivo) and os.path.getsize(archivo) > 0:
+            with open(archivo, 'rb') as file:
+                columnas, _, anterior = _leer_encabezado(file, archivo)
+            nuevas = [columna for columna in columnas_tipos() if columna not in columnas]
+            if nuevas or anterior:
+                _ampliar_columnas(archivo, columnas + nuevas)
+
+        with open(archivo, 'a+b') as file:
+            if file.tell() == 0:
+                columnas = columnas_tipos()
+                inicio = len(_encabezado(columnas))
+                registro = estructura_registro(columnas)
+                file.write(_encabezado(columnas))
+            else:
+                file.seek(0)
+                columnas, inicio, _ = _leer_encabezado(file, archivo)
+                registro = estructura_registro(columnas)
+                cantidad = _cantidad_registros(file, inicio, registro)
+                if cantidad:
+                    segundos = max(segundos, _fecha_registro(file, inicio, registro, cantidad - 1))
+                # Descarta un registro incompleto de una escritura interrumpida
+                file.truncate(inicio + cantidad * registro.size)
+            valores = (segundos, *(int(estadisticas.get(campo, 0))
+                                for campo in ('total', *columnas, 'puntos')))
+            file.write(registro.pack(*valores))
+        return _registro_a_dict(columnas, valores)
+
+    # Manejo de excepciones
+    except FormatoArchivoError:
+        raise
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al guardar estadisticas: {str(e)}")
+
+
+"""
+CONSULTA
+"""
+def _registro_a_dict(columnas, valores) -> dict:
+    registro = dict(zip(('fecha', 'total', *columnas, 'puntos'), valores))
+    registro['fecha'] = datetime.fromtimestamp(registro['fecha'])
+    return registro
+
+
+def consultar_historial(desde=None, hasta=None, archivo=None) -> list[dict]:
+    """
+    Retorna los registros con fecha entre 'desde' y 'hasta' (ambos incluidos). Ubica los
+    extremos del rango con busquedas binarias sobre el archivo y lee solo ese rango.
+
+    Args:
+        desde (datetime | str, optional): Fecha inicial (ISO 8601). Por defecto, el comienzo
+        hasta (datetime | str, optional): Fecha final (ISO 8601). Por defecto, el final
+        archivo (str, optional): Ruta del historial. Por defecto usa ARCHIVO_HISTORIAL
+    Returns:
+        list: Registros (dict con fecha, total, una clave por tipo y puntos) en orden de
+            fecha; vacia si el historial no existe
+    Raises:
+        FormatoArchivoError: Si el archivo no es un historial
+        ArchivoError: Si ocurre un error al leer el archivo
+    """
+    if archivo is None:
+        archivo = ARCHIVO_HISTORIAL
+    if not os.path.exists(archivo):
+        return []
+
+    try:
+        with open(archivo, 'rb') as file:
+            columnas, inicio, _ = _leer_encabezado(file, archivo)
+            registro = estructura_registro(columnas)
+            cantidad = _cantidad_registros(file, inicio, registro)
+            primero = 0 if desde is None else _primer_registro_desde(file, inicio, registro, cantidad,
+                                                                    _a_segundos(desde))
+            fin = cantidad if hasta is None else _primer_registro_desde(file, inicio, registro, cantidad,
+                                                                        _a_segundos(hasta), incluir_igual=False)
+            if primero >= fin:
+                return []
+            file.seek(inicio + primero * registro.size)
+            datos = file.read((fin - primero) * registro.size)
+        return [_registro_a_dict(columnas, valores) for valores in registro.iter_unpack(datos)]
+
+    # Manejo de excepciones
+    except FormatoArchivoError:
+        raise
+    except Exception as e:
+        raise ArchivoError(f"Error al leer historial de estadisticas: {str(e)}")
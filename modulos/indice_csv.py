@@ -0,0 +1,197 @@
+"""
+=================
+Módulo indice_csv
+=================
+Exportacion del CSV de clientes ordenado por email junto con un indice disperso, para
+que otros servicios busquen un cliente sin cargar el archivo ni GestorClientes.
+
+El indice (archivo + ".idx", JSON) guarda el email y la posicion en bytes de una de
+cada 'intervalo' filas. Una busqueda hace una busqueda binaria en el indice y lee con
+un solo seek/read el bloque de filas donde debe estar el email.
+"""
+import io
+import os
+import csv
+import json
+from bisect import bisect_right
+from modulos.archivos import (
+    DATOS_DIR,
+    TAMANO_BUFFER,
+    crear_directorios,
+    es_archivo_comprimido,
+    cliente_a_fila,
+    ordenar_filas_externo,
+    registrar_log
+)
+from modulos.registro_tipos import columnas_csv
+from modulos.excepciones import (
+    ArchivoError,
+    ArchivoNoEncontradoError,
+    PermisoArchivoError,
+    FormatoArchivoError
+)
+
+
+ARCHIVO_INDEXADO = os.path.join(DATOS_DIR, "clientes_ordenados.csv")
+EXTENSION_INDICE = ".idx"
+
+# Se indexa una de cada INTERVALO_INDICE filas
+INTERVALO_INDICE = 64
+
+
+def ruta_indice(archivo) -> str:
+    """
+    Retorna la ruta del indice de un CSV indexado (datos/clientes_ordenados.csv.idx).
+    """
+    return archivo + EXTENSION_INDICE
+
+
+def _volcar(texto: io.StringIO, file) -> int:
+    datos = texto.getvalue().encode('utf-8')
+    texto.seek(0)
+    texto.truncate()
+    file.write(datos)
+    return len(datos)
+
+
+"""
+EXPORTACION
+"""
+def exportar_csv_indexado(clientes, archivo=None, intervalo=INTERVALO_INDICE,
+                        memoria_maxima=None) -> dict:
+    """
+    Exporta los clientes a un CSV ordenado por email (ver ordenar_filas_externo) y
+    escribe su indice disperso. El CSV no puede estar comprimido, porque la busqueda
+    lee directamente en una posicion del archivo.
+
+    Args:
+        clientes (iterable): Objetos Cliente a exportar
+        archivo (str, optional): Ruta del CSV. Por defecto usa ARCHIVO_INDEXADO
+        intervalo (int): Se indexa una de cada 'intervalo' filas
+        memoria_maxima (int, optional): Bytes de filas en memoria durante el ordenamiento
+    Returns:
+        dict: Indice escrito (columnas, intervalo, filas, tamano, claves, desplazamientos)
+    Raises:
+        FormatoArchivoError: Si la ruta corresponde a un archivo comprimido
+        ArchivoError: Si ocurre un error al escribir los archivos
+        PermisoArchivoError: Si no hay permisos de escritura
+    """
+    if archivo is None:
+        archivo = ARCHIVO_INDEXADO
+    if es_archivo_comprimido(archivo):
+        raise FormatoArchivoError(archivo, "El CSV indexado no puede estar comprimido")
+    if intervalo < 1:
+        raise ValueError("El intervalo del indice debe ser mayor que cero")
+
+    try:
+        crear_directorios()
+        columnas = columnas_csv()
+        posicion_email = columnas.index('email')
+        texto = io.StringIO()
+        writer = csv.writer(texto)
+        writer.writerow(columnas)
+
+        claves = []
+        desplazamientos = []
+        filas = 0
+        posicion = 0
+        with open(archivo, 'wb', buffering=TAMANO_BUFFER) as file:
+            for fila in ordenar_filas_externo(map(cliente_a_fila, clientes), 'email', memoria_maxima):
+                # Al comienzo de cada bloque se escribe lo acumulado y se anota la posicion
+                if filas % intervalo == 0:
+                    posicion += _volcar(texto, file)
+                    claves.append(str(fila[posicion_email]))
+                    desplazamientos.append(posicion)
+                writer.writerow(fila)
+                filas += 1
+            posicion += _volcar(texto, file)
+
+        indice = {
+            "columnas": columnas,
+            "intervalo": intervalo,
+            "filas": filas,
+            "tamano": posicion,
+            "claves": claves,
+            "desplazamientos": desplazamientos
+        }
+        with open(ruta_indice(archivo), 'w', encoding='utf-8') as file:
+            json.dump(indice, file, ensure_ascii=False)
+
+        registrar_log(f"EXPORTACION: {filas} clientes exportados ordenados e indexados a {archivo}")
+        return indice
+
+    # Manejo de excepciones
+    except PermissionError:
+        raise PermisoArchivoError(archivo, "escritura")
+    except Exception as e:
+        raise ArchivoError(f"Error al exportar clientes indexados: {str(e)}")
+
+
+"""
+BUSQUEDA
+"""
+class LectorIndexado:
+    """
+    Busca clientes por email en un CSV exportado con exportar_csv_indexado().
+    Solo carga el indice en memoria; cada busqueda lee un bloque de a lo sumo
+    'intervalo' filas.
+
+        lector = LectorIndexado("datos/clientes_ordenados.csv")
+        fila = lector.buscar("ana@mail.com")   # dict con las columnas, o None
+    """
+
+    def __init__(self, archivo=None):
+        """
+        Args:
+            archivo (str, optional): Ruta del CSV indexado. Por defecto usa ARCHIVO_INDEXADO
+        Raises:
+            ArchivoNoEncontradoError: Si no existe el CSV o su indice
+            FormatoArchivoError: Si el indice no corresponde al CSV actual
+        """
+        self.archivo = archivo or ARCHIVO_INDEXADO
+        for ruta in (self.archivo, ruta_indice(self.archivo)):
+            if not os.path.exists(ruta):
+                raise ArchivoNoEncontradoError(ruta)
+
+        with open(ruta_indice(self.archivo), 'r', encoding='utf-8') as file:
+            indice = json.load(file)
+        if os.path.getsize(self.archivo) != indice["tamano"]:
+            raise FormatoArchivoError(self.archivo, "El indice no corresponde al archivo (exportelo de nuevo)")
+
+        self.columnas = indice["columnas"]
+        self.total_filas = indice["filas"]
+        self.__posicion_email = self.columnas.index('email')
+        self.__claves = indice["claves"]
+        self.__desplazamientos = indice["desplazamientos"] + [indice["tamano"]]
+
+
+    def buscar(self, email: str) -> dict | None:
+        """
+        Busca un cliente por su email.
+
+        Args:
+            email (str): Email del cliente
+        Returns:
+            dict | None: Fila del CSV (columna -> valor) o None si no existe
+        """
+        email = email.strip().lower()
+        bloque = bisect_right(self.__claves, email) - 1
+        if bloque < 0:
+            return None
+
+        inicio = self.__desplazamientos[bloque]
+        with open(self.archivo, 'rb') as file:
+            file.seek(inicio)
+            datos = file.read(self.__desplazamientos[bloque + 1] - inicio)
+
+        posicion = self.__posicion_email
+        for valores in csv.reader(io.StringIO(datos.decode('utf-8'), newline='')):
+            if valores[posicion] == email:
+                return dict(zip(self.columnas, valores))
+            if valores[posicion] > email:
+                break
+        return None
+
+
+    def __contains__(self, email: str) -> bool:
+        return self.buscar(email) is not None
@@ -0,0 +1,305 @@
+"""
+==============
+Módulo ingesta
+==============
+Importacion automatica de los archivos CSV que los socios dejan en un directorio.
+"""
+import os
+import csv
+import json
+import time
+from modulos.archivos import (
+    DATOS_DIR,
+    ARCHIVO_CLIENTES,
+    ARCHIVO_ENTRADA,
+    importar_clientes_csv,
+    anexar_clientes_csv,
+    registrar_log,
+    registrar_error,
+    obtener_timestamp
+)
+from modulos.excepciones import FormatoArchivoError
+
+
+"""
+CONFIGURACION
+"""
+# Directorio vigilado por defecto (los socios dejan aqui sus CSV)
+DIRECTORIO_ENTRADA = os.path.join(DATOS_DIR, "entrada")
+
+# Directorio al que se mueven los archivos ya importados
+DIRECTORIO_PROCESADOS = os.path.join(DATOS_DIR, "procesados")
+
+# Archivo con el avance de cada archivo (se guarda en el directorio vigilado)
+NOMBRE_ESTADO = ".ingesta.json"
+
+# Maximo de bytes que se importan de un archivo en cada paso
+TAMANO_BLOQUE = 16 * 1024 * 1024
+
+
+def buscar_limite_registro(datos: bytes) -> int:
+    """
+    Busca el ultimo salto de linea que cierra un registro completo, ignorando los
+    saltos de linea que estan dentro de un campo entre comillas.
+
+    Args:
+        datos (bytes): Bloque que comienza en un limite de registro
+    Returns:
+        int: Cantidad de bytes que forman registros completos (0 si no hay ninguno)
+    """
+    posicion = datos.rfind(b'\n')
+    while posicion >= 0:
+        # Con un numero par de comillas antes del salto, este no esta dentro de un campo
+        if datos.count(b'"', 0, posicion) % 2 == 0:
+            return posicion + 1
+        posicion = datos.rfind(b'\n', 0, posicion)
+    return 0
+
+
+class IngestorDirectorio:
+    """
+    Vigila un directorio e importa de forma incremental los archivos CSV nuevos o que crecen.
+
+    Cada bloque de filas se agrega primero al CSV de clientes ('archivo_clientes') y recien
+    despues se guarda el ultimo byte importado en el archivo de estado, por lo que tras un
+    reinicio se continua desde ese punto y cada fila queda guardada una sola vez. Antes de
+    agregar un bloque se anota el tamano del CSV de clientes; si el proceso se interrumpe
+    a mitad de camino, en la siguiente revision el CSV se recorta a ese tamano y el bloque
+    se vuelve a importar. Cuando un archivo deja de crecer durante 'ciclos_estables'
+    revisiones y esta completamente importado, se mueve al directorio de procesados.
+
+    Atributos privados:
+        __gestor (GestorClientes): Gestor en el que se incorporan los clientes
+        __estado (dict): Avance por nombre de archivo
+        __registrados (set | None): Emails (en minusculas) del gestor y del CSV de clientes,
+            armado una vez por revision cuando hace falta
+    """
+
+    def __init__(self, gestor, directorio: str = DIRECTORIO_ENTRADA, directorio_procesados: str = None,
+                intervalo: float = 5.0, ciclos_estables: int = 2, tamano_bloque: int = TAMANO_BLOQUE,
+                archivo_clientes: str = ARCHIVO_CLIENTES):
+        self.__gestor = gestor
+        self.directorio = directorio
+        self.directorio_procesados = directorio_procesados or DIRECTORIO_PROCESADOS
+        self.archivo_clientes = archivo_clientes
+        self.intervalo = intervalo
+        self.ciclos_estables = ciclos_estables
+        self.tamano_bloque = tamano_bloque
+        self.archivo_estado = os.path.join(directorio, NOMBRE_ESTADO)
+        os.makedirs(directorio, exist_ok=True)
+        self.__estado = self.__cargar_estado()
+        self.__registrados = None
+
+
+    """
+    ESTADO PERSISTENTE
+    """
+    def __cargar_estado(self) -> dict:
+        if not os.path.exists(self.archivo_estado):
+            return {}
+        try:
+            with open(self.archivo_estado, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            registrar_error(e, "ingesta: estado ilegible, se reinicia")
+            return {}
+
+
+    def __guardar_estado(self):
+        # Escritura atomica: un corte a mitad de escritura no corrompe el estado
+        temporal = self.archivo_estado + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as file:
+            json.dump(self.__estado, file)
+        os.replace(temporal, self.archivo_estado)
+
+
+    """
+    PROCESAMIENTO
+    """
+    def archivos_pendientes(self) -> list:
+        """
+        Lista los archivos CSV del directorio vigilado, sin incluir el CSV de clientes ni
+        el de importacion manual (si se vigila datos/).
+        """
+        excluidos = {os.path.abspath(ruta) for ruta in (ARCHIVO_CLIENTES, ARCHIVO_ENTRADA,
+                                                        self.archivo_clientes)}
+        pendientes = []
+        with os.scandir(self.directorio) as entradas:
+            for entrada in entradas:
+                if (entrada.is_file() and entrada.name.lower().endswith(".csv")
+                        and os.path.abspath(entrada.path) not in excluidos):
+                    pendientes.append(entrada)
+        return sorted(pendientes, key=lambda e: e.name)
+
+
+    def procesar_una_vez(self) -> int:
+        """
+        Revisa el directorio una vez e importa lo que haya de nuevo en cada archivo.
+
+        Returns:
+            int: Cantidad de clientes incorporados en esta revision
+        """
+        incorporados = 0
+        self.__registrados = None
+        for entrada in self.archivos_pendientes():
+            try:
+                incorporados += self.__procesar_archivo(entrada)
+            except Exception as e:
+                registrar_error(e, f"ingesta de {entrada.name}")
+        return incorporados
+
+
+    def __procesar_archivo(self, entrada) -> int:
+        info = entrada.stat()
+        estado = self.__estado.get(entrada.name)
+
+        # Archivo nuevo, o reemplazado/truncado desde la ultima revision
+        if estado is None or estado["inodo"] != info.st_ino or info.st_size < estado["offset"]:
+            estado = {"inodo": info.st_ino, "offset": 0, "encabezado": None,
+                    "tamano": -1, "estable": 0}
+            self.__estado[entrada.name] = estado
+
+        if estado["encabezado"] is None and not self.__leer_encabezado(entrada.path, estado):
+            return 0
+
+        # Bloque que quedo a medio guardar: se descarta lo agregado y se vuelve a importar
+        if "almacen" in estado:
+            self.__recortar_almacen(estado.pop("almacen"))
+            self.__guardar_estado()
+
+        incorporados = 0
+        while estado["offset"] < info.st_size:
+            with open(entrada.path, 'rb') as file:
+                file.seek(estado["offset"])
+                bloque = file.read(self.tamano_bloque)
+
+            fin = buscar_limite_registro(bloque)
+            if fin == 0:
+                # Registro incompleto (el socio aun esta escribiendo) o bloque demasiado pequeno
+                if len(bloque) < self.tamano_bloque:
+                    break
+                raise FormatoArchivoError(entrada.path, "Registro mayor que el tamano de bloque")
+
+            clientes = importar_clientes_csv(
+                entrada.path,
+                desde_byte=estado["offset"],
+                hasta_byte=estado["offset"] + fin,
+                encabezado=estado["encabezado"]
+            )
+            nuevos = self.__clientes_nuevos(clientes)
+
+            # Se guarda en disco antes de incorporar y antes de avanzar el offset
+            if nuevos:
+                estado["almacen"] = self.__tamano_almacen()
+                self.__guardar_estado()
+                anexar_clientes_csv(nuevos, self.archivo_clientes)
+                importados, _ = self.__gestor.incorporar_clientes(nuevos)
+                incorporados += importados
+
+            estado.pop("almacen", None)
+            estado["offset"] += fin
+            self.__guardar_estado()
+
+        # Un archivo que no cambia de tamano y esta importado por completo se archiva
+        if info.st_size == estado["tamano"] and estado["offset"] == info.st_size:
+            estado["estable"] += 1
+        else:
+            estado["estable"] = 0
+        estado["tamano"] = info.st_size
+
+        if estado["estable"] >= self.ciclos_estables:
+            self.__archivar(entrada)
+        else:
+            self.__guardar_estado()
+
+        return incorporados
+
+
+    def __clientes_nuevos(self, clientes: list) -> list:
+        # Descarta los emails ya registrados (en el gestor o en el CSV de clientes, que
+        # tras un reinicio puede tener mas de lo cargado) o repetidos dentro del bloque
+        if self.__registrados is None:
+            self.__registrados = self.__emails_registrados()
+        nuevos = []
+        for cliente in clientes:
+            email = cliente.email.lower()
+            if email not in self.__registrados:
+                self.__registrados.add(email)
+                nuevos.append(cliente)
+        return nuevos
+
+
+    def __emails_registrados(self) -> set:
+        registrados = {cliente.email.lower() for cliente in self.__gestor.clientes}
+        try:
+            with open(self.archivo_clientes, 'r', encoding='utf-8', newline='') as file:
+                registrados.update((fila.get('email') or '').strip().lower()
+                                for fila in csv.DictReader(file))
+        except FileNotFoundError:
+            pass
+        return registrados
+
+
+    def __tamano_almacen(self) -> int:
+        try:
+            return os.path.getsize(self.archivo_clientes)
+        except FileNotFoundError:
+            return 0
+
+
+    def __recortar_almacen(self, tamano: int):
+        if self.__tamano_almacen() > tamano:
+            with open(self.archivo_clientes, 'r+b') as file:
+                file.truncate(tamano)
+            # Los emails del bloque recortado ya no estan guardados
+            self.__registrados = None
+            registrar_log(f"INGESTA: {self.archivo_clientes} recortado a {tamano} bytes "
+                        f"(bloque sin confirmar)", "WARNING")
+
+
+    def __leer_encabezado(self, ruta: str, estado: dict) -> bool:
+        with open(ruta, 'rb') as file:
+            primera_linea = file.readline()
+
+        if not primera_linea.endswith(b'\n'):
+            return False  # Encabezado aun incompleto
+
+        estado["encabezado"] = next(csv.reader([primera_linea.decode('utf-8-sig')]))
+        estado["offset"] = len(primera_linea)
+        self.__guardar_estado()
+        return True
+
+
+    def __archivar(self, entrada):
+        os.makedirs(self.directorio_procesados, exist_ok=True)
+        destino = os.path.join(self.directorio_procesados, entrada.name)
+        if os.path.exists(destino):
+            base, extension = os.path.splitext(entrada.name)
+            sufijo = obtener_timestamp().replace(":", "").replace(" ", "_")
+            destino = os.path.join(self.directorio_procesados, f"{base}_{sufijo}{extension}")
+
+        os.replace(entrada.path, destino)
+        del self.__estado[entrada.name]
+        self.__guardar_estado()
+        registrar_log(f"INGESTA: {entrada.name} importado por completo y movido a {destino}")
+
+
+    def ejecutar(self, max_ciclos: int = None):
+        """
+        Bucle de vigilancia: revisa el directorio cada 'intervalo' segundos.
+        Se detiene con Ctrl+C o al completar 'max_ciclos' revisiones.
+
+        Args:
+            max_ciclos (int, optional): Numero maximo de revisiones. Por defecto, sin limite
+        """
+        ciclo = 0
+        try:
+            while max_ciclos is None or ciclo < max_ciclos:
+                incorporados = self.procesar_una_vez()
+                if incorporados:
+                    print(f"[OK] Ingesta: {incorporados} clientes incorporados.")
+                ciclo += 1
+                if max_ciclos is None or ciclo < max_ciclos:
+                    time.sleep(self.intervalo)
+        except KeyboardInterrupt:
+            print("\n[!] Vigilancia de directorio detenida.")
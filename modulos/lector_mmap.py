@@ -0,0 +1,210 @@
+"""
+==================
+Módulo lector_mmap
+==================
+Lector de CSV sobre un archivo mapeado en memoria (mmap), pensado para archivos
+muy grandes: el mapa se divide en registros con bytes.find/bytes.split (sin pasar
+por el decodificador de texto ni por el modulo csv) y solo se decodifican las
+columnas solicitadas.
+"""
+import mmap
+from modulos.excepciones import FormatoArchivoError
+
+
+COMILLA = b'"'
+SALTO = b'\n'
+
+# Bytes del mapa que se dividen en lineas de una sola vez
+TAMANO_BLOQUE = 4 * 1024 * 1024
+
+
+class LectorCSVMmap:
+    """
+    Recorre un CSV (RFC 4180) mapeado en memoria entregando un diccionario por registro,
+    con la misma interfaz que csv.DictReader (atributo fieldnames e iteracion).
+    Solo se decodifican a texto las columnas solicitadas.
+
+    Los campos entre comillas pueden contener comas, saltos de linea y comillas
+    duplicadas (""), como las direcciones de datos/clientes.csv.
+
+    Se usa como context manager para liberar el mapa y el archivo:
+
+        with LectorCSVMmap(ruta, ['tipo', 'email']) as lector:
+            for fila in lector:
+                ...
+    """
+
+    def __init__(self, ruta: str, columnas=None, desde_byte: int = 0,
+                hasta_byte: int = None, encabezado=None):
+        """
+        Args:
+            ruta (str): Ruta del archivo CSV (sin comprimir)
+            columnas (list, optional): Columnas a decodificar. Por defecto, todas
+            desde_byte (int): Posicion donde comienza la lectura (limite de registro)
+            hasta_byte (int, optional): Posicion donde termina la lectura
+            encabezado (list, optional): Columnas del archivo si el rango no incluye el encabezado
+        """
+        self.ruta = ruta
+        self.columnas = columnas
+        self.__hasta = hasta_byte
+        self.__file = None
+        self.__mapa = None
+        self.fieldnames = list(encabezado) if encabezado is not None else None
+        self.__inicio = desde_byte
+        self.__fin = 0
+        self.posicion = desde_byte  # Fin del ultimo bloque entregado (para informar el avance)
+
+
+    def __enter__(self):
+        self.__file = open(self.ruta, 'rb')
+        try:
+            self.__mapa = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__mapa = b''  # Archivo vacio: no se puede mapear
+
+        tamano = len(self.__mapa)
+        self.__fin = tamano if self.__hasta is None else min(self.__hasta, tamano)
+
+        if self.fieldnames is None and self.__inicio < self.__fin:
+            campos, self.__inicio = self.__leer_registro(self.__inicio)
+            if campos[0].startswith(b'\xef\xbb\xbf'):
+                campos[0] = campos[0][3:]
+            self.fieldnames = [campo.decode('utf-8') for campo in campos]
+        return self
+
+
+    def __exit__(self, *args):
+        if isinstance(self.__mapa, mmap.mmap):
+            self.__mapa.close()
+        self.__file.close()
+        return False
+
+
+    def __iter__(self):
+        if not self.fieldnames:
+            return
+
+        # Posicion de cada columna solicitada dentro del registro
+        nombres = self.fieldnames if self.columnas is None else self.columnas
+        indices = [(nombre, self.fieldnames.index(nombre))
+                for nombre in nombres if nombre in self.fieldnames]
+        separar = self.__separar_con_comillas
+
+        pendiente = None  # Registro con un campo citado que continua en la linea siguiente
+        for linea in self.__lineas():
+            if pendiente is not None:
+                linea = pendiente + SALTO + linea
+                pendiente = None
+
+            if COMILLA in linea:
+                if linea.count(COMILLA) % 2:
+                    pendiente = linea
+                    continue
+                campos = separar(linea.rstrip(b'\r'))
+            else:
+                linea = linea.rstrip(b'\r')
+                if not linea:
+                    continue  # Linea en blanco
+                campos = linea.split(b',')
+
+            total = len(campos)
+            yield {nombre: campos[indice].decode('utf-8') if indice < total else ''
+                for nombre, indice in indices}
+
+        if pendiente is not None:
+            raise FormatoArchivoError(self.ruta, "Comillas sin cerrar al final del archivo")
+
+
+    def __lineas(self):
+        """
+        Entrega las lineas del rango en bloques grandes: cada bloque termina en un salto
+        de linea y se divide con una sola llamada a bytes.split.
+        """
+        mapa = self.__mapa
+        posicion = self.__inicio
+        fin = self.__fin
+
+        while posicion < fin:
+            limite = min(posicion + TAMANO_BLOQUE, fin)
+            if limite < fin:
+                corte = mapa.rfind(SALTO, posicion, limite)
+                if corte < 0:
+                    corte = mapa.find(SALTO, limite, fin)
+                limite = fin if corte < 0 else corte + 1
+
+            self.posicion = limite
+            lineas = mapa[posicion:limite].split(SALTO)
+            if lineas[-1] == b'':
+                lineas.pop()
+            yield from lineas
+            posicion = limite
+
+
+    def __leer_registro(self, posicion: int) -> tuple[list, int]:
+        """
+        Separa el registro que comienza en 'posicion' en sus campos (sin decodificar).
+        Se usa para el encabezado.
+
+        Returns:
+            tuple: (lista de campos en bytes, posicion del siguiente registro)
+        """
+        mapa = self.__mapa
+        fin = self.__fin
+
+        salto = mapa.find(SALTO, posicion, fin)
+        if salto < 0:
+            salto = fin
+        linea = mapa[posicion:salto]
+
+        # Un numero impar de comillas indica un salto de linea dentro de un campo
+        while linea.count(COMILLA) % 2 and salto < fin:
+            siguiente = mapa.find(SALTO, salto + 1, fin)
+            if siguiente < 0:
+                siguiente = fin
+            linea = mapa[posicion:siguiente]
+            salto = siguiente
+
+        if linea.count(COMILLA) % 2:
+            raise FormatoArchivoError(self.ruta, f"Comillas sin cerrar en el byte {posicion}")
+
+        linea = linea.rstrip(b'\r')
+        if COMILLA not in linea:
+            return linea.split(b','), salto + 1
+        return self.__separar_con_comillas(linea), salto + 1
+
+
+    @staticmethod
+    def __separar_con_comillas(linea: bytes) -> list:
+        """
+        Separa un registro que contiene campos entre comillas. Al dividir por comillas,
+        los tramos impares estan dentro de un campo citado y los pares fuera de el;
+        un tramo par vacio entre dos impares corresponde a una comilla escapada ("").
+        """
+        tramos = linea.split(COMILLA)
+        if len(tramos) == 3:
+            # Caso mas comun: un unico campo citado (por ejemplo, la direccion)
+            antes, citado, despues = tramos
+            campos = antes.split(b',')
+            resto = despues.split(b',')
+            campos[-1] += citado + resto[0]
+            campos.extend(resto[1:])
+            return campos
+
+        ultimo = len(tramos) - 1
+        campos = []
+        actual = b''
+
+        for i, tramo in enumerate(tramos):
+            if i % 2:
+                actual += tramo
+            elif not tramo and 0 < i < ultimo:
+                actual += COMILLA
+            else:
+                partes = tramo.split(b',')
+                actual += partes[0]
+                for parte in partes[1:]:
+                    campos.append(actual)
+                    actual = parte
+
+        campos.append(actual)
+        return campos
@@ -0,0 +1,192 @@
+"""
+=============================
+Módulo perfiles_importacion
+=============================
+Perfiles de mapeo de columnas para importar CSV de socios con un formato distinto
+al de datos/clientes.csv, sin tener que reescribir el archivo antes de importarlo.
+"""
+import json
+import unicodedata
+from modulos.excepciones import FormatoArchivoError
+
+
+# Columnas que crear_cliente_desde_fila() necesita en cada fila
+COLUMNAS_REQUERIDAS = ('tipo', 'nombre', 'email', 'telefono', 'direccion')
+
+# Columnas propias de cada tipo de cliente
+COLUMNAS_OPCIONALES = ('puntos', 'empresa', 'rut')
+
+
+def normalizar_encabezado(nombre: str) -> str:
+    """
+    Normaliza un nombre de columna para compararlo: sin acentos, en minusculas y con
+    '_' en lugar de espacios y guiones ("Correo-Electrónico" -> "correo_electronico").
+    """
+    sin_acentos = unicodedata.normalize('NFKD', nombre).encode('ascii', 'ignore').decode('ascii')
+    return "_".join(sin_acentos.lower().replace("-", " ").split())
+
+
+def inferir_tipo(fila: dict) -> str:
+    """
+    Deduce el tipo de cliente a partir de las columnas con datos:
+    empresa o RUT -> Corporativo, puntos -> Premium, en otro caso Regular.
+    """
+    if fila.get('empresa') or fila.get('rut'):
+        return "Corporativo"
+    if fila.get('puntos'):
+        return "Premium"
+    return "Regular"
+
+
+class PerfilMapeo:
+    """
+    Describe como traducir las columnas de un CSV externo a las columnas estandar.
+
+    Atributos:
+        nombre (str): Identificador del perfil
+        alias (dict): Columna estandar -> lista de nombres alternativos (se comparan normalizados)
+        renombrar (dict): Columna del archivo (nombre exacto) -> columna estandar
+        valores_defecto (dict): Columna estandar -> valor constante si falta o esta vacia
+        inferir_tipo (bool): Si es True, deduce 'tipo' cuando no viene en el archivo
+    """
+
+    def __init__(self, nombre: str, alias: dict = None, renombrar: dict = None,
+                valores_defecto: dict = None, inferir_tipo: bool = False):
+        self.nombre = nombre
+        self.alias = alias or {}
+        self.renombrar = renombrar or {}
+        self.valores_defecto = valores_defecto or {}
+        self.inferir_tipo = inferir_tipo
+
+
+    def __repr__(self) -> str:
+        return f"PerfilMapeo(nombre='{self.nombre}')"
+
+
+    @classmethod
+    def desde_dict(cls, nombre: str, datos: dict) -> "PerfilMapeo":
+        """
+        Crea un perfil desde un diccionario (por ejemplo, leido de JSON) con las claves
+        'alias', 'renombrar', 'valores_defecto' e 'inferir_tipo'.
+        """
+        return cls(
+            nombre,
+            alias=datos.get('alias'),
+            renombrar=datos.get('renombrar'),
+            valores_defecto=datos.get('valores_defecto'),
+            inferir_tipo=datos.get('inferir_tipo', False)
+        )
+
+
+    def compilar(self, encabezado: list):
+        """
+        Resuelve una sola vez, para el encabezado de un archivo, de que columna sale
+        cada dato y retorna la funcion que transforma cada fila.
+
+        Args:
+            encabezado (list): Columnas del archivo a importar
+        Returns:
+            function: Funcion fila (dict) -> fila con columnas estandar (dict).
+                Su atributo 'columnas_origen' lista las columnas del archivo que usa.
+        Raises:
+            FormatoArchivoError: Si una columna requerida no tiene origen ni valor por defecto
+        """
+        encabezado = list(encabezado or [])
+        normalizados = {normalizar_encabezado(col): col for col in encabezado}
+
+        origen = {}
+        for estandar in COLUMNAS_REQUERIDAS + COLUMNAS_OPCIONALES:
+            candidatos = [estandar] + list(self.alias.get(estandar, []))
+            for candidato in candidatos:
+                columna = normalizados.get(normalizar_encabezado(candidato))
+                if columna is not None:
+                    origen[estandar] = columna
+                    break
+
+        # Los renombres explicitos tienen prioridad sobre los alias
+        for columna, estandar in self.renombrar.items():
+            if columna in encabezado:
+                origen[estandar] = columna
+
+        faltantes = [col for col in COLUMNAS_REQUERIDAS
+                    if col not in origen and col not in self.valores_defecto
+                    and not (col == 'tipo' and self.inferir_tipo)]
+        if faltantes:
+            raise FormatoArchivoError(
+                "", f"Perfil '{self.nombre}': no hay columna para {', '.join(faltantes)}")
+
+        pares = tuple(origen.items())
+        defectos = tuple(self.valores_defecto.items())
+        deducir_tipo = self.inferir_tipo
+
+        def transformar(fila: dict) -> dict:
+            salida = {estandar: fila.get(columna) or '' for estandar, columna in pares}
+            for estandar, valor in defectos:
+                if not salida.get(estandar):
+                    salida[estandar] = valor
+            if deducir_tipo and not salida.get('tipo'):
+                salida['tipo'] = inferir_tipo(salida)
+            return salida
+
+        transformar.columnas_origen = [columna for _, columna in pares]
+        return transformar
+
+
+"""
+REGISTRO DE PERFILES
+"""
+PERFILES = {}
+
+
+def registrar_perfil(perfil: PerfilMapeo) -> PerfilMapeo:
+    """
+    Registra un perfil para poder usarlo por su nombre en importar_clientes_csv().
+    """
+    PERFILES[perfil.nombre] = perfil
+    return perfil
+
+
+def obtener_perfil(perfil) -> PerfilMapeo:
+    """
+    Retorna el perfil registrado con ese nombre (o el mismo perfil si ya es un PerfilMapeo).
+
+    Raises:
+        FormatoArchivoError: Si no existe un perfil con ese nombre
+    """
+    if isinstance(perfil, PerfilMapeo):
+        return perfil
+    if perfil not in PERFILES:
+        raise FormatoArchivoError("", f"Perfil de importacion desconocido: {perfil}")
+    return PERFILES[perfil]
+
+
+def cargar_perfiles_json(ruta: str) -> list:
+    """
+    Registra los perfiles definidos en un archivo JSON con la forma
+    {"nombre_perfil": {"alias": {...}, "renombrar": {...}, ...}, ...}.
+
+    Returns:
+        list: Nombres de los perfiles registrados
+    """
+    with open(ruta, 'r', encoding='utf-8') as file:
+        definiciones = json.load(file)
+    for nombre, datos in definiciones.items():
+        registrar_perfil(PerfilMapeo.desde_dict(nombre, datos))
+    return list(definiciones)
+
+
+# Perfil con los nombres de columna mas habituales en archivos de socios
+registrar_perfil(PerfilMapeo(
+    "alias_comunes",
+    alias={
+        'tipo': ['tipo_cliente', 'categoria', 'segmento'],
+        'nombre': ['nombre_completo', 'cliente', 'contacto', 'name'],
+        'email': ['correo', 'correo_electronico', 'e_mail', 'mail'],
+        'telefono': ['fono', 'celular', 'movil', 'phone'],
+        'direccion': ['domicilio', 'direccion_completa', 'address'],
+        'puntos': ['puntos_acumulados', 'points'],
+        'empresa': ['nombre_empresa', 'razon_social', 'company'],
+        'rut': ['rut_empresa']
+    },
+    inferir_tipo=True
+))
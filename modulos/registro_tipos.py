@@ -0,0 +1,182 @@
+"""
+=====================
+Módulo registro_tipos
+=====================
+Registro de los tipos de cliente para la serializacion (CSV, JSON Lines y reportes).
+
+Cada subclase de Cliente se registra con el decorador @registrar_tipo_cliente y
+declara sus campos propios; a partir de ellos se precompilan, una sola vez, el
+codificador y el decodificador de filas de ese tipo. El codigo de archivos.py hace
+una unica busqueda por fila (por clase o por nombre de tipo) y no necesita
+conocer los tipos concretos: un tipo nuevo solo tiene que registrarse.
+
+Atributos de clase que lee el registro:
+    TIPO_CLIENTE (str): Nombre del tipo ("Premium")
+    CAMPOS_CSV (dict): Columna CSV -> (atributo, parametro del constructor, conversion)
+    CAMPOS_REPORTE (dict): Etiqueta en el reporte -> atributo
+"""
+from operator import attrgetter
+from modulos.excepciones import FormatoArchivoError
+
+
+# Columnas comunes a todos los tipos, en el orden del CSV
+COLUMNAS_BASE = ('nombre', 'email', 'telefono', 'direccion')
+
+_TIPOS = {}       # Nombre del tipo -> TipoCliente
+_POR_CLASE = {}   # Clase -> TipoCliente
+_COLUMNAS = ['tipo', *COLUMNAS_BASE]
+
+
+class TipoCliente:
+    """
+    Serializacion precompilada de un tipo de cliente.
+
+    Atributos:
+        nombre (str): Nombre del tipo
+        clase (type): Subclase de Cliente
+        codificar_fila (function): cliente -> lista de valores en el orden de columnas_csv()
+        decodificar_fila (function): fila del CSV (dict) -> cliente
+        desde_datos (function): diccionario de obtener_datos() -> cliente
+        leer_ficha (function): cliente -> tupla con los valores de su ficha en el reporte
+            (columnas comunes y campos de CAMPOS_REPORTE)
+        formatear_ficha (function): (numero, *ficha) -> texto de la ficha en el reporte
+    """
+
+    def __init__(self, clase):
+        self.nombre = clase.TIPO_CLIENTE
+        self.clase = clase
+        self.campos_csv = dict(getattr(clase, 'CAMPOS_CSV', {}))
+        self.campos_reporte = dict(getattr(clase, 'CAMPOS_REPORTE', {}))
+        self.leer_ficha, self.formatear_ficha = self.__compilar_ficha()
+        self.decodificar_fila = self.__compilar_decodificador()
+        self.desde_datos = self.__compilar_desde_datos()
+        self.codificar_fila = None
+
+
+    def __repr__(self) -> str:
+        return f"TipoCliente(nombre='{self.nombre}')"
+
+
+    def compilar_codificador(self, columnas: list):
+        """
+        Genera el codificador de filas para la lista de columnas indicada.
+        """
+        atributos = COLUMNAS_BASE + tuple(atributo for atributo, _, _ in self.campos_csv.values())
+        posiciones = tuple(columnas.index(c) for c in COLUMNAS_BASE + tuple(self.campos_csv))
+        leer = attrgetter(*atributos)
+        plantilla = [''] * len(columnas)
+        plantilla[0] = self.nombre
+
+        def codificar_fila(cliente) -> list:
+            fila = plantilla.copy()
+            for posicion, valor in zip(posiciones, leer(cliente)):
+                fila[posicion] = valor
+            return fila
+
+        self.codificar_fila = codificar_fila
+
+
+    def __compilar_decodificador(self):
+        clase = self.clase
+        extras = tuple((columna, parametro, convertir)
+                    for columna, (_, parametro, convertir) in self.campos_csv.items())
+
+        def decodificar_fila(fila: dict):
+            basicos = [(fila.get(columna) or '').strip() for columna in COLUMNAS_BASE]
+            opcionales = {}
+            for columna, parametro, convertir in extras:
+                valor = (fila.get(columna) or '').strip()
+                if valor:
+                    opcionales[parametro] = convertir(valor)
+            return clase(*basicos, **opcionales)
+
+        return decodificar_fila
+
+
+    def __compilar_desde_datos(self):
+        clase = self.clase
+        extras = tuple((atributo, parametro, convertir)
+                    for atributo, parametro, convertir in self.campos_csv.values())
+
+        def desde_datos(datos: dict):
+            basicos = [datos.get(columna, '') for columna in COLUMNAS_BASE]
+            opcionales = {parametro: convertir(datos[atributo])
+                        for atributo, parametro, convertir in extras
+                        if datos.get(atributo) not in (None, '')}
+            return clase(*basicos, **opcionales)
+
+        return desde_datos
+
+
+    def __compilar_ficha(self):
+        # Los valores se leen aparte del formato para poder capturarlos y armar la ficha despues
+        tipo = self.nombre.replace("{", "{{").replace("}", "}}")
+        formato = ("\n{}. {}\n   Tipo: " + tipo + "\n   Email: {}\n   Telefono: {}\n   Direccion: {}\n"
+                + "".join(f"   {etiqueta}: {{}}\n" for etiqueta in self.campos_reporte))
+        return attrgetter(*COLUMNAS_BASE, *self.campos_reporte.values()), formato.format
+
+
+"""
+REGISTRO
+"""
+def registrar_tipo_cliente(clase):
+    """
+    Decorador que registra una subclase de Cliente y precompila su serializacion.
+    """
+    for columna in getattr(clase, 'CAMPOS_CSV', {}):
+        if columna not in _COLUMNAS:
+            _COLUMNAS.append(columna)
+
+    tipo = TipoCliente(clase)
+    _TIPOS[tipo.nombre] = tipo
+    _POR_CLASE[clase] = tipo
+
+    # Una columna nueva cambia el ancho de la fila de todos los tipos
+    for registrado in _TIPOS.values():
+        registrado.compilar_codificador(_COLUMNAS)
+    return clase
+
+
+def columnas_csv() -> list:
+    """
+    Retorna las columnas del CSV: tipo, las columnas comunes y las de cada tipo registrado.
+    """
+    return list(_COLUMNAS)
+
+
+def tipos_registrados() -> list:
+    """
+    Retorna los tipos registrados en orden de registro.
+    """
+    return list(_TIPOS.values())
+
+
+def obtener_tipo_por_nombre(nombre: str) -> TipoCliente:
+    """
+    Retorna el tipo registrado con ese nombre.
+
+    Raises:
+        FormatoArchivoError: Si el tipo de cliente es desconocido
+    """
+    tipo = _TIPOS.get(nombre)
+    if tipo is None:
+        raise FormatoArchivoError("", f"Tipo de cliente desconocido: {nombre}")
+    return tipo
+
+
+def tipo_de(cliente) -> TipoCliente:
+    """
+    Retorna el tipo registrado de un cliente (una busqueda por su clase).
+
+    Raises:
+        FormatoArchivoError: Si la clase del cliente no esta registrada
+    """
+    tipo = _POR_CLASE.get(type(cliente))
+    if tipo is None:
+        # Subclase no registrada de un tipo registrado
+        for clase in type(cliente).__mro__[1:]:
+            if clase in _POR_CLASE:
+                tipo = _POR_CLASE[type(cliente)] = _POR_CLASE[clase]
+                return tipo
+        raise FormatoArchivoError("", f"Tipo de cliente no registrado: {type(cliente).__name__}")
+    return tipo
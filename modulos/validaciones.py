@@ -191,10 +191,11 @@ def validar_puntos(puntos: int, operacion: str = "agregar", disponibles: int = 0
     - Los puntos deben ser un numero entero
     - Para agregar: deben ser positivos
     - Para canjear: no pueden superar los disponibles
+    - Para saldo (puntos acumulados de un cliente): no pueden ser negativos
     
     Args:
         puntos (int): Cantidad de puntos a validar
-        operacion (str): Tipo de operacion ("agregar" o "canjear")
+        operacion (str): Tipo de operacion ("agregar", "canjear" o "saldo")
         disponibles (int): Puntos disponibles (para canje)
     Returns:
         bool: True si los puntos son validos
@@ -217,6 +218,10 @@ def validar_puntos(puntos: int, operacion: str = "agregar", disponibles: int = 0
         if puntos > disponibles:
             raise PuntosInvalidosError(puntos, disponibles, "canjear")
     
+    elif operacion == "saldo":
+        if puntos < 0:
+            raise PuntosInvalidosError(puntos, 0, "saldo")
+    
     return True
 
 
@@ -276,3 +281,47 @@ def validar_datos_corporativo(nombre_empresa: str, rut_empresa: str) -> dict:
         'nombre_empresa': nombre_empresa.strip(),
         'rut_empresa': rut_empresa.strip().upper()
     }
+
+
+"""
+NORMALIZACION
+"""
+# Palabras que quedan en minuscula dentro del nombre de una ciudad (Viña del Mar)
+CONECTORES_CIUDAD = {'de', 'del', 'la', 'las', 'los', 'y', 'el'}
+
+
+def extraer_ciudad(direccion: str) -> str:
+    """
+    Extrae la ciudad de una direccion, que se escribe al final despues de la ultima coma
+    ("Av. Libertador 1234, Iquique"), y la normaliza: espacios simples y cada palabra
+    con mayuscula inicial salvo los conectores ("VIÑA  DEL MAR" -> "Viña del Mar").
+    
+    Args:
+        direccion (str): Direccion del cliente
+    Returns:
+        str: Ciudad normalizada, o "" si la direccion no la incluye
+    """
+    if not direccion or ',' not in direccion:
+        return ""
+    
+    ciudad = direccion.rsplit(',', 1)[1]
+    if any(caracter.isdigit() for caracter in ciudad):
+        return ""
+    return normalizar_ciudad(ciudad)
+
+
+def normalizar_ciudad(ciudad: str) -> str:
+    """
+    Normaliza el nombre de una ciudad como lo hace extraer_ciudad ("  iquique " -> "Iquique"),
+    para comparar un nombre ingresado con las ciudades de los clientes.
+    
+    Args:
+        ciudad (str): Nombre de la ciudad
+    Returns:
+        str: Ciudad normalizada
+    """
+    palabras = ciudad.split()
+    return " ".join(
+        palabra.lower() if indice > 0 and palabra.lower() in CONECTORES_CIUDAD else palabra.capitalize()
+        for indice, palabra in enumerate(palabras)
+    )
@@ -0,0 +1,81 @@
+"""
+========================================
+Benchmark de generar_reporte - Sistema GIC
+========================================
+Mide el tiempo de generacion de reportes/resumen.txt para una cantidad grande de
+clientes (por defecto 1.000.000, repartidos entre los tres tipos).
+
+Ejecutar con:
+    python test/benchmark_reporte.py
+    python test/benchmark_reporte.py --clientes 200000 --repeticiones 5
+    python test/benchmark_reporte.py --procesos 4
+
+No forma parte de la suite de tests (pytest solo recolecta test_*.py).
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+# Asegurar que el módulo principal está en el path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.cliente_regular import ClienteRegular
+from modulos.cliente_premium import ClientePremium
+from modulos.cliente_corporativo import ClienteCorporativo
+from modulos.archivos import generar_reporte, nucleos_disponibles
+
+
+def crear_clientes(cantidad: int) -> list:
+    """
+    Crea 'cantidad' clientes validos, uno de cada tipo de forma alternada.
+    """
+    clientes = []
+    for i in range(cantidad):
+        email = f"cliente{i}@mail.com"
+        if i % 3 == 0:
+            clientes.append(ClienteRegular("Cliente Regular", email, "912345678", "Calle Norte 123"))
+        elif i % 3 == 1:
+            clientes.append(ClientePremium("Cliente Premium", email, "987654321", "Av. Sur 456", i % 5000))
+        else:
+            clientes.append(ClienteCorporativo("Cliente Corporativo", email, "955555555",
+                                            "Av. Industrial 789", "Empresa S.A.", "12.345.678-9"))
+    return clientes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de generar_reporte")
+    parser.add_argument("--clientes", type=int, default=1_000_000, help="Cantidad de clientes")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Veces que se genera el reporte")
+    parser.add_argument("--comprimido", action="store_true", help="Genera el reporte como .txt.gz")
+    parser.add_argument("--procesos", type=int, default=1, help="Procesos que arman las fichas")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    clientes = crear_clientes(args.clientes)
+    print(f"Clientes creados: {len(clientes):,} en {time.perf_counter() - inicio:.2f} s")
+    print(f"Procesos: {min(args.procesos, nucleos_disponibles())} "
+        f"(pedidos {args.procesos}, nucleos disponibles {nucleos_disponibles()})")
+
+    directorio = tempfile.mkdtemp(prefix="gic_benchmark_")
+    archivo = os.path.join(directorio, "resumen.txt.gz" if args.comprimido else "resumen.txt")
+    try:
+        tiempos = []
+        for _ in range(args.repeticiones):
+            inicio = time.perf_counter()
+            generar_reporte(clientes, archivo, procesos=args.procesos)
+            tiempos.append(time.perf_counter() - inicio)
+
+        mejor = min(tiempos)
+        print(f"Reporte: {os.path.getsize(archivo) / (1024 * 1024):.1f} MB")
+        print(f"Tiempo (mejor de {len(tiempos)}): {mejor:.2f} s "
+            f"({len(clientes) / mejor:,.0f} clientes/s)")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
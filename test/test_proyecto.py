@@ -28,6 +28,13 @@ import sys
 import csv
 import tempfile
 import shutil
+import gzip
+import json
+import hashlib
+import sqlite3
+import time
+import struct
+import threading
 from io import StringIO
 from unittest.mock import patch, MagicMock
 
@@ -66,7 +73,8 @@ from modulos.validaciones import (
     validar_rut,
     validar_puntos,
     validar_datos_cliente,
-    validar_datos_corporativo
+    validar_datos_corporativo,
+    extraer_ciudad
 )
 from modulos.archivos import (
     exportar_clientes_csv,
@@ -79,8 +87,25 @@ from modulos.archivos import (
     registrar_error,
     leer_log,
     crear_directorios,
-    crear_cliente_desde_fila
+    crear_cliente_desde_fila,
+    exportar_clientes_jsonl,
+    importar_clientes_jsonl,
+    iterar_clientes_jsonl,
+    exportar_clientes_particionado,
+    exportar_clientes_sqlite,
+    ordenar_filas_externo,
+    cliente_a_fila,
+    abrir_archivo
 )
+from modulos.ingesta import IngestorDirectorio, buscar_limite_registro
+from modulos.lector_mmap import LectorCSVMmap
+from modulos.perfiles_importacion import PerfilMapeo
+from modulos import columnar, registro_tipos
+from modulos.indice_csv import exportar_csv_indexado, LectorIndexado
+from modulos.analitica import SketchCuantiles, calcular_analitica, generar_reporte_analitico
+from modulos.facturacion import extraer_facturas
+from modulos.historial import (agregar_instantanea, consultar_historial, columnas_tipos, estructura_registro,
+                                MAGIA, MAGIA_V1)
 
 
 # ============================================================================
@@ -403,6 +428,12 @@ class TestValidaciones(unittest.TestCase):
         with self.assertRaises(PuntosInvalidosError):
             validar_puntos(150, "canjear", 100)
     
+    def test_puntos_saldo(self):
+        """Verifica que un saldo de puntos admite cero y rechaza negativos."""
+        self.assertTrue(validar_puntos("0", "saldo"))
+        with self.assertRaises(PuntosInvalidosError):
+            validar_puntos("-5", "saldo")
+    
     # --- Tests de validación completa de cliente ---
     def test_validar_datos_cliente_correctos(self):
         """Verifica validación completa de datos de cliente."""
@@ -426,6 +457,13 @@ class TestValidaciones(unittest.TestCase):
             "Calle Test 123"
         )
         self.assertEqual(datos['email'], "test@mail.com")
+    
+    def test_extraer_ciudad(self):
+        """Verifica que la ciudad se toma despues de la ultima coma y se normaliza."""
+        self.assertEqual(extraer_ciudad("Av. Libertador 1234, Iquique"), "Iquique")
+        self.assertEqual(extraer_ciudad("Calle 5, Depto 2,  VIÑA  DEL MAR "), "Viña del Mar")
+        self.assertEqual(extraer_ciudad("Calle Norte 123"), "")
+        self.assertEqual(extraer_ciudad("Los Olmos, 1234"), "")
 
 
 # ============================================================================
@@ -473,6 +511,14 @@ class TestCliente(unittest.TestCase):
         """Verifica que obtener_tipo retorna 'Cliente'."""
         self.assertEqual(self.cliente.obtener_tipo(), "Cliente")
     
+    def test_cliente_ciudad(self):
+        """Verifica que la ciudad se obtiene de la direccion al crear y al modificarla."""
+        self.assertEqual(self.cliente.ciudad, "")
+        self.cliente.direccion = "Av. Libertador 1234, iquique"
+        self.assertEqual(self.cliente.ciudad, "Iquique")
+        cliente = Cliente("Ana Soto", "ana@mail.com", "912345678", "Av. Sur 456, Viña del Mar")
+        self.assertEqual(cliente.ciudad, "Viña del Mar")
+    
     def test_cliente_obtener_datos(self):
         """Verifica que obtener_datos retorna diccionario correcto."""
         datos = self.cliente.obtener_datos()
@@ -971,6 +1017,269 @@ class TestGestorClientes(unittest.TestCase):
         
         self.assertEqual(self.gestor.obtener_total_clientes(), 2)
 
+    # --- Tests de seguimiento de cambios ---
+    def test_cambios_desde_secuencia(self):
+        """Verifica que solo se retornan los clientes modificados después de la secuencia."""
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+        sincronizado = self.gestor.secuencia_cambios
+        self.assertEqual(sincronizado, 3)
+
+        with patch('sys.stdout', new_callable=StringIO):
+            self.cliente_premium.agregar_puntos(10)
+            self.gestor.eliminar_cliente("juan@mail.com")
+
+        cambios = self.gestor.cambios_desde(sincronizado)
+        self.assertEqual([(c[0], c[2], c[3]) for c in cambios],
+                        [(4, 'modificacion', 'ana@mail.com'), (5, 'baja', 'juan@mail.com')])
+        self.assertIs(cambios[0][4], self.cliente_premium)
+        self.assertIsNone(cambios[1][4])
+        self.assertEqual(self.gestor.cambios_desde(self.gestor.secuencia_cambios), [])
+
+    def test_cambios_desde_fecha(self):
+        """Verifica el filtro por fecha y que un cliente aparece una sola vez con su último cambio."""
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        fecha_alta = self.gestor.cambios_desde()[0][1]
+        time.sleep(0.002)  # Fechas distintas aun con reloj de baja resolucion
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+        self.cliente_premium.telefono = "911111111"
+
+        cambios = self.gestor.cambios_desde(desde_fecha=fecha_alta.isoformat())
+        self.assertEqual([(c[2], c[3]) for c in cambios], [('modificacion', 'ana@mail.com')])
+
+    def test_cliente_eliminado_no_notifica(self):
+        """Verifica que un cliente eliminado deja de registrar cambios en el gestor."""
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.eliminar_cliente("juan@mail.com")
+        secuencia = self.gestor.secuencia_cambios
+        self.cliente_regular.nombre = "Otro Nombre"
+        self.assertEqual(self.gestor.secuencia_cambios, secuencia)
+
+    def test_exportar_cambios_csv(self):
+        """Verifica el CSV de cambios con registros completos y lápidas."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        archivo = os.path.join(temp_dir, "cambios.csv")
+
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.eliminar_cliente("juan@mail.com")
+            total = self.gestor.exportar_cambios_csv(archivo, desde_secuencia=1)
+        self.assertEqual(total, 2)
+
+        with open(archivo, 'r', encoding='utf-8') as f:
+            filas = list(csv.DictReader(f))
+        self.assertEqual([f['operacion'] for f in filas], ['alta', 'baja'])
+        self.assertEqual(filas[0]['empresa'], 'MiEmpresa S.A.')
+        self.assertEqual((filas[1]['email'], filas[1]['tipo'], filas[1]['nombre']), ('juan@mail.com', '', ''))
+        self.assertEqual(filas[1]['secuencia'], '3')
+
+    def test_conteo_por_tipo_mantenido(self):
+        """Verifica que los contadores por tipo se actualizan en altas y bajas."""
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.eliminar_cliente("ana@mail.com")
+        self.assertEqual(self.gestor.conteo_por_tipo(), {"Regular": 1, "Premium": 0, "Corporativo": 1})
+
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.limpiar_lista()
+        self.assertEqual(sum(self.gestor.conteo_por_tipo().values()), 0)
+
+    def test_generar_reporte_resumen_usa_contadores(self):
+        """Verifica que el modo resumen no recorre los clientes."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        archivo = os.path.join(temp_dir, "resumen.txt")
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+
+        with patch('sys.stdout', new_callable=StringIO), \
+                patch('modulos.archivos.tipo_de', side_effect=AssertionError("recorrio los clientes")):
+            self.assertTrue(self.gestor.generar_reporte_txt(archivo, modo="resumen"))
+
+        with open(archivo, 'r', encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertIn("Total de clientes: 2", contenido)
+        self.assertIn("Clientes Premium:     1", contenido)
+        self.assertNotIn("Juan Pérez", contenido)
+
+    def test_generar_reporte_txt_no_regenera_sin_cambios(self):
+        """Verifica que el reporte vigente no se regenera hasta que cambia el gestor o las opciones."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        archivo = os.path.join(temp_dir, "resumen.txt")
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+
+        with patch('sys.stdout', new_callable=StringIO), \
+                patch('modulos.gestor_clientes.generar_reporte', wraps=generar_reporte) as generar:
+            self.assertTrue(self.gestor.generar_reporte_txt(archivo))
+            self.assertTrue(self.gestor.generar_reporte_txt(archivo))
+            self.assertEqual(generar.call_count, 1)
+
+            self.gestor.generar_reporte_txt(archivo, modo="resumen")
+            self.assertEqual(generar.call_count, 2)
+
+            self.cliente_premium.agregar_puntos(10)
+            version = self.gestor.version
+            self.gestor.generar_reporte_txt(archivo, modo="resumen")
+            self.assertEqual(generar.call_count, 3)
+            self.assertEqual(self.gestor.version, version)
+
+            # Un reporte modificado por otro medio deja de estar vigente
+            with open(archivo, 'a', encoding='utf-8') as f:
+                f.write("editado")
+            self.gestor.generar_reporte_txt(archivo, modo="resumen")
+            self.assertEqual(generar.call_count, 4)
+
+            self.gestor.generar_reporte_txt(archivo, modo="resumen", forzar=True)
+            self.assertEqual(generar.call_count, 5)
+
+        # Otro gestor con la misma version no reutiliza el reporte
+        otro = GestorClientes()
+        otro.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.assertEqual(otro.version, 1)
+        with patch('sys.stdout', new_callable=StringIO):
+            otro.generar_reporte_txt(archivo, modo="resumen")
+        with open(archivo, 'r', encoding='utf-8') as f:
+            self.assertIn("Clientes Regular:     1", f.read())
+
+    def test_generar_reporte_txt_en_segundo_plano(self):
+        """Verifica que el reporte en segundo plano usa los clientes del momento en que se pidio."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        archivo = os.path.join(temp_dir, "resumen.txt")
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.assertIsNone(self.gestor.reporte_en_curso)
+
+        # El hilo no avanza hasta que se agregue el segundo cliente
+        continuar = threading.Event()
+        original = generar_reporte
+        def generar_pausado(*args, **kwargs):
+            continuar.wait(5)
+            return original(*args, **kwargs)
+
+        with patch('modulos.gestor_clientes.generar_reporte', side_effect=generar_pausado):
+            futuro = self.gestor.generar_reporte_txt(archivo, en_segundo_plano=True)
+            self.assertIs(self.gestor.reporte_en_curso, futuro)
+            self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+            self.cliente_regular.direccion = "Av. Costanera 999, Arica"
+            continuar.set()
+            self.assertTrue(futuro.result(timeout=5))
+
+        with open(archivo, 'r', encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertIn("Total de clientes: 1", contenido)
+        self.assertNotIn("Ana García", contenido)
+        self.assertIn("Direccion: Calle Norte 123", contenido)
+        self.assertNotIn("Costanera", contenido)
+
+        with patch('modulos.gestor_clientes.generar_reporte', side_effect=ArchivoError("disco lleno")):
+            futuro = self.gestor.generar_reporte_txt(archivo, en_segundo_plano=True)
+            self.assertIsInstance(futuro.exception(timeout=5), ArchivoError)
+
+    def test_historial_estadisticas(self):
+        """Verifica que el gestor registra sus estadisticas al exportar y por intervalo."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        archivo = os.path.join(temp_dir, "estadisticas.bin")
+        self.gestor.configurar_historial(archivo)
+        
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+        self.assertEqual(self.gestor.tendencia(), [])
+        with patch('sys.stdout', new_callable=StringIO):
+            self.cliente_premium.agregar_puntos(25)
+            self.gestor.exportar_csv(os.path.join(temp_dir, "clientes.csv"))
+        
+        registros = self.gestor.tendencia()
+        self.assertEqual(len(registros), 1)
+        self.assertEqual({k: registros[0][k] for k in ('total', 'premium', 'corporativo', 'puntos')},
+                        {'total': 2, 'premium': 1, 'corporativo': 1, 'puntos': 75})
+        
+        self.gestor.configurar_historial(archivo, intervalo=0)
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.assertEqual(self.gestor.tendencia()[-1]['regular'], 1)
+        self.assertEqual(self.gestor.estadisticas_actuales()['total'], 3)
+    
+    def test_historial_por_intervalo_despues_de_importar(self):
+        """Verifica que una importacion registra el historial una vez, con la carga completa."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        self.gestor.configurar_historial(os.path.join(temp_dir, "estadisticas.bin"), intervalo=0)
+        
+        with patch('modulos.gestor_clientes.registrar_alta_cliente'):
+            self.gestor.incorporar_clientes([self.cliente_regular, self.cliente_premium,
+                                            self.cliente_corporativo])
+        registros = self.gestor.tendencia()
+        self.assertEqual([r['total'] for r in registros], [3])
+        self.assertEqual(registros[0]['puntos'], 50)
+        
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.aplicar_a_todos('agregar_puntos', 10)
+        self.assertEqual([r['puntos'] for r in self.gestor.tendencia()], [50, 60])
+    
+    def test_extraer_facturas_solo_corporativos(self):
+        """Verifica que la extraccion de facturas usa solo el grupo de corporativos."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        with patch('sys.stdout', new_callable=StringIO):
+            self.assertIsNone(self.gestor.extraer_facturas(temp_dir))
+            self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+            self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+            manifiesto = self.gestor.extraer_facturas(temp_dir, num_particiones=3)
+        self.assertEqual((manifiesto["total_registros"], manifiesto["total_contactos"]), (1, 1))
+        self.assertEqual(len(manifiesto["particiones"]), 3)
+    
+    def test_indice_por_ciudad(self):
+        """Verifica el indice por ciudad en altas, bajas y cambios de direccion."""
+        self.cliente_regular.direccion = "Calle Norte 123, Iquique"
+        self.cliente_premium.direccion = "Av. Sur 456, IQUIQUE"
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_premium, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+        
+        self.assertEqual([c.email for c in self.gestor.obtener_clientes_por_ciudad(" iquique")],
+                        ["juan@mail.com", "ana@mail.com"])
+        self.assertEqual(self.gestor.conteo_por_ciudad(), {"Iquique": 2, "": 1})
+        
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.actualizar_cliente("ana@mail.com", "", "", "Av. Sur 456, Arica")
+            self.gestor.eliminar_cliente("juan@mail.com")
+        self.assertEqual(self.gestor.conteo_por_ciudad(), {"": 1, "Arica": 1})
+        self.assertEqual(self.gestor.obtener_clientes_por_ciudad("Iquique"), [])
+        self.assertEqual(self.gestor.obtener_clientes_por_ciudad("arica"), [self.cliente_premium])
+    
+    def test_ranking_premium(self):
+        """Verifica el ranking de clientes Premium por puntos y su archivo."""
+        self.gestor.agregar_cliente(self.cliente_regular, silencioso=True)
+        self.gestor.agregar_cliente(self.cliente_corporativo, silencioso=True)
+        for i, puntos in enumerate([30, 500, 30, 120]):
+            self.gestor.agregar_cliente(ClientePremium(f"Cliente {chr(65 + i)}", f"p{i}@mail.com",
+                                                    "987654321", "Av. Sur 456", puntos), silencioso=True)
+        
+        ranking = self.gestor.ranking_premium(3)
+        self.assertEqual([c.email for c in ranking], ["p1@mail.com", "p3@mail.com", "p0@mail.com"])
+        
+        with patch('sys.stdout', new_callable=StringIO):
+            self.gestor.buscar_cliente("p2@mail.com").agregar_puntos(1000)
+            self.gestor.eliminar_cliente("p1@mail.com")
+        self.assertEqual([c.email for c in self.gestor.ranking_premium(2)], ["p2@mail.com", "p3@mail.com"])
+        
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        archivo = os.path.join(temp_dir, "ranking.txt")
+        with patch('sys.stdout', new_callable=StringIO):
+            self.assertTrue(self.gestor.generar_ranking_premium(archivo, cantidad=10))
+        with open(archivo, 'r', encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertRegex(contenido, r"1  Cliente C +p2@mail.com +1030")
+        self.assertNotIn("juan@mail.com", contenido)
+
 
 # ============================================================================
 # SECCIÓN 8: TESTS DE ARCHIVOS
@@ -1035,6 +1344,232 @@ class TestArchivos(unittest.TestCase):
                             'puntos', 'empresa', 'rut']
         self.assertEqual(columnas, columnas_esperadas)
     
+    # --- Tests de exportación particionada ---
+    def test_exportar_particionado_por_tipo(self):
+        """Verifica un archivo por tipo y el manifiesto con filas y checksums."""
+        manifiesto = exportar_clientes_particionado(self.clientes, self.temp_dir, max_hilos=2)
+        
+        self.assertEqual(manifiesto['total_filas'], 3)
+        nombres = [p['archivo'] for p in manifiesto['particiones']]
+        self.assertEqual(nombres, ['clientes_corporativo.csv', 'clientes_premium.csv',
+                                'clientes_regular.csv'])
+        
+        for particion in manifiesto['particiones']:
+            with open(os.path.join(self.temp_dir, particion['archivo']), 'rb') as f:
+                contenido = f.read()
+            self.assertEqual(hashlib.sha256(contenido).hexdigest(), particion['sha256'])
+            self.assertEqual(len(contenido), particion['bytes'])
+        
+        with open(os.path.join(self.temp_dir, "manifiesto.json"), encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['total_filas'], 3)
+        
+        importados = importar_clientes_csv(os.path.join(self.temp_dir, 'clientes_premium.csv'))
+        self.assertEqual(importados[0].puntos_acumulados, 100)
+    
+    def test_exportar_particionado_por_dominio(self):
+        """Verifica que un mismo dominio cae siempre en la misma partición."""
+        manifiesto = exportar_clientes_particionado(
+            self.clientes, self.temp_dir, criterio="dominio", num_particiones=4)
+        
+        self.assertEqual(manifiesto['total_filas'], 3)
+        self.assertLessEqual(len(manifiesto['particiones']), 2)  # mail.com y empresa.com
+        
+        with self.assertRaises(ValueError):
+            exportar_clientes_particionado(self.clientes, self.temp_dir, criterio="dominio",
+                                        num_particiones=0)
+
+    def test_exportar_csv_fragmentos_por_filas(self):
+        """Verifica la división en fragmentos numerados y el índice de emails."""
+        exportar_clientes_csv(self.clientes, self.archivo_csv, max_filas=2)
+
+        with open(os.path.join(self.temp_dir, "clientes_test_indice.json"), encoding='utf-8') as f:
+            indice = json.load(f)
+        self.assertEqual(indice['total_filas'], 3)
+        self.assertEqual([(g['archivo'], g['filas'], g['primer_email'], g['ultimo_email'])
+                        for g in indice['fragmentos']],
+                        [('clientes_test_0001.csv', 2, 'juan@mail.com', 'ana@mail.com'),
+                        ('clientes_test_0002.csv', 1, 'pedro@empresa.com', 'pedro@empresa.com')])
+
+        importados = []
+        for fragmento in indice['fragmentos']:
+            ruta = os.path.join(self.temp_dir, fragmento['archivo'])
+            self.assertEqual(os.path.getsize(ruta), fragmento['bytes'])
+            importados += importar_clientes_csv(ruta)
+        self.assertEqual([c.email for c in importados], [c.email for c in self.clientes])
+        self.assertFalse(os.path.exists(self.archivo_csv))
+
+    def test_exportar_csv_fragmentos_por_bytes(self):
+        """Verifica que ningún fragmento supera max_bytes y que se borran fragmentos sobrantes."""
+        archivo = os.path.join(self.temp_dir, "clientes.csv.gz")
+        exportar_clientes_csv(self.clientes, archivo, max_filas=1)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "clientes_0003.csv.gz")))
+
+        exportar_clientes_csv(self.clientes, archivo, max_bytes=250)
+        with open(os.path.join(self.temp_dir, "clientes_indice.json"), encoding='utf-8') as f:
+            indice = json.load(f)
+        self.assertEqual(len(indice['fragmentos']), 2)
+        self.assertTrue(all(g['bytes'] <= 250 for g in indice['fragmentos']))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "clientes_0003.csv.gz")))
+
+        with gzip.open(os.path.join(self.temp_dir, "clientes_0002.csv.gz"), 'rb') as f:
+            self.assertEqual(len(f.read()), indice['fragmentos'][1]['bytes'])
+
+    def test_exportar_csv_ordenado(self):
+        """Verifica la exportación ordenada por email y por nombre."""
+        exportar_clientes_csv(self.clientes, self.archivo_csv, ordenar_por='email')
+        with open(self.archivo_csv, 'r', encoding='utf-8') as f:
+            emails = [fila['email'] for fila in csv.DictReader(f)]
+        self.assertEqual(emails, ['ana@mail.com', 'juan@mail.com', 'pedro@empresa.com'])
+        
+        exportar_clientes_csv(self.clientes, self.archivo_csv, ordenar_por='nombre', max_filas=2)
+        importados = importar_clientes_csv(os.path.join(self.temp_dir, "clientes_test_0001.csv"))
+        self.assertEqual([c.nombre for c in importados], ['Ana García', 'Juan Pérez'])
+        self.assertEqual(importados[0].puntos_acumulados, 100)
+    
+    def test_ordenar_filas_externo_con_tramos(self):
+        """Verifica que el ordenamiento por tramos en disco coincide con el ordenamiento en memoria."""
+        clientes = [ClientePremium(f"Cliente {chr(65 + i % 26)}{chr(65 + i // 26)}", f"c{(i * 37) % 100:03d}@mail.com",
+                                "912345678", "Calle Norte 123", i) for i in range(100)]
+        filas = [cliente_a_fila(c) for c in clientes]
+        esperado = [[str(v) for v in f] for f in sorted(filas, key=lambda f: f[2])]
+        
+        temporal = os.path.join(self.temp_dir, "orden")
+        os.makedirs(temporal)
+        ordenadas = list(ordenar_filas_externo(iter(filas), 'email', memoria_maxima=4096,
+                                            directorio_temporal=temporal))
+        self.assertEqual(ordenadas, esperado)
+        self.assertEqual(os.listdir(temporal), [])  # Tramos eliminados
+        
+        with self.assertRaises(ValueError):
+            list(ordenar_filas_externo(filas, 'inexistente'))
+    
+    def test_exportar_csv_indexado_busqueda(self):
+        """Verifica la búsqueda por email con el índice disperso, incluidos los límites de bloque."""
+        clientes = [ClienteRegular("Cliente Prueba", f"c{(i * 37) % 100:03d}@mail.com",
+                                "912345678", "Calle Norte, 123") for i in range(100)]
+        archivo = os.path.join(self.temp_dir, "ordenados.csv")
+        indice = exportar_csv_indexado(clientes, archivo, intervalo=8)
+        self.assertEqual(len(indice['claves']), 13)
+        self.assertEqual(indice['claves'], sorted(indice['claves']))
+        
+        lector = LectorIndexado(archivo)
+        for i in range(100):
+            fila = lector.buscar(f"C{i:03d}@mail.com")
+            self.assertEqual(fila['email'], f"c{i:03d}@mail.com")
+        self.assertEqual(fila['direccion'], "Calle Norte, 123")
+        self.assertIsNone(lector.buscar("a@mail.com"))     # Antes de la primera clave
+        self.assertIsNone(lector.buscar("c050x@mail.com"))  # Dentro de un bloque
+        self.assertNotIn("zz@mail.com", lector)             # Despues de la ultima
+    
+    def test_lector_indexado_indice_desactualizado(self):
+        """Verifica que se rechaza un índice que no corresponde al CSV y las rutas comprimidas."""
+        archivo = os.path.join(self.temp_dir, "ordenados.csv")
+        exportar_csv_indexado(self.clientes, archivo)
+        with open(archivo, 'a', encoding='utf-8') as f:
+            f.write("Regular,Otro,otro@mail.com,912345678,Calle 1,,,\n")
+        with self.assertRaises(FormatoArchivoError):
+            LectorIndexado(archivo)
+        with self.assertRaises(FormatoArchivoError):
+            exportar_csv_indexado(self.clientes, archivo + ".gz")
+        with self.assertRaises(ArchivoNoEncontradoError):
+            LectorIndexado(os.path.join(self.temp_dir, "no_existe.csv"))
+    
+    def test_progreso_exportacion_e_importacion(self):
+        """Verifica las llamadas al callback de progreso al exportar e importar."""
+        avances = []
+        exportar_clientes_csv(self.clientes, self.archivo_csv, progreso=avances.append,
+                            intervalo_progreso=2)
+        self.assertEqual([(a['filas'], a['terminado']) for a in avances],
+                        [(2, False), (3, False), (3, True)])
+        self.assertEqual(avances[-1]['bytes'], os.path.getsize(self.archivo_csv))
+        self.assertEqual(avances[-1]['operacion'], "exportacion")
+        
+        avances.clear()
+        importar_clientes_csv(self.archivo_csv, progreso=avances.append, intervalo_progreso=1)
+        self.assertEqual([a['filas'] for a in avances], [1, 2, 3, 3])
+        self.assertTrue(avances[-1]['terminado'])
+        self.assertEqual(avances[-1]['bytes'], os.path.getsize(self.archivo_csv))
+        
+        avances.clear()
+        importar_clientes_csv(self.archivo_csv, motor="mmap", progreso=avances.append)
+        self.assertEqual(len(avances), 1)
+        self.assertEqual(avances[0]['bytes'], os.path.getsize(self.archivo_csv))
+    
+    def test_progreso_reporte_y_fragmentos(self):
+        """Verifica el progreso del reporte y de la exportación en fragmentos."""
+        avances = []
+        generar_reporte(self.clientes, self.archivo_reporte, progreso=avances.append,
+                        intervalo_progreso=1)
+        self.assertEqual([a['filas'] for a in avances], [1, 2, 3, 3])
+        self.assertEqual(avances[-1]['bytes'], os.path.getsize(self.archivo_reporte))
+        
+        avances.clear()
+        exportar_clientes_csv(self.clientes, self.archivo_csv, max_filas=2, progreso=avances.append)
+        self.assertEqual(len(avances), 1)
+        self.assertEqual(avances[0]['filas'], 3)
+        self.assertTrue(avances[0]['terminado'])
+    
+    def test_progreso_con_compresion(self):
+        """Verifica el progreso al exportar y generar reportes .gz, .bz2 y .xz."""
+        generar_reporte(self.clientes, self.archivo_reporte)
+        bytes_reporte = os.path.getsize(self.archivo_reporte)
+        exportar_clientes_csv(self.clientes, self.archivo_csv)
+        bytes_csv = os.path.getsize(self.archivo_csv)
+        
+        for extension in (".gz", ".bz2", ".xz"):
+            with self.subTest(extension=extension):
+                avances = []
+                exportar_clientes_csv(self.clientes, self.archivo_csv + extension,
+                                    progreso=avances.append, intervalo_progreso=2)
+                self.assertEqual([a['filas'] for a in avances], [2, 3, 3])
+                self.assertEqual(avances[-1]['bytes'], bytes_csv)
+                
+                avances.clear()
+                generar_reporte(self.clientes, self.archivo_reporte + extension,
+                                progreso=avances.append, intervalo_progreso=1)
+                self.assertEqual([a['filas'] for a in avances], [1, 2, 3, 3])
+                self.assertEqual(avances[-1]['bytes'], bytes_reporte)
+    
+    def test_exportar_sqlite(self):
+        """Verifica el esquema tipado, los NULL por tipo y los índices de la base SQLite."""
+        archivo = os.path.join(self.temp_dir, "clientes.db")
+        self.assertTrue(exportar_clientes_sqlite(self.clientes, archivo))
+        
+        conexion = sqlite3.connect(archivo)
+        self.addCleanup(conexion.close)
+        filas = conexion.execute(
+            "SELECT tipo, email, puntos, typeof(puntos), empresa FROM clientes ORDER BY id").fetchall()
+        self.assertEqual(filas, [
+            ('Regular', 'juan@mail.com', None, 'null', None),
+            ('Premium', 'ana@mail.com', 100, 'integer', None),
+            ('Corporativo', 'pedro@empresa.com', None, 'null', 'MiEmpresa S.A.')
+        ])
+        indices = {fila[0] for fila in conexion.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertEqual(indices, {'idx_clientes_email', 'idx_clientes_tipo'})
+        self.assertFalse(os.path.exists(archivo + ".tmp"))
+    
+    def test_exportar_sqlite_reemplaza_y_falla_limpio(self):
+        """Verifica que se reemplaza la base anterior y que un error no deja archivos a medias."""
+        archivo = os.path.join(self.temp_dir, "clientes.db")
+        exportar_clientes_sqlite(self.clientes, archivo)
+        exportar_clientes_sqlite(self.clientes[:1], archivo)
+        with sqlite3.connect(archivo) as conexion:
+            self.assertEqual(conexion.execute("SELECT COUNT(*) FROM clientes").fetchone()[0], 1)
+        
+        # Email duplicado: el indice unico falla y la base anterior se conserva
+        with self.assertRaises(ArchivoError):
+            exportar_clientes_sqlite(self.clientes + self.clientes[:1], archivo)
+        self.assertFalse(os.path.exists(archivo + ".tmp"))
+        with sqlite3.connect(archivo) as conexion:
+            self.assertEqual(conexion.execute("SELECT COUNT(*) FROM clientes").fetchone()[0], 1)
+        
+        # Sin permiso para reemplazar el destino: tampoco queda la base temporal
+        with patch('modulos.archivos.os.replace', side_effect=PermissionError):
+            with self.assertRaises(PermisoArchivoError):
+                exportar_clientes_sqlite(self.clientes, archivo)
+        self.assertFalse(os.path.exists(archivo + ".tmp"))
+    
     # --- Tests de importación CSV ---
     def test_importar_csv_exitoso(self):
         """Verifica importación exitosa desde CSV."""
@@ -1089,6 +1624,170 @@ class TestArchivos(unittest.TestCase):
         with self.assertRaises(FormatoArchivoError):
             importar_clientes_csv(self.archivo_csv)
     
+    # --- Tests del motor de importación mmap ---
+    def test_importar_csv_motor_mmap(self):
+        """Verifica que el motor mmap importa los mismos clientes que el motor csv."""
+        self.clientes.append(ClienteRegular(
+            "Luis Rojas", "luis@mail.com", "912345678", "Av. Libertador 1234, Iquique"))
+        exportar_clientes_csv(self.clientes, self.archivo_csv)
+        
+        por_csv = importar_clientes_csv(self.archivo_csv)
+        por_mmap = importar_clientes_csv(self.archivo_csv, motor="mmap")
+        
+        self.assertEqual([c.obtener_datos() for c in por_mmap],
+                        [c.obtener_datos() for c in por_csv])
+    
+    def test_lector_mmap_campos_citados_y_columnas(self):
+        """Verifica comillas escapadas, saltos de línea citados y decodificación selectiva."""
+        with open(self.archivo_csv, 'w', encoding='utf-8', newline='') as f:
+            f.write('tipo,nombre,direccion\r\n')
+            f.write('Regular,"Perez, ""Juan""","Calle 1,\nIquique"\r\n')
+            f.write('Premium,Ana,Av. Sur 456\r\n')
+        
+        with LectorCSVMmap(self.archivo_csv, ['direccion', 'nombre']) as lector:
+            filas = list(lector)
+        
+        self.assertEqual(filas[0], {'direccion': 'Calle 1,\nIquique', 'nombre': 'Perez, "Juan"'})
+        self.assertEqual(filas[1], {'direccion': 'Av. Sur 456', 'nombre': 'Ana'})
+    
+    # --- Tests de perfiles de mapeo de columnas ---
+    def test_importar_csv_perfil_alias_e_inferencia(self):
+        """Verifica alias de encabezados e inferencia de tipo con el perfil alias_comunes."""
+        with open(self.archivo_csv, 'w', encoding='utf-8') as f:
+            f.write("Nombre Completo,Correo,Fono,Domicilio,Razón Social,RUT Empresa,Puntos\n")
+            f.write("Juan Perez,juan@mail.com,912345678,Calle Norte 123,,,\n")
+            f.write("Ana Garcia,ana@mail.com,987654321,Av. Sur 456,,,300\n")
+            f.write("Pedro Lopez,pedro@corp.com,955555555,Av. Industrial 789,Corp S.A.,12.345.678-9,\n")
+        
+        for motor in ("csv", "mmap"):
+            with self.subTest(motor=motor):
+                importados = importar_clientes_csv(self.archivo_csv, motor=motor, perfil="alias_comunes")
+                self.assertEqual([c.obtener_tipo() for c in importados],
+                                ["Regular", "Premium", "Corporativo"])
+                self.assertEqual(importados[1].puntos_acumulados, 300)
+                self.assertEqual(importados[2].rut_empresa, "12.345.678-9")
+    
+    def test_importar_csv_perfil_renombrar_y_defecto(self):
+        """Verifica renombres explícitos, valores por defecto y columnas faltantes."""
+        with open(self.archivo_csv, 'w', encoding='utf-8') as f:
+            f.write("cli,mail,tel,dir\n")
+            f.write("Juan Perez,juan@mail.com,912345678,Calle Norte 123\n")
+        
+        perfil = PerfilMapeo(
+            "socio_x",
+            renombrar={'cli': 'nombre', 'mail': 'email', 'tel': 'telefono', 'dir': 'direccion'},
+            valores_defecto={'tipo': 'Premium', 'puntos': '50'}
+        )
+        importados = importar_clientes_csv(self.archivo_csv, perfil=perfil)
+        self.assertEqual(importados[0].puntos_acumulados, 50)
+        
+        with self.assertRaises(FormatoArchivoError):
+            importar_clientes_csv(self.archivo_csv, perfil=PerfilMapeo("incompleto"))
+    
+    # --- Tests de simulación de importación ---
+    def test_importar_csv_simulacion_informe(self):
+        """Verifica que la simulación cuenta rechazos por validador sin importar."""
+        with open(self.archivo_csv, 'w', encoding='utf-8') as f:
+            f.write("tipo,nombre,email,telefono,direccion,puntos,empresa,rut\n")
+            f.write("Regular,Juan Perez,juan@mail.com,912345678,Calle Norte 123,,,\n")
+            f.write("Premium,Ana Garcia,correo-invalido,123,Av. Sur 456,10,,\n")
+            f.write("Otro,X,otro@mail.com,912345678,Calle 123,,,\n")
+        
+        informe = importar_clientes_csv(self.archivo_csv, simular=True)
+        
+        self.assertEqual(informe['filas'], 3)
+        self.assertEqual(informe['validas'], 1)
+        self.assertEqual(informe['rechazadas'], 2)
+        self.assertEqual(informe['rechazos_por_validador'],
+                        {'email': 1, 'telefono': 1, 'nombre': 1, 'tipo': 1})
+        self.assertGreater(informe['memoria_estimada'], 0)
+        self.assertIn('filas_por_segundo', informe)
+    
+    def test_importar_csv_simulacion_rut_y_puntos(self):
+        """Verifica que la simulación cuenta como válidas las filas que la importación carga y
+        advierte del RUT y los puntos fuera de formato."""
+        with open(self.archivo_csv, 'w', encoding='utf-8') as f:
+            f.write("tipo,nombre,email,telefono,direccion,puntos,empresa,rut\n")
+            f.write("Premium,Ana Garcia,ana@mail.com,912345678,Av. Sur 456,-5,,\n")
+            f.write("Premium,Eva Soto,eva@mail.com,912345678,Av. Sur 456,muchos,,\n")
+            f.write("Corporativo,Luis Rojas,luis@mail.com,912345678,Calle 123,,Empresa,12-3\n")
+            f.write("Corporativo,Rosa Diaz,rosa@mail.com,912345678,Calle 123,,Empresa,76.543.210-K\n")
+        
+        informe = importar_clientes_csv(self.archivo_csv, simular=True)
+        
+        self.assertEqual(informe['validas'], 3)
+        self.assertEqual(informe['rechazadas'], 1)
+        self.assertEqual(informe['rechazos_por_validador'], {'puntos': 1})
+        self.assertEqual(informe['advertencias'], {'puntos': 1, 'rut': 1})
+        self.assertEqual(len(importar_clientes_csv(self.archivo_csv)), informe['validas'])
+    
+    def test_importar_csv_simulacion_no_registra_log(self):
+        """Verifica que la simulación no escribe en el log."""
+        exportar_clientes_csv(self.clientes, self.archivo_csv)
+        
+        with patch('modulos.archivos.registrar_log') as mock_log:
+            informe = importar_clientes_csv(self.archivo_csv, simular=True)
+        
+        mock_log.assert_not_called()
+        self.assertEqual(informe['validas'], 3)
+    
+    # --- Tests de JSON Lines ---
+    def test_exportar_importar_jsonl(self):
+        """Verifica que JSONL conserva los campos propios de cada tipo."""
+        archivo_jsonl = os.path.join(self.temp_dir, "clientes.jsonl")
+        exportar_clientes_jsonl(self.clientes, archivo_jsonl)
+        
+        with open(archivo_jsonl, 'r', encoding='utf-8') as f:
+            lineas = f.readlines()
+        self.assertEqual(len(lineas), 3)
+        self.assertIn('"puntos_acumulados":100', lineas[1])
+        
+        importados = importar_clientes_jsonl(archivo_jsonl)
+        self.assertEqual([c.obtener_datos() for c in importados],
+                        [c.obtener_datos() for c in self.clientes])
+    
+    def test_iterar_clientes_jsonl_lineas_invalidas(self):
+        """Verifica que las líneas inválidas se reportan sin detener la lectura."""
+        archivo_jsonl = os.path.join(self.temp_dir, "clientes.jsonl.gz")
+        exportar_clientes_jsonl(self.clientes[:1], archivo_jsonl)
+        with gzip.open(archivo_jsonl, 'at', encoding='utf-8') as f:
+            f.write('{no es json}\n\n{"tipo": "Otro"}\n')
+        
+        errores = []
+        clientes = list(iterar_clientes_jsonl(archivo_jsonl, errores))
+        
+        self.assertEqual(len(clientes), 1)
+        self.assertEqual(len(errores), 2)
+    
+    # --- Tests de exportación columnar ---
+    def test_exportar_columnar_leer_columnas(self):
+        """Verifica que cada columna se lee por separado con sus valores."""
+        archivo = os.path.join(self.temp_dir, "clientes.gicc")
+        self.assertTrue(columnar.exportar_clientes_columnar(self.clientes, archivo))
+        
+        self.assertEqual(columnar.leer_pie(archivo)["filas"], 3)
+        self.assertEqual(list(columnar.leer_columna('puntos_acumulados', archivo)), [0, 100, 0])
+        self.assertEqual(list(columnar.leer_columna('tipo', archivo)),
+                        ['Regular', 'Premium', 'Corporativo'])
+        self.assertEqual(list(columnar.leer_columna('direccion', archivo)),
+                        [c.direccion for c in self.clientes])
+        
+        codigos, dominios = columnar.leer_columna('email_dominio', archivo, como_codigos=True)
+        self.assertEqual(list(dominios), ['mail.com', 'empresa.com'])
+        self.assertEqual(list(codigos), [0, 0, 1])
+    
+    def test_leer_columna_archivo_invalido(self):
+        """Verifica errores de formato y de columna inexistente."""
+        archivo = os.path.join(self.temp_dir, "clientes.gicc")
+        with open(archivo, 'wb') as f:
+            f.write(b"no es columnar" * 3)
+        with self.assertRaises(FormatoArchivoError):
+            columnar.leer_columna('tipo', archivo)
+        
+        columnar.exportar_clientes_columnar([], archivo)
+        with self.assertRaises(FormatoArchivoError):
+            columnar.leer_columna('inexistente', archivo)
+    
     # --- Tests de crear_cliente_desde_fila ---
     def test_crear_cliente_desde_fila_regular(self):
         """Verifica creación de cliente Regular desde fila."""
@@ -1146,7 +1845,52 @@ class TestArchivos(unittest.TestCase):
         }
         with self.assertRaises(FormatoArchivoError):
             crear_cliente_desde_fila(fila)
-    
+
+    # --- Tests del registro de tipos ---
+    def test_registro_tipos_incluidos(self):
+        """Verifica que los tres tipos del sistema están registrados con sus columnas."""
+        self.assertEqual([t.nombre for t in registro_tipos.tipos_registrados()],
+                        ['Regular', 'Premium', 'Corporativo'])
+        self.assertEqual(registro_tipos.columnas_csv(),
+                        ['tipo', 'nombre', 'email', 'telefono', 'direccion', 'puntos', 'empresa', 'rut'])
+
+    def test_registro_tipos_codificar_fila(self):
+        """Verifica las filas generadas por el codificador de cada tipo."""
+        filas = [registro_tipos.tipo_de(c).codificar_fila(c) for c in self.clientes]
+        self.assertEqual(filas[1][0], 'Premium')
+        self.assertEqual(filas[1][5], 100)
+        self.assertEqual(filas[2][6:], ['MiEmpresa S.A.', '12.345.678-9'])
+        self.assertEqual(filas[0][5:], ['', '', ''])
+
+    def test_registro_tipo_nuevo_sin_modificar_archivos(self):
+        """Verifica que un tipo registrado fuera de archivos.py se exporta, importa y reporta."""
+        with patch.dict(registro_tipos._TIPOS), patch.dict(registro_tipos._POR_CLASE):
+            @registro_tipos.registrar_tipo_cliente
+            class ClienteEmbajador(Cliente):
+                TIPO_CLIENTE = "Embajador"
+                CAMPOS_CSV = {'puntos': ('referidos', 'referidos', int)}
+                CAMPOS_REPORTE = {'Referidos': 'referidos'}
+
+                def __init__(self, nombre, email, telefono, direccion, referidos=0):
+                    super().__init__(nombre, email, telefono, direccion)
+                    self.referidos = referidos
+
+            embajador = ClienteEmbajador("Eva Soto", "eva@mail.com", "912345678", "Calle Uno 111", 7)
+            exportar_clientes_csv(self.clientes + [embajador], self.archivo_csv)
+            importados = importar_clientes_csv(self.archivo_csv)
+
+            self.assertIsInstance(importados[-1], ClienteEmbajador)
+            self.assertEqual(importados[-1].referidos, 7)
+
+            generar_reporte([embajador], self.archivo_reporte)
+            with open(self.archivo_reporte, 'r', encoding='utf-8') as f:
+                contenido = f.read()
+            self.assertIn("Clientes Embajador:   1", contenido)
+            self.assertIn("Referidos: 7", contenido)
+
+        with self.assertRaises(FormatoArchivoError):
+            registro_tipos.obtener_tipo_por_nombre("Embajador")
+
     # --- Tests de generación de reporte ---
     def test_generar_reporte_exitoso(self):
         """Verifica generación exitosa de reporte."""
@@ -1178,6 +1922,313 @@ class TestArchivos(unittest.TestCase):
         
         self.assertIn("No hay clientes registrados", contenido)
     
+    def test_generar_reporte_resumen(self):
+        """Verifica el modo resumen: estadisticas sin la lista de clientes."""
+        generar_reporte(self.clientes, self.archivo_reporte, modo="resumen")
+        
+        with open(self.archivo_reporte, 'r', encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertIn("Total de clientes: 3", contenido)
+        self.assertIn("Clientes Corporativo: 1", contenido)
+        self.assertNotIn("LISTA DE CLIENTES", contenido)
+        self.assertNotIn("Juan Pérez", contenido)
+    
+    def test_generar_reporte_paginado(self):
+        """Verifica el modo paginado desde un iterador y la limpieza de paginas sobrantes."""
+        base = os.path.join(self.temp_dir, "reporte")
+        with open(base + "_0003.txt", 'w', encoding='utf-8') as f:
+            f.write("pagina de un reporte anterior")
+        
+        generar_reporte(iter(self.clientes), self.archivo_reporte.replace("reporte_test", "reporte"),
+                        modo="paginado", clientes_por_pagina=2)
+        
+        with open(base + ".txt", 'r', encoding='utf-8') as f:
+            resumen = f.read()
+        self.assertIn("Total de clientes: 3", resumen)
+        self.assertIn("Paginas: 2", resumen)
+        with open(base + "_0002.txt", 'r', encoding='utf-8') as f:
+            pagina = f.read()
+        self.assertIn("3. Pedro López", pagina)
+        self.assertNotIn("Ana García", pagina)
+        self.assertFalse(os.path.exists(base + "_0003.txt"))
+    
+    def test_generar_reporte_resumen_y_paginado_comprimidos(self):
+        """Verifica los modos resumen y paginado con .bz2 y .xz, con y sin progreso."""
+        for extension in (".bz2", ".xz"):
+            for progreso in (None, []):
+                with self.subTest(extension=extension, progreso=progreso is not None):
+                    callback = None if progreso is None else progreso.append
+                    archivo = os.path.join(self.temp_dir, "reporte.txt" + extension)
+                    
+                    generar_reporte(self.clientes, archivo, modo="resumen", progreso=callback)
+                    with abrir_archivo(archivo) as f:
+                        self.assertIn("Total de clientes: 3", f.read())
+                    
+                    generar_reporte(iter(self.clientes), archivo, modo="paginado",
+                                    clientes_por_pagina=2, progreso=callback)
+                    with abrir_archivo(archivo) as f:
+                        self.assertIn("Paginas: 2", f.read())
+                    with abrir_archivo(os.path.join(self.temp_dir, "reporte_0002.txt" + extension)) as f:
+                        self.assertIn("3. Pedro López", f.read())
+                    if progreso is not None:
+                        self.assertTrue(progreso[-1]['terminado'])
+                        self.assertGreater(progreso[-1]['bytes'], 0)
+    
+    def test_generar_reporte_modo_invalido(self):
+        """Verifica que un modo desconocido se rechaza."""
+        with self.assertRaises(ValueError):
+            generar_reporte(self.clientes, self.archivo_reporte, modo="otro")
+    
+    def test_generar_reporte_paralelo_identico(self):
+        """Verifica que el reporte armado en procesos es identico byte a byte al secuencial."""
+        clientes = self.clientes * 40
+        salidas = []
+        with patch('modulos.archivos.obtener_timestamp', return_value="2026-01-01 00:00:00"), \
+                patch('modulos.archivos.MIN_CLIENTES_PARALELO', 1), \
+                patch('modulos.archivos.nucleos_disponibles', return_value=3), \
+                patch('modulos.archivos.CLIENTES_POR_BLOQUE', 7):
+            for procesos in (1, 3):
+                archivo = os.path.join(self.temp_dir, f"reporte_{procesos}.txt")
+                generar_reporte(clientes, archivo, procesos=procesos)
+                with open(archivo, 'rb') as f:
+                    salidas.append(f.read())
+        
+        self.assertEqual(salidas[0], salidas[1])
+        self.assertIn(b"120. Pedro L", salidas[1])
+    
+    def test_generar_reporte_paralelo_solo_desde_hilo_principal(self):
+        """Verifica que no se crea el pool con un solo núcleo ni desde otro hilo."""
+        archivo = os.path.join(self.temp_dir, "reporte.txt")
+        with patch('modulos.archivos.MIN_CLIENTES_PARALELO', 1), \
+                patch('modulos.archivos._renderizar_en_paralelo') as paralelo:
+            with patch('modulos.archivos.nucleos_disponibles', return_value=1):
+                generar_reporte(self.clientes, archivo, procesos=4)
+            
+            with patch('modulos.archivos.nucleos_disponibles', return_value=4):
+                hilo = threading.Thread(target=generar_reporte, args=(self.clientes, archivo),
+                                        kwargs={'procesos': 4})
+                hilo.start()
+                hilo.join(5)
+        
+        paralelo.assert_not_called()
+        with open(archivo, 'r', encoding='utf-8') as f:
+            self.assertIn("3. Pedro López", f.read())
+    
+    # --- Tests de facturacion ---
+    def test_extraer_facturas_agrupa_por_rut(self):
+        """Verifica la extraccion de facturas agrupadas por RUT en varios archivos."""
+        corporativos = [
+            ClienteCorporativo(f"Contacto {chr(65 + i)}", f"c{i}@empresa{i % 3}.com", "955555555",
+                            "Av. Industrial 789", f"Empresa {chr(65 + i % 3)}", f"7{i % 3}.345.678-9")
+            for i in range(9)
+        ]
+        directorio = os.path.join(self.temp_dir, "facturas")
+        manifiesto = extraer_facturas(corporativos, directorio, num_particiones=2)
+        
+        self.assertEqual((manifiesto["total_registros"], manifiesto["total_contactos"]), (3, 9))
+        registros = []
+        for particion in manifiesto["particiones"]:
+            with open(os.path.join(directorio, particion["archivo"]), 'rb') as f:
+                datos = f.read()
+            self.assertEqual(hashlib.sha256(datos).hexdigest(), particion["sha256"])
+            registros += list(csv.DictReader(StringIO(datos.decode('utf-8'))))
+        
+        por_rut = {r['rut_empresa']: r for r in registros}
+        self.assertEqual(sorted(por_rut), ["70.345.678-9", "71.345.678-9", "72.345.678-9"])
+        self.assertEqual(por_rut["70.345.678-9"]['contactos'], "3")
+        self.assertEqual(por_rut["70.345.678-9"]['contacto'], "Contacto A")
+        self.assertEqual(por_rut["70.345.678-9"]['emails'], "c0@empresa0.com;c3@empresa0.com;c6@empresa0.com")
+        
+        manifiesto = extraer_facturas(corporativos, directorio, formato="jsonl", num_particiones=1)
+        with open(os.path.join(directorio, "facturas_000.jsonl"), 'r', encoding='utf-8') as f:
+            lineas = [json.loads(linea) for linea in f]
+        self.assertEqual(len(lineas), 3)
+        self.assertEqual(lineas[1]["nombre_empresa"], "Empresa B")
+        self.assertEqual(lineas[1]["contactos"], 3)
+        # Los CSV de la extraccion anterior no quedan junto al manifiesto nuevo
+        self.assertEqual(sorted(f for f in os.listdir(directorio) if f.startswith("facturas_")),
+                        ["facturas_000.jsonl"])
+    
+    # --- Tests de historial de estadisticas ---
+    def test_historial_consulta_por_rango(self):
+        """Verifica registros fijos y la consulta por rango de fechas."""
+        archivo = os.path.join(self.temp_dir, "estadisticas.bin")
+        for dia in range(1, 11):
+            agregar_instantanea({'total': dia, 'premium': dia * 2, 'puntos': dia * 100}, archivo,
+                                fecha=f"2026-03-{dia:02d}T12:00:00")
+        encabezado = len(MAGIA) + 2 + len(",".join(columnas_tipos()))
+        self.assertEqual(os.path.getsize(archivo), encabezado + 10 * estructura_registro(columnas_tipos()).size)
+        
+        registros = consultar_historial("2026-03-04T12:00:00", "2026-03-06T23:59:59", archivo)
+        self.assertEqual([r['total'] for r in registros], [4, 5, 6])
+        self.assertEqual((registros[0]['premium'], registros[0]['puntos'], registros[0]['regular']), (8, 400, 0))
+        self.assertEqual(registros[0]['fecha'].day, 4)
+        self.assertEqual(len(consultar_historial(archivo=archivo)), 10)
+        self.assertEqual(consultar_historial("2026-04-01", archivo=archivo), [])
+        
+        # Una fecha anterior a la ultima se ajusta para mantener el orden
+        registro = agregar_instantanea({'total': 11}, archivo, fecha="2026-01-01T00:00:00")
+        self.assertEqual(registro['fecha'].day, 10)
+    
+    def test_historial_registro_incompleto_y_formato(self):
+        """Verifica que un registro a medio escribir se ignora y que se valida el formato."""
+        archivo = os.path.join(self.temp_dir, "estadisticas.bin")
+        agregar_instantanea({'total': 1}, archivo, fecha="2026-03-01T00:00:00")
+        with open(archivo, 'ab') as f:
+            f.write(b"\x00" * 5)
+        self.assertEqual(len(consultar_historial(archivo=archivo)), 1)
+        agregar_instantanea({'total': 2}, archivo, fecha="2026-03-02T00:00:00")
+        self.assertEqual([r['total'] for r in consultar_historial(archivo=archivo)], [1, 2])
+        
+        with open(self.archivo_csv, 'w') as f:
+            f.write("no es un historial")
+        with self.assertRaises(FormatoArchivoError):
+            consultar_historial(archivo=self.archivo_csv)
+    
+    def test_historial_tipo_registrado_despues(self):
+        """Verifica que un tipo registrado despues de crear el historial se agrega como columna."""
+        archivo = os.path.join(self.temp_dir, "estadisticas.bin")
+        agregar_instantanea({'total': 1, 'regular': 1}, archivo, fecha="2026-03-01T00:00:00")
+        
+        with patch.dict(registro_tipos._TIPOS), patch.dict(registro_tipos._POR_CLASE):
+            @registro_tipos.registrar_tipo_cliente
+            class ClienteEmbajador(Cliente):
+                TIPO_CLIENTE = "Embajador"
+                
+                def obtener_tipo(self) -> str:
+                    return self.TIPO_CLIENTE
+            
+            gestor = GestorClientes()
+            with patch('modulos.gestor_clientes.registrar_alta_cliente'):
+                gestor.agregar_cliente(ClienteEmbajador("Eva Soto", "eva@mail.com", "912345678",
+                                                        "Calle Uno 111"), silencioso=True)
+            estadisticas = gestor.estadisticas_actuales()
+            self.assertEqual((estadisticas['total'], estadisticas['embajador']), (1, 1))
+            agregar_instantanea(estadisticas, archivo, fecha="2026-03-02T00:00:00")
+        
+        registros = consultar_historial(archivo=archivo)
+        self.assertEqual([(r['regular'], r['embajador']) for r in registros], [(1, 0), (0, 1)])
+    
+    def test_historial_formato_anterior(self):
+        """Verifica que un historial con columnas fijas se lee y se convierte al agregar."""
+        archivo = os.path.join(self.temp_dir, "estadisticas.bin")
+        with open(archivo, 'wb') as f:
+            f.write(MAGIA_V1 + struct.pack("<dQQQQq", 1772334000.0, 3, 1, 1, 1, 50))
+        self.assertEqual(consultar_historial(archivo=archivo)[0]['premium'], 1)
+        
+        agregar_instantanea({'total': 4, 'premium': 2, 'puntos': 60}, archivo, fecha="2026-03-02T00:00:00")
+        with open(archivo, 'rb') as f:
+            self.assertEqual(f.read(len(MAGIA)), MAGIA)
+        self.assertEqual([(r['total'], r['premium'], r['puntos']) for r in consultar_historial(archivo=archivo)],
+                        [(3, 1, 50), (4, 2, 60)])
+    
+    # --- Tests de reporte analitico ---
+    def test_sketch_cuantiles_error_relativo(self):
+        """Verifica que los percentiles estimados quedan dentro del error relativo con memoria acotada."""
+        valores = [(i * 7919) % 100000 for i in range(50000)]
+        sketch = SketchCuantiles(0.01)
+        for valor in valores:
+            sketch.agregar(valor)
+        
+        valores.sort()
+        for q in (0.1, 0.5, 0.9, 0.99):
+            with self.subTest(q=q):
+                exacto = valores[int(q * (len(valores) - 1))]
+                self.assertAlmostEqual(sketch.cuantil(q), exacto, delta=exacto * 0.01 + 1)
+        self.assertLess(sketch.cantidad_cubetas, 1200)
+        self.assertEqual((sketch.minimo, sketch.maximo, sketch.total), (valores[0], valores[-1], 50000))
+        
+        acotado = SketchCuantiles(0.01, max_cubetas=10)
+        for valor in valores:
+            acotado.agregar(valor)
+        self.assertLessEqual(acotado.cantidad_cubetas, 11)
+        self.assertAlmostEqual(acotado.cuantil(0.99), valores[int(0.99 * (len(valores) - 1))], delta=1000)
+    
+    def test_sketch_cuantiles_negativos(self):
+        """Verifica que los valores negativos se estiman en su propio rango de cubetas."""
+        valores = list(range(-500, 1500))
+        sketch = SketchCuantiles(0.01)
+        for valor in valores:
+            sketch.agregar(valor)
+        
+        for q in (0.05, 0.2, 0.25, 0.5, 0.95):
+            with self.subTest(q=q):
+                exacto = valores[int(q * (len(valores) - 1))]
+                self.assertAlmostEqual(sketch.cuantil(q), exacto, delta=abs(exacto) * 0.01 + 1)
+        self.assertEqual((sketch.negativos, sketch.minimo), (500, -500))
+    
+    def test_reporte_analitico_con_puntos_negativos(self):
+        """Verifica que un cliente Premium con puntos negativos no impide el reporte."""
+        with open(self.archivo_csv, 'w', encoding='utf-8') as f:
+            f.write("tipo,nombre,email,telefono,direccion,puntos,empresa,rut\n")
+            f.write("Premium,Eva Soto,eva@mail.com,912345678,Av. Sur 456,-5,,\n")
+        self.clientes += importar_clientes_csv(self.archivo_csv)
+        
+        archivo = os.path.join(self.temp_dir, "analitica.txt")
+        analitica = generar_reporte_analitico(self.clientes, archivo)
+        
+        self.assertEqual(analitica["puntos"]["negativos"], 1)
+        self.assertEqual(analitica["puntos"]["minimo"], -5)
+        self.assertEqual(analitica["puntos"]["histograma"][0], ("negativos", 1))
+        with open(archivo, 'r', encoding='utf-8') as f:
+            self.assertIn("Clientes con puntos negativos: 1", f.read())
+    
+    def test_calcular_analitica_una_pasada(self):
+        """Verifica la analitica recorriendo un iterador una sola vez."""
+        self.clientes.append(ClienteCorporativo("Luis Soto", "luis@empresa.com", "955555556",
+                                                "Av. Costanera 10, viña del mar", "MiEmpresa S.A.", "12.345.678-9"))
+        analitica = calcular_analitica(iter(self.clientes), top=1)
+        
+        self.assertEqual(analitica["total"], 4)
+        self.assertEqual(analitica["puntos"]["clientes"], 1)
+        self.assertEqual(analitica["puntos"]["percentiles"][50], 100)
+        self.assertEqual(analitica["puntos"]["histograma"], [("100-999", 1)])
+        self.assertEqual(analitica["empresas"]["ranking"], [("MiEmpresa S.A.", 2)])
+        self.assertEqual(analitica["dominios"]["distintos"], 2)
+        self.assertEqual(analitica["dominios"]["ranking"], [("mail.com", 2)])
+        self.assertEqual(analitica["ciudades"]["ranking"], [("(sin ciudad)", 3)])
+    
+    def test_generar_reporte_analitico(self):
+        """Verifica el contenido del reporte analitico."""
+        archivo = os.path.join(self.temp_dir, "analitica.txt")
+        generar_reporte_analitico(self.clientes, archivo)
+        
+        with open(archivo, 'r', encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertIn("PUNTOS DE CLIENTES PREMIUM", contenido)
+        self.assertIn("MiEmpresa S.A.", contenido)
+        self.assertIn("empresa.com", contenido)
+    
+    # --- Tests de archivos comprimidos ---
+    def test_exportar_importar_csv_gzip(self):
+        """Verifica exportación e importación transparente de CSV comprimido con gzip."""
+        archivo_gz = os.path.join(self.temp_dir, "clientes.csv.gz")
+        exportar_clientes_csv(self.clientes, archivo_gz, nivel_compresion=1)
+        
+        with gzip.open(archivo_gz, 'rt', encoding='utf-8') as f:
+            self.assertTrue(f.readline().startswith("tipo,nombre,email"))
+        
+        importados = importar_clientes_csv(archivo_gz)
+        self.assertEqual([c.email for c in importados], [c.email for c in self.clientes])
+    
+    def test_exportar_importar_csv_bz2_xz(self):
+        """Verifica que .bz2 y .xz se detectan por extensión."""
+        for extension in (".bz2", ".xz"):
+            with self.subTest(extension=extension):
+                archivo = os.path.join(self.temp_dir, "clientes.csv" + extension)
+                exportar_clientes_csv(self.clientes, archivo, tamano_buffer=4096)
+                importados = importar_clientes_csv(archivo, tamano_buffer=4096)
+                self.assertEqual(len(importados), 3)
+    
+    def test_generar_reporte_comprimido(self):
+        """Verifica generación de reporte comprimido."""
+        archivo_gz = os.path.join(self.temp_dir, "resumen.txt.gz")
+        generar_reporte(self.clientes, archivo_gz)
+        
+        with gzip.open(archivo_gz, 'rt', encoding='utf-8') as f:
+            contenido = f.read()
+        self.assertIn("Total de clientes: 3", contenido)
+    
     # --- Tests de logging ---
     def test_registrar_log(self):
         """Verifica que registrar_log funciona correctamente."""
@@ -1439,6 +2490,117 @@ class TestCasosLimite(unittest.TestCase):
         self.assertTrue(issubclass(FormatoArchivoError, ArchivoError))
 
 
+# ============================================================================
+# SECCIÓN 11: TESTS DE INGESTA DE DIRECTORIO
+# ============================================================================
+class TestIngesta(unittest.TestCase):
+    """Tests para la importación incremental desde un directorio vigilado."""
+    
+    ENCABEZADO = "tipo,nombre,email,telefono,direccion,puntos,empresa,rut\n"
+    
+    def setUp(self):
+        """Configuración inicial: directorio vigilado temporal."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.procesados = os.path.join(self.temp_dir, "procesados")
+        self.archivo = os.path.join(self.temp_dir, "socio.csv")
+        self.almacen = os.path.join(self.temp_dir, "clientes.csv")
+        self.gestor = GestorClientes()
+    
+    def tearDown(self):
+        """Limpieza: eliminar directorio temporal."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def crear_ingestor(self, gestor=None):
+        return IngestorDirectorio(gestor or self.gestor, self.temp_dir, self.procesados, intervalo=0,
+                                archivo_clientes=self.almacen)
+    
+    def test_buscar_limite_registro_respeta_comillas(self):
+        """Verifica que un salto de línea dentro de comillas no cierra el registro."""
+        datos = b'a,"Calle 1,\nIquique"\nb,"Calle 2'
+        self.assertEqual(buscar_limite_registro(datos), datos.index(b'"\nb') + 2)
+        self.assertEqual(buscar_limite_registro(b'a,"abierto\n'), 0)
+    
+    def test_ingesta_incremental_archivo_que_crece(self):
+        """Verifica que solo se importan las filas nuevas de un archivo que crece."""
+        with open(self.archivo, 'w', encoding='utf-8') as f:
+            f.write(self.ENCABEZADO)
+            f.write('Regular,Juan Perez,juan@mail.com,912345678,"Calle Norte 123, Iquique",,,\n')
+            f.write('Regular,Ana Soto,ana@mail.com,9123')  # fila incompleta
+        
+        ingestor = self.crear_ingestor()
+        self.assertEqual(ingestor.procesar_una_vez(), 1)
+        
+        with open(self.archivo, 'a', encoding='utf-8') as f:
+            f.write('45678,"Av. Sur 456, Arica",,,\n')
+        
+        self.assertEqual(ingestor.procesar_una_vez(), 1)
+        self.assertEqual(self.gestor.total_clientes, 2)
+    
+    def test_ingesta_retoma_tras_reinicio_y_archiva(self):
+        """Verifica que el avance persiste entre instancias y el archivo se archiva al terminar."""
+        with open(self.archivo, 'w', encoding='utf-8') as f:
+            f.write(self.ENCABEZADO)
+            f.write('Regular,Juan Perez,juan@mail.com,912345678,Calle Norte 123,,,\n')
+        
+        self.crear_ingestor().procesar_una_vez()
+        
+        # Un nuevo proceso con otro gestor no vuelve a importar la fila ya procesada
+        otro_gestor = GestorClientes()
+        ingestor = self.crear_ingestor(otro_gestor)
+        self.assertEqual(ingestor.procesar_una_vez(), 0)
+        ingestor.procesar_una_vez()
+        
+        self.assertEqual(otro_gestor.total_clientes, 0)
+        self.assertFalse(os.path.exists(self.archivo))
+        self.assertTrue(os.path.exists(os.path.join(self.procesados, "socio.csv")))
+    
+    def test_ingesta_guarda_clientes_antes_del_avance(self):
+        """Verifica que un bloque interrumpido tras guardarse se recorta y se guarda una sola vez."""
+        with open(self.archivo, 'w', encoding='utf-8') as f:
+            f.write(self.ENCABEZADO)
+            f.write('Regular,Juan Perez,juan@mail.com,912345678,Calle Norte 123,,,\n')
+            f.write('Regular,Juan Perez,JUAN@mail.com,912345678,Calle Norte 123,,,\n')
+        
+        # Corte despues de agregar al CSV de clientes y antes de guardar el avance
+        with patch.object(self.gestor, 'incorporar_clientes', side_effect=RuntimeError("corte")):
+            self.assertEqual(self.crear_ingestor().procesar_una_vez(), 0)
+        
+        otro_gestor = GestorClientes()
+        self.assertEqual(self.crear_ingestor(otro_gestor).procesar_una_vez(), 1)
+        self.assertEqual(otro_gestor.total_clientes, 1)
+        self.assertEqual([c.email for c in importar_clientes_csv(self.almacen)], ["juan@mail.com"])
+    
+    def test_ingesta_no_repite_clientes_del_almacen(self):
+        """Verifica que tras un reinicio no se vuelven a guardar emails que ya están en el CSV de clientes."""
+        with open(self.archivo, 'w', encoding='utf-8') as f:
+            f.write(self.ENCABEZADO)
+            f.write('Regular,Juan Perez,juan@mail.com,912345678,Calle Norte 123,,,\n')
+        self.crear_ingestor().procesar_una_vez()
+        
+        otro = os.path.join(self.temp_dir, "otro_socio.csv")
+        with open(otro, 'w', encoding='utf-8') as f:
+            f.write(self.ENCABEZADO)
+            f.write('Regular,Juan Perez,JUAN@mail.com,912345678,Calle Norte 123,,,\n')
+            f.write('Premium,Ana Garcia,ana@mail.com,912345678,Av. Sur 456,10,,\n')
+        
+        # Un nuevo proceso con el gestor vacio
+        otro_gestor = GestorClientes()
+        self.assertEqual(self.crear_ingestor(otro_gestor).procesar_una_vez(), 1)
+        self.assertEqual([c.email for c in importar_clientes_csv(self.almacen)],
+                        ["juan@mail.com", "ana@mail.com"])
+    
+    def test_ingesta_excluye_csv_de_importacion_manual(self):
+        """Verifica que el CSV de clientes y el de importación manual no se ingieren."""
+        entrada_manual = os.path.join(self.temp_dir, "clientes_entrada.csv")
+        for ruta in (self.archivo, self.almacen, entrada_manual):
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write(self.ENCABEZADO)
+        
+        with patch('modulos.ingesta.ARCHIVO_ENTRADA', entrada_manual):
+            nombres = [entrada.name for entrada in self.crear_ingestor().archivos_pendientes()]
+        self.assertEqual(nombres, ["socio.csv"])
+
+
 # ============================================================================
 # EJECUTOR DE TESTS
 # ============================================================================
@@ -1461,6 +2623,7 @@ if __name__ == "__main__":
     suite.addTests(loader.loadTestsFromTestCase(TestArchivos))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegracion))
     suite.addTests(loader.loadTestsFromTestCase(TestCasosLimite))
+    suite.addTests(loader.loadTestsFromTestCase(TestIngesta))
     
     # Ejecutar tests
     runner = unittest.TextTestRunner(verbosity=verbosity)